@@ -56,6 +56,36 @@ from app.services.adapters import (
 class Container:
     """Resolves application services. Single place to swap implementations if needed."""
 
+    # Lazily-built services only; subclasses must declare their own __slots__.
+    __slots__ = (
+        "_trainer",
+        "_train_model_uc",
+        "_export_model_uc",
+        "_validate_model_uc",
+        "_start_detection_uc",
+        "_stop_detection_uc",
+        "_export_integrations_cfg_uc",
+        "_import_integrations_cfg_uc",
+        "_integrations_cfg_repo",
+        "_event_bus",
+        "_job_runner",
+        "_process_job_runner",
+        "_job_registry",
+        "_detector",
+        "_detector_onnx",
+        "_window_capture",
+        "_dataset_builder",
+        "_capture",
+        "_detection",
+        "_metrics",
+        "_integrations",
+        "_settings_store",
+        "_advisor_store",
+        "_analyze_training_advisor_uc",
+        "_apply_advisor_recommendations_uc",
+        "_is_shutdown",
+    )
+
     def __init__(self) -> None:
         self._trainer: ITrainer | None = None
         self._train_model_uc: TrainModelUseCase | None = None
@@ -30,10 +30,15 @@ def _quality_down(img: np.ndarray) -> np.ndarray:
     return cv2.imdecode(buf, cv2.IMREAD_COLOR)
 
 
+# Per-pixel effects as 256-entry lookup tables: one uint8 pass, no wider temporaries.
+_HUE_SHIFT_LUT = ((np.arange(256) + 25) % 180).astype(np.uint8)  # OpenCV hue is 0..179
+_OVEREXPOSE_LUT = np.clip(np.arange(256) + 60, 0, 255).astype(np.uint8)
+_DARKEN_LUT = np.clip(np.arange(256) - 50, 0, 255).astype(np.uint8)
+
+
 def _color_shift(img: np.ndarray) -> np.ndarray:
-    hsv = cv2.cvtColor(img, cv2.COLOR_BGR2HSV).astype(np.float32)
-    hsv[:, :, 0] = (hsv[:, :, 0] + 25) % 180
-    hsv = np.clip(hsv, 0, 255).astype(np.uint8)
+    hsv = cv2.cvtColor(img, cv2.COLOR_BGR2HSV)
+    hsv[:, :, 0] = _HUE_SHIFT_LUT[hsv[:, :, 0]]
     return cv2.cvtColor(hsv, cv2.COLOR_HSV2BGR)
 
 
@@ -44,11 +49,11 @@ def _resolution_down(img: np.ndarray) -> np.ndarray:
 
 
 def _overexpose(img: np.ndarray) -> np.ndarray:
-    return np.clip(img.astype(np.int32) + 60, 0, 255).astype(np.uint8)
+    return cv2.LUT(img, _OVEREXPOSE_LUT)
 
 
 def _darken(img: np.ndarray) -> np.ndarray:
-    return np.clip(img.astype(np.int32) - 50, 0, 255).astype(np.uint8)
+    return cv2.LUT(img, _DARKEN_LUT)
 
 
 def _desaturate(img: np.ndarray) -> np.ndarray:
@@ -1,5 +1,7 @@
 """Визуализация датасета: загрузка классов, изображения с bbox, фильтр по классам."""
 
+import os
+import random
 from pathlib import Path
 
 try:
@@ -33,20 +35,42 @@ _COLORS = [
 ]
 
 
+_IMAGE_EXTS = (".jpg", ".jpeg", ".png", ".bmp", ".webp")
+
+# data.yaml -> (mtime_ns, имена классов); images dir -> (mtime_ns картинок и меток, списки).
+# Ключ по mtime: изменённый на диске датасет перечитывается сам, без явной инвалидации.
+_CLASSES_CACHE: dict[Path, tuple[int, list[str]]] = {}
+_LISTING_CACHE: dict[Path, tuple[tuple[int, int], list[Path], list[Path]]] = {}
+
+
+def _mtime_ns(path: Path) -> int:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return -1
+
+
 def load_classes_from_dataset(dataset_dir: Path) -> list[str]:
-    """Загружает имена классов из data.yaml датасета."""
+    """Загружает имена классов из data.yaml датасета (кэш до изменения файла)."""
     data_yaml = Path(dataset_dir) / "data.yaml"
-    if not data_yaml.exists():
+    mtime = _mtime_ns(data_yaml)
+    if mtime < 0:
         return []
+    cached = _CLASSES_CACHE.get(data_yaml)
+    if cached is not None and cached[0] == mtime:
+        return list(cached[1])
     with open(data_yaml, encoding="utf-8") as f:
         data = yaml.safe_load(f) or {}
     names = data.get("names")
     if isinstance(names, list):
-        return list(names)
-    if isinstance(names, dict):
-        return [names.get(i, f"class_{i}") for i in sorted(names.keys())]
-    nc = int(data.get("nc", 0))
-    return [f"class_{i}" for i in range(nc)]
+        classes = list(names)
+    elif isinstance(names, dict):
+        classes = [names.get(i, f"class_{i}") for i in sorted(names.keys())]
+    else:
+        nc = int(data.get("nc", 0))
+        classes = [f"class_{i}" for i in range(nc)]
+    _CLASSES_CACHE[data_yaml] = (mtime, classes)
+    return list(classes)
 
 
 def _find_labels_dir(dataset_dir: Path, image_path: Path) -> Path | None:
@@ -86,9 +110,14 @@ def draw_boxes(
     labels_path: Path,
     class_names: list[str],
     only_classes: set[int] | None = None,
+    copy: bool = True,
 ) -> np.ndarray:
-    """Рисует bbox на изображении. img — BGR, метки в формате YOLO (normalized)."""
-    img = img.copy()
+    """Рисует bbox на изображении. img — BGR, метки в формате YOLO (normalized).
+
+    copy=False рисует прямо в img (если вызывающему исходник больше не нужен).
+    """
+    if copy:
+        img = img.copy()
     h, w = img.shape[:2]
     boxes = read_yolo_labels(labels_path, only_classes)
     for cid, xc, yc, bw, bh in boxes:
@@ -109,29 +138,45 @@ def get_sample_image_path(dataset_dir: Path) -> Path | None:
     return paths[0] if paths else None
 
 
+def _list_split_images(imgs_dir: Path, labels_dir: Path) -> tuple[list[Path], list[Path]]:
+    """Картинки папки split: (с метками, без меток). Кэш до изменения любой из двух папок."""
+    key = (_mtime_ns(imgs_dir), _mtime_ns(labels_dir))
+    cached = _LISTING_CACHE.get(imgs_dir)
+    if cached is not None and cached[0] == key:
+        return cached[1], cached[2]
+    try:
+        with os.scandir(labels_dir) as it:
+            names = (e.name.lower() for e in it)
+            label_stems = {n[:-4] for n in names if n.endswith(".txt")}
+    except OSError:
+        label_stems = set()
+    labeled: list[Path] = []
+    unlabeled: list[Path] = []
+    with os.scandir(imgs_dir) as it:
+        for e in it:
+            # Регистр не важен (IMG_0001.JPG), как glob на Windows и suffix.lower() в сервисах.
+            if e.name.lower().endswith(_IMAGE_EXTS) and e.is_file():
+                p = imgs_dir / e.name
+                (labeled if p.stem.lower() in label_stems else unlabeled).append(p)
+    _LISTING_CACHE[imgs_dir] = (key, labeled, unlabeled)
+    return labeled, unlabeled
+
+
 def get_sample_image_paths(dataset_dir: Path, n: int = 6) -> list[Path]:
     """Возвращает до n путей к изображениям из train/valid (с приоритетом наличия меток)."""
-    import random
-
     out: list[Path] = []
     for split in ("train", "valid", "val"):
         imgs_dir = dataset_dir / split / "images"
         labels_dir = dataset_dir / split / "labels"
         if not imgs_dir.is_dir():
             continue
-        candidates: list[Path] = []
-        for ext in (".jpg", ".jpeg", ".png", ".bmp", ".webp"):
-            for p in imgs_dir.glob(f"*{ext}"):
-                if labels_dir.is_dir() and (labels_dir / (p.stem + ".txt")).exists():
-                    candidates.insert(0, p)
-                else:
-                    candidates.append(p)
-        random.shuffle(candidates)
-        for p in candidates:
-            if p not in out:
-                out.append(p)
-                if len(out) >= n:
-                    return out
+        labeled, unlabeled = _list_split_images(imgs_dir, labels_dir)
+        # Выборка индексов: O(n) вместо копирования и перемешивания всего списка split.
+        total = len(labeled) + len(unlabeled)
+        for i in random.sample(range(total), max(0, min(n - len(out), total))):
+            out.append(labeled[i] if i < len(labeled) else unlabeled[i - len(labeled)])
+        if len(out) >= n:
+            return out
     return out
 
 
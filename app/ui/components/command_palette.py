@@ -4,19 +4,19 @@ Command palette: Ctrl+K overlay to run actions by name (switch tab, theme, etc.)
 
 from __future__ import annotations
 
-from collections.abc import Callable
+from collections.abc import Callable, Sequence
 
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QKeyEvent
 from PySide6.QtWidgets import (
     QDialog,
+    QLabel,
     QLineEdit,
     QListWidget,
-    QListWidgetItem,
     QVBoxLayout,
 )
 
-from app.ui.theme.tokens import Tokens
+from app.ui.theme.tokens import TokenSet, cached_style
 
 
 class CommandItem:
@@ -26,25 +26,59 @@ class CommandItem:
         self.keywords = (title + " " + keywords).strip().lower()
 
 
-def _default_commands() -> list[CommandItem]:
-    return [
-        CommandItem("tab_training", "Перейти: Обучение", "training"),
-        CommandItem("tab_detection", "Перейти: Детекция", "detection"),
-        CommandItem("tab_datasets", "Перейти: Датасеты", "datasets"),
-        CommandItem("tab_validation", "Перейти: Валидация", "validation"),
-        CommandItem("tab_segmentation", "Перейти: Сегментация", "segmentation"),
-        CommandItem("tab_pose", "Перейти: Поза", "pose"),
-        CommandItem("tab_classification", "Перейти: Классификация", "classification"),
-        CommandItem("tab_tracking", "Перейти: Трекинг", "tracking"),
-        CommandItem("tab_autoannotation", "Перейти: Аннотация", "annotation auto"),
-        CommandItem("tab_benchmark", "Перейти: Бенчмарк", "benchmark"),
-        CommandItem("tab_experiments", "Перейти: Эксперименты", "experiments"),
-        CommandItem("tab_integrations", "Перейти: Интеграции", "integrations"),
-        CommandItem("tab_jobs", "Перейти: Задачи", "jobs background"),
-        CommandItem("tab_docs", "Перейти: Документация", "docs documentation"),
-        CommandItem("theme_light", "Тема: Светлая", "light"),
-        CommandItem("theme_dark", "Тема: Тёмная", "dark"),
-    ]
+_DEFAULT_COMMANDS: tuple[CommandItem, ...] = (
+    CommandItem("tab_training", "Перейти: Обучение", "training"),
+    CommandItem("tab_detection", "Перейти: Детекция", "detection"),
+    CommandItem("tab_datasets", "Перейти: Датасеты", "datasets"),
+    CommandItem("tab_validation", "Перейти: Валидация", "validation"),
+    CommandItem("tab_segmentation", "Перейти: Сегментация", "segmentation"),
+    CommandItem("tab_pose", "Перейти: Поза", "pose"),
+    CommandItem("tab_classification", "Перейти: Классификация", "classification"),
+    CommandItem("tab_tracking", "Перейти: Трекинг", "tracking"),
+    CommandItem("tab_autoannotation", "Перейти: Аннотация", "annotation auto"),
+    CommandItem("tab_benchmark", "Перейти: Бенчмарк", "benchmark"),
+    CommandItem("tab_experiments", "Перейти: Эксперименты", "experiments"),
+    CommandItem("tab_integrations", "Перейти: Интеграции", "integrations"),
+    CommandItem("tab_jobs", "Перейти: Задачи", "jobs background"),
+    CommandItem("tab_docs", "Перейти: Документация", "docs documentation"),
+    CommandItem("theme_light", "Тема: Светлая", "light"),
+    CommandItem("theme_dark", "Тема: Тёмная", "dark"),
+)
+
+# Max rows shown in the palette; filling the list dominates keypress latency.
+MAX_VISIBLE_RESULTS = 30
+
+_RUN_ID_TO_TAB: dict[str, str] = {
+    "tab_training": "training",
+    "tab_detection": "detection",
+    "tab_datasets": "datasets",
+    "tab_validation": "validation",
+    "tab_segmentation": "segmentation",
+    "tab_pose": "pose",
+    "tab_classification": "classification",
+    "tab_tracking": "tracking",
+    "tab_autoannotation": "autoannotation",
+    "tab_benchmark": "benchmark",
+    "tab_experiments": "experiments",
+    "tab_integrations": "integrations",
+    "tab_jobs": "jobs",
+    "tab_docs": "docs",
+}
+
+
+def _palette_style(t: TokenSet) -> str:
+    return f"""
+        QDialog {{ background: {t.surface}; border: 1px solid {t.border};
+                   border-radius: {t.radius_md}px; }}
+        QLineEdit {{ background: {t.surface_hover}; color: {t.text_primary};
+                     border: none; border-radius: {t.radius_sm}px;
+                     padding: 10px 12px; font-size: 14px; }}
+        QListWidget {{ background: {t.surface}; color: {t.text_primary};
+                       border: none; outline: none; }}
+        QListWidget::item {{ padding: 8px 12px; }}
+        QListWidget::item:selected {{ background: {t.primary}; color: white; }}
+        QListWidget::item:hover {{ background: {t.surface_hover}; }}
+        """
 
 
 class CommandPalette(QDialog):
@@ -52,8 +86,8 @@ class CommandPalette(QDialog):
 
     def __init__(self, parent: QDialog | None = None) -> None:
         super().__init__(parent)
-        self._commands = _default_commands()
-        self._filtered: list[CommandItem] = []
+        self._commands = _DEFAULT_COMMANDS
+        self._filtered: Sequence[CommandItem] = ()
         self._on_run: Callable[[str], None] = lambda _id: None  # set by MainWindow
         self.setWindowTitle("Команды")
         self.setModal(True)
@@ -63,21 +97,7 @@ class CommandPalette(QDialog):
             | Qt.WindowType.WindowStaysOnTopHint
         )
         self.setMinimumSize(400, 200)
-        t = Tokens
-        self.setStyleSheet(
-            f"""
-            QDialog {{ background: {t.surface}; border: 1px solid {t.border};
-                       border-radius: {t.radius_md}px; }}
-            QLineEdit {{ background: {t.surface_hover}; color: {t.text_primary};
-                         border: none; border-radius: {t.radius_sm}px;
-                         padding: 10px 12px; font-size: 14px; }}
-            QListWidget {{ background: {t.surface}; color: {t.text_primary};
-                           border: none; outline: none; }}
-            QListWidget::item {{ padding: 8px 12px; }}
-            QListWidget::item:selected {{ background: {t.primary}; color: white; }}
-            QListWidget::item:hover {{ background: {t.surface_hover}; }}
-            """
-        )
+        self.setStyleSheet(cached_style("command_palette", _palette_style))
         layout = QVBoxLayout(self)
         layout.setContentsMargins(12, 12, 12, 12)
         layout.setSpacing(8)
@@ -89,9 +109,13 @@ class CommandPalette(QDialog):
         self._list = QListWidget()
         self._list.setMinimumWidth(360)
         self._list.setMaximumHeight(280)
+        self._list.setUniformItemSizes(True)
         self._list.itemDoubleClicked.connect(lambda item: self._run_at_index(self._list.row(item)))
         self._list.currentRowChanged.connect(self._on_row_changed)
         layout.addWidget(self._list)
+        self._more_label = QLabel("… ещё результаты скрыты, уточните запрос")
+        self._more_label.setVisible(False)
+        layout.addWidget(self._more_label)
         self._apply_filter("")
         self._list.setCurrentRow(0)
 
@@ -101,13 +125,30 @@ class CommandPalette(QDialog):
 
     def _apply_filter(self, text: str) -> None:
         q = text.strip().lower()
+        limit = MAX_VISIBLE_RESULTS
         if not q:
-            self._filtered = list(self._commands)
+            # Immutable tuple: a full-range slice returns the same object, no copy.
+            self._filtered = self._commands[:limit]
+            truncated = len(self._commands) > limit
         else:
-            self._filtered = [c for c in self._commands if q in c.keywords]
-        self._list.clear()
-        for c in self._filtered:
-            self._list.addItem(QListWidgetItem(c.title))
+            hits: list[CommandItem] = []
+            truncated = False
+            for c in self._commands:
+                if q in c.keywords:
+                    if len(hits) == limit:
+                        truncated = True
+                        break
+                    hits.append(c)
+            self._filtered = hits
+        self._more_label.setVisible(truncated)
+        self._list.setUpdatesEnabled(False)
+        self._list.blockSignals(True)
+        try:
+            self._list.clear()
+            self._list.addItems([c.title for c in self._filtered])
+        finally:
+            self._list.blockSignals(False)
+            self._list.setUpdatesEnabled(True)
         if self._filtered:
             self._list.setCurrentRow(0)
 
@@ -150,23 +191,7 @@ class CommandPalette(QDialog):
     @staticmethod
     def run_id_to_tab(id_: str) -> str | None:
         """Map command id to TAB_IDS entry, or None."""
-        m = {
-            "tab_training": "training",
-            "tab_detection": "detection",
-            "tab_datasets": "datasets",
-            "tab_validation": "validation",
-            "tab_segmentation": "segmentation",
-            "tab_pose": "pose",
-            "tab_classification": "classification",
-            "tab_tracking": "tracking",
-            "tab_autoannotation": "autoannotation",
-            "tab_benchmark": "benchmark",
-            "tab_experiments": "experiments",
-            "tab_integrations": "integrations",
-            "tab_jobs": "jobs",
-            "tab_docs": "docs",
-        }
-        return m.get(id_)
+        return _RUN_ID_TO_TAB.get(id_)
 
 
 def run_id_to_tab(id_: str) -> str | None:
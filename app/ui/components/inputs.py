@@ -9,7 +9,7 @@ from PySide6.QtCore import Signal
 from PySide6.QtGui import QWheelEvent
 from PySide6.QtWidgets import QSlider, QSpinBox, QWidget
 
-from app.ui.theme.tokens import Tokens
+from app.ui.theme.tokens import TokenSet, cached_style
 
 
 class NoWheelSpinBox(QSpinBox):
@@ -26,6 +26,29 @@ class NoWheelSlider(QSlider):
         event.ignore()
 
 
+def _spinbox_style(t: TokenSet) -> str:
+    return f"""
+        QSpinBox {{
+            background-color: {t.surface};
+            color: {t.text_primary};
+            border: {t.border_width}px solid {t.border};
+            border-radius: {t.radius_sm}px;
+            padding: {t.space_xs}px {t.space_sm}px;
+            min-width: 80px;
+        }}
+        QSpinBox:hover {{
+            border-color: {t.text_secondary};
+        }}
+        QSpinBox:focus {{
+            border-color: {t.primary};
+        }}
+        QSpinBox:disabled {{
+            background-color: {t.surface_hover};
+            color: {t.text_secondary};
+        }}
+        """
+
+
 class ValidatedSpinBox(NoWheelSpinBox):
     """SpinBox with theme styling, optional tooltip and validation range."""
 
@@ -40,34 +63,12 @@ class ValidatedSpinBox(NoWheelSpinBox):
         tooltip: str = "",
     ) -> None:
         super().__init__(parent)
-        t = Tokens
         self.setRange(min_val, max_val)
         self.setValue(default)
         if tooltip:
             self.setToolTip(tooltip)
         self.setMinimumHeight(32)
-        self.setStyleSheet(
-            f"""
-            QSpinBox {{
-                background-color: {t.surface};
-                color: {t.text_primary};
-                border: {t.border_width}px solid {t.border};
-                border-radius: {t.radius_sm}px;
-                padding: {t.space_xs}px {t.space_sm}px;
-                min-width: 80px;
-            }}
-            QSpinBox:hover {{
-                border-color: {t.text_secondary};
-            }}
-            QSpinBox:focus {{
-                border-color: {t.primary};
-            }}
-            QSpinBox:disabled {{
-                background-color: {t.surface_hover};
-                color: {t.text_secondary};
-            }}
-            """
-        )
+        self.setStyleSheet(cached_style("validated_spinbox", _spinbox_style))
         self.valueChanged.connect(self._emit_int)
 
     def _emit_int(self, value: int) -> None:
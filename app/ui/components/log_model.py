@@ -4,6 +4,7 @@ Log list model: QAbstractListModel with level + text, max buffer, thread-safe ap
 
 from __future__ import annotations
 
+import re
 from collections import deque
 from typing import Any
 
@@ -14,15 +15,21 @@ LOG_LEVEL_WARNING = "warning"
 LOG_LEVEL_ERROR = "error"
 
 LEVELS = (LOG_LEVEL_INFO, LOG_LEVEL_WARNING, LOG_LEVEL_ERROR)
+# Compact per-row level codes: index into LEVELS. Unknown levels map to info.
+LEVEL_CODES = {level: code for code, level in enumerate(LEVELS)}
 
 MAX_LOG_LINES = 100_000
 
 
+# Case-insensitive search without allocating a lowercased copy of every line.
+_ERROR_RE = re.compile(r"error|exception|traceback", re.IGNORECASE)
+_WARNING_RE = re.compile(r"warn", re.IGNORECASE)
+
+
 def _infer_level(line: str) -> str:
-    lower = line.lower()
-    if "error" in lower or "exception" in lower or "traceback" in lower:
+    if _ERROR_RE.search(line):
         return LOG_LEVEL_ERROR
-    if "warn" in lower or "warning" in lower:
+    if _WARNING_RE.search(line):
         return LOG_LEVEL_WARNING
     return LOG_LEVEL_INFO
 
@@ -33,6 +40,9 @@ class LogListModel(QAbstractListModel):
     def __init__(self, parent: Any = None) -> None:
         super().__init__(parent)
         self._entries: deque[tuple[str, str]] = deque(maxlen=MAX_LOG_LINES)
+        # Parallel to _entries, one byte per row (LEVEL_CODES): O(1) indexed access
+        # and a dense buffer for the filter proxy (deque indexing walks from the ends).
+        self._levels = bytearray()
 
     def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
         if parent.isValid():
@@ -59,12 +69,15 @@ class LogListModel(QAbstractListModel):
         """Append one line. Level inferred from content if not given."""
         if level is None:
             level = _infer_level(line)
-        was_full = len(self._entries) == self._entries.maxlen
-        self._entries.append((level, line))
-        if was_full:
+        if len(self._entries) == self._entries.maxlen:
             self.beginRemoveRows(QModelIndex(), 0, 0)
+            self._entries.popleft()
+            del self._levels[0]
             self.endRemoveRows()
-        self.beginInsertRows(QModelIndex(), len(self._entries) - 1, len(self._entries) - 1)
+        row = len(self._entries)
+        self.beginInsertRows(QModelIndex(), row, row)
+        self._entries.append((level, line))
+        self._levels.append(LEVEL_CODES.get(level, 0))
         self.endInsertRows()
 
     def append_batch(self, lines: list[tuple[str, str | None]]) -> None:
@@ -76,25 +89,34 @@ class LogListModel(QAbstractListModel):
             (lvl if lvl is not None else _infer_level(line), line) for line, lvl in lines
         ]
         # deque.maxlen is Optional[int]; None means unbounded.
-        if maxlen is None or len(self._entries) + len(new_entries) <= maxlen:
-            start = len(self._entries)
-            self._entries.extend(new_entries)
-            self.beginInsertRows(QModelIndex(), start, len(self._entries) - 1)
-            self.endInsertRows()
-        else:
-            combined = list(self._entries) + new_entries
-            if maxlen is not None and len(combined) > maxlen:
-                combined = combined[-maxlen:]
-            self.beginResetModel()
-            self._entries = deque(combined, maxlen=maxlen)
-            self.endResetModel()
+        if maxlen is not None:
+            new_entries = new_entries[-maxlen:]
+            overflow = len(self._entries) + len(new_entries) - maxlen
+            if overflow > 0:
+                # Drop the oldest rows first so views/proxies update incrementally
+                # instead of being reset (and fully re-filtered) on every burst.
+                self.beginRemoveRows(QModelIndex(), 0, overflow - 1)
+                for _ in range(overflow):
+                    self._entries.popleft()
+                del self._levels[:overflow]
+                self.endRemoveRows()
+        start = len(self._entries)
+        self.beginInsertRows(QModelIndex(), start, start + len(new_entries) - 1)
+        self._entries.extend(new_entries)
+        self._levels.extend(LEVEL_CODES.get(lvl, 0) for lvl, _ in new_entries)
+        self.endInsertRows()
 
     def clear(self) -> None:
         self.beginResetModel()
         self._entries.clear()
+        self._levels.clear()
         self.endResetModel()
 
     def level_at(self, row: int) -> str:
-        if 0 <= row < len(self._entries):
-            return self._entries[row][0]
-        return LOG_LEVEL_INFO
+        return LEVELS[self.level_code_at(row)]
+
+    def level_code_at(self, row: int) -> int:
+        """Level of row as an index into LEVELS (0 = info for out-of-range rows)."""
+        if 0 <= row < len(self._levels):
+            return self._levels[row]
+        return 0
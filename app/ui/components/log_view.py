@@ -4,23 +4,26 @@ Log view: QListView + filter by level, smart auto-scroll, batched updates.
 
 from __future__ import annotations
 
-from PySide6.QtCore import QSortFilterProxyModel
+from PySide6.QtCore import QModelIndex, QPersistentModelIndex, QSize, QSortFilterProxyModel, Qt
 from PySide6.QtWidgets import (
     QComboBox,
     QHBoxLayout,
     QLabel,
     QListView,
+    QStyledItemDelegate,
+    QStyleOptionViewItem,
     QVBoxLayout,
     QWidget,
 )
 
 from app.ui.components.log_model import (
+    LEVEL_CODES,
     LOG_LEVEL_ERROR,
     LOG_LEVEL_INFO,
     LOG_LEVEL_WARNING,
     LogListModel,
 )
-from app.ui.theme.tokens import Tokens
+from app.ui.theme.tokens import TokenSet, cached_style
 
 FILTER_ALL = "Все"
 FILTER_INFO = "Info"
@@ -28,25 +31,50 @@ FILTER_WARNING = "Warning"
 FILTER_ERROR = "Error"
 
 
+def _list_style(t: TokenSet) -> str:
+    return (
+        f"QListView {{ font-family: Consolas; font-size: 12px; background: {t.surface_hover}; "
+        f"border-radius: {t.radius_sm}px; color: {t.text_primary}; }}"
+    )
+
+
+def _combo_style(t: TokenSet) -> str:
+    return (
+        f"QComboBox {{ background: {t.surface}; color: {t.text_primary}; border: 1px solid {t.border}; "
+        f"border-radius: {t.radius_sm}px; padding: 4px; min-height: 24px; }}"
+    )
+
+
+class _FixedRowDelegate(QStyledItemDelegate):
+    """Constant single-line row height, so the view never measures rows one by one."""
+
+    def sizeHint(
+        self, option: QStyleOptionViewItem, index: QModelIndex | QPersistentModelIndex
+    ) -> QSize:
+        return QSize(option.rect.width(), option.fontMetrics.height() + 4)
+
+
 class LogFilterProxy(QSortFilterProxyModel):
     """Filter by level. Accept rows where level matches the filter."""
 
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
-        self._filter_level: str | None = None  # None = all
+        self._filter_code: int | None = None  # None = all; else index into LEVELS
 
     def set_filter_level(self, level: str | None) -> None:
-        self._filter_level = level
+        if level is None or level == FILTER_ALL:
+            self._filter_code = None
+        else:
+            self._filter_code = LEVEL_CODES.get(level)
         self.invalidateFilter()
 
     def filterAcceptsRow(self, source_row: int, source_parent: object) -> bool:
-        if self._filter_level is None or self._filter_level == FILTER_ALL:
+        if self._filter_code is None:
             return True
         src = self.sourceModel()
         if not isinstance(src, LogListModel):
             return True
-        row_level = src.level_at(source_row)
-        return row_level == self._filter_level
+        return src.level_code_at(source_row) == self._filter_code
 
 
 class LogView(QWidget):
@@ -56,17 +84,18 @@ class LogView(QWidget):
         super().__init__(parent)
         self._model = LogListModel(self)
         self._proxy = LogFilterProxy(self)
-        self._proxy.setSourceModel(self._model)
         self._proxy.setFilterKeyColumn(0)
         self._list = QListView()
-        self._list.setModel(self._proxy)
+        # "All" shows the source model directly; the proxy is only attached while
+        # a level filter is active, so appends skip filterAcceptsRow by default.
+        self._list.setModel(self._model)
+        # Log lines are single-line (elided): with uniform sizes the view derives
+        # every row height from the first one instead of measuring each row.
         self._list.setUniformItemSizes(True)
-        self._list.setWordWrap(True)
-        t = Tokens
-        self._list.setStyleSheet(
-            f"QListView {{ font-family: Consolas; font-size: 12px; background: {t.surface_hover}; "
-            f"border-radius: {t.radius_sm}px; color: {t.text_primary}; }}"
-        )
+        self._list.setWordWrap(False)
+        self._list.setTextElideMode(Qt.TextElideMode.ElideRight)
+        self._list.setItemDelegate(_FixedRowDelegate(self._list))
+        self._list.setStyleSheet(cached_style("log_view.list", _list_style))
         self._list.setEditTriggers(QListView.EditTrigger.NoEditTriggers)
         self._at_bottom = True
         self._list.verticalScrollBar().valueChanged.connect(self._on_scroll)
@@ -78,10 +107,7 @@ class LogView(QWidget):
         filter_row.addWidget(QLabel("Уровень:"))
         self._filter_combo = QComboBox()
         self._filter_combo.addItems([FILTER_ALL, FILTER_INFO, FILTER_WARNING, FILTER_ERROR])
-        self._filter_combo.setStyleSheet(
-            f"QComboBox {{ background: {t.surface}; color: {t.text_primary}; border: 1px solid {t.border}; "
-            f"border-radius: {t.radius_sm}px; padding: 4px; min-height: 24px; }}"
-        )
+        self._filter_combo.setStyleSheet(cached_style("log_view.combo", _combo_style))
         self._filter_combo.currentTextChanged.connect(self._on_filter_changed)
         filter_row.addWidget(self._filter_combo)
         filter_row.addStretch()
@@ -95,7 +121,18 @@ class LogView(QWidget):
             FILTER_WARNING: LOG_LEVEL_WARNING,
             FILTER_ERROR: LOG_LEVEL_ERROR,
         }
-        self._proxy.set_filter_level(level_map.get(text))
+        level = level_map.get(text)
+        self._proxy.set_filter_level(level)
+        if level is None:
+            if self._list.model() is self._proxy:
+                self._list.setModel(self._model)
+                # Detach so the idle proxy does not track every appended row.
+                self._proxy.setSourceModel(None)
+        elif self._list.model() is not self._proxy:
+            self._proxy.setSourceModel(self._model)
+            self._list.setModel(self._proxy)
+        if self._at_bottom:
+            self._list.scrollToBottom()
 
     def _on_scroll(self, value: int) -> None:
         bar = self._list.verticalScrollBar()
@@ -120,12 +157,5 @@ class LogView(QWidget):
 
     def refresh_theme(self) -> None:
         """Re-apply theme-dependent styles (called when theme changes)."""
-        t = Tokens
-        self._list.setStyleSheet(
-            f"QListView {{ font-family: Consolas; font-size: 12px; background: {t.surface_hover}; "
-            f"border-radius: {t.radius_sm}px; color: {t.text_primary}; }}"
-        )
-        self._filter_combo.setStyleSheet(
-            f"QComboBox {{ background: {t.surface}; color: {t.text_primary}; border: 1px solid {t.border}; "
-            f"border-radius: {t.radius_sm}px; padding: 4px; min-height: 24px; }}"
-        )
+        self._list.setStyleSheet(cached_style("log_view.list", _list_style))
+        self._filter_combo.setStyleSheet(cached_style("log_view.combo", _combo_style))
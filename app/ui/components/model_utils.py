@@ -1,7 +1,15 @@
 from __future__ import annotations
 
+import os
+import threading
+import weakref
+from collections import deque
+from collections.abc import Iterable, Iterator
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import Any
 
+import numpy as np
 from PySide6.QtWidgets import QCheckBox, QLineEdit, QMessageBox, QWidget
 
 from app.config import PROJECT_ROOT
@@ -34,3 +42,85 @@ def make_best_model_checkbox(parent: QWidget, line_edit: QLineEdit) -> QCheckBox
     checkbox.toggled.connect(_on_toggled)
     return checkbox
 
+
+class ModelCache:
+    """Loaded YOLO models keyed by (path, mtime), so repeated runs skip the reload.
+
+    Rewriting the weights file changes the mtime and forces a fresh load. get() may be
+    called from worker threads; loads hold a per-path lock only, so a GUI-thread get()
+    for other weights does not wait behind a worker's load. The models themselves are
+    not thread-safe: callers must not predict on one instance from two threads at once.
+    """
+
+    def __init__(self) -> None:
+        self._models: dict[tuple[str, int], Any] = {}
+        self._lock = threading.Lock()  # guards _models and _load_locks
+        self._load_locks: dict[str, threading.Lock] = {}
+
+    def get(self, path: str) -> Any:
+        key = (path, os.stat(path).st_mtime_ns)
+        with self._lock:
+            model = self._models.get(key)
+            if model is not None:
+                return model
+            load_lock = self._load_locks.setdefault(path, threading.Lock())
+        with load_lock:
+            with self._lock:
+                model = self._models.get(key)
+            if model is None:
+                from ultralytics import YOLO
+
+                model = YOLO(path)
+                with self._lock:
+                    # Keep only the newest version of each path.
+                    for old in [k for k in self._models if k[0] == path]:
+                        del self._models[old]
+                    self._models[key] = model
+            return model
+
+
+_NAMES_ARRAYS: weakref.WeakKeyDictionary[Any, np.ndarray] = weakref.WeakKeyDictionary()
+
+
+def names_array(model: Any) -> np.ndarray:
+    """model.names as an object array indexed by class id, built once per model.
+
+    Lets callers map a whole array of class ids to names with one numpy gather.
+    """
+    arr = _NAMES_ARRAYS.get(model)
+    if arr is None:
+        names = model.names
+        arr = _NAMES_ARRAYS[model] = np.array([names[i] for i in range(len(names))], dtype=object)
+    return arr
+
+
+def _read_image(path: str) -> Any:
+    import cv2
+
+    # imdecode over np.fromfile also handles non-ASCII paths, which cv2.imread does not
+    # on Windows. Undecodable files are passed through as paths for predict to report.
+    img = cv2.imdecode(np.fromfile(path, dtype=np.uint8), cv2.IMREAD_COLOR)
+    return path if img is None else img
+
+
+def prefetch_images(
+    batches: Iterable[list[str]], workers: int = 4, depth: int = 2
+) -> Iterator[list[Any]]:
+    """Yield each batch of image paths decoded to BGR arrays, in order.
+
+    Up to depth batches are decoded ahead on a thread pool, so disk reads and JPEG
+    decoding overlap with inference on the batch the caller is working on.
+    """
+    it = iter(batches)
+    with ThreadPoolExecutor(workers) as pool:
+        pending: deque[list[Any]] = deque()
+        for batch in it:
+            pending.append([pool.submit(_read_image, p) for p in batch])
+            if len(pending) >= depth:
+                break
+        while pending:
+            futures = pending.popleft()
+            batch = next(it, None)
+            if batch is not None:
+                pending.append([pool.submit(_read_image, p) for p in batch])
+            yield [f.result() for f in futures]
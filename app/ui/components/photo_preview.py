@@ -5,11 +5,12 @@
 
 from __future__ import annotations
 
+import logging
 from collections.abc import Sequence
 
 from PIL import Image
-from PySide6.QtCore import Qt
-from PySide6.QtGui import QPixmap
+from PySide6.QtCore import QObject, QRunnable, Qt, QThreadPool, QTimer, Signal
+from PySide6.QtGui import QImage, QPixmap
 from PySide6.QtWidgets import (
     QDialog,
     QLabel,
@@ -18,22 +19,100 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+log = logging.getLogger(__name__)
+
 PREVIEW_DISPLAY_WIDTH = 900
 
 
-def _pil_to_qpixmap(pil: Image.Image, max_width: int = PREVIEW_DISPLAY_WIDTH) -> QPixmap:
-    img = pil.copy()
-    if img.width > max_width:
-        ratio = max_width / img.width
-        new_h = int(img.height * ratio)
-        img = img.resize((max_width, new_h), Image.Resampling.LANCZOS)
-    data = img.tobytes("raw", "RGB")
-    from PySide6.QtGui import QImage
-
-    qimg = QImage(data, img.width, img.height, img.width * 3, QImage.Format.Format_RGB888)
+def _prepare_preview(
+    pil: Image.Image, max_width: int = PREVIEW_DISPLAY_WIDTH
+) -> tuple[bytes, int, int, int]:
+    """Resize and flatten to raw RGB/RGBA bytes: (data, width, height, channels). Thread-safe."""
+    # resize()/convert() already return new images, so the source is never copied.
+    if pil.mode not in ("RGB", "RGBA"):
+        pil = pil.convert("RGB")
+    if pil.width > max_width:
+        ratio = max_width / pil.width
+        new_h = int(pil.height * ratio)
+        pil = pil.resize((max_width, new_h), Image.Resampling.BILINEAR)
+    channels = 4 if pil.mode == "RGBA" else 3
+    return pil.tobytes(), pil.width, pil.height, channels
+
+
+def _raw_to_qpixmap(data: bytes, width: int, height: int, channels: int) -> QPixmap:
+    """Build a QPixmap from _prepare_preview output. GUI thread only."""
+    fmt = QImage.Format.Format_RGBA8888 if channels == 4 else QImage.Format.Format_RGB888
+    # QPixmap.fromImage converts immediately, while `data` is still alive.
+    qimg = QImage(data, width, height, width * channels, fmt)
     return QPixmap.fromImage(qimg)
 
 
+def _pil_to_qpixmap(pil: Image.Image, max_width: int = PREVIEW_DISPLAY_WIDTH) -> QPixmap:
+    return _raw_to_qpixmap(*_prepare_preview(pil, max_width))
+
+
+class _PreviewRunnable(QRunnable):
+    """Resizes one image on a QThreadPool worker and posts the raw bytes back."""
+
+    def __init__(self, loader: _LazyPixmapLoader, index: int, pil: Image.Image) -> None:
+        super().__init__()
+        self._loader = loader
+        self._index = index
+        self._pil = pil
+
+    def run(self) -> None:
+        try:
+            raw = _prepare_preview(self._pil, self._loader.display_width)
+        except Exception:
+            log.exception("Failed to prepare preview image #%d", self._index)
+            return
+        try:
+            self._loader.image_ready.emit(self._index, raw)
+        except RuntimeError:
+            pass  # dialog already destroyed
+
+
+class _LazyPixmapLoader(QObject):
+    """Renders label pixmaps only once the label scrolls into the viewport.
+
+    Resizing runs on the global QThreadPool; pixmaps are built on the GUI thread
+    when image_ready is delivered.
+    """
+
+    image_ready = Signal(int, object)  # (label index, _prepare_preview result)
+
+    def __init__(self, scroll: QScrollArea, display_width: int, parent: QObject) -> None:
+        super().__init__(parent)
+        self._scroll = scroll
+        self.display_width = display_width
+        self._labels: list[QLabel] = []
+        self._pending: dict[int, Image.Image] = {}
+        self.image_ready.connect(self._on_image_ready)
+        bar = scroll.verticalScrollBar()
+        bar.valueChanged.connect(self.render_visible)
+        bar.rangeChanged.connect(self.render_visible)
+
+    def add(self, label: QLabel, pil: Image.Image) -> None:
+        # Reserve the final size so the scroll range is right before rendering.
+        w, h = pil.width, pil.height
+        if w > self.display_width:
+            w, h = self.display_width, int(h * self.display_width / w)
+        label.setMinimumSize(w, h)
+        self._pending[len(self._labels)] = pil
+        self._labels.append(label)
+
+    def render_visible(self, *_args: object) -> None:
+        if not self._pending:
+            return
+        pool = QThreadPool.globalInstance()
+        visible = [i for i in self._pending if not self._labels[i].visibleRegion().isEmpty()]
+        for index in visible:
+            pool.start(_PreviewRunnable(self, index, self._pending.pop(index)))
+
+    def _on_image_ready(self, index: int, raw: tuple[bytes, int, int, int]) -> None:
+        self._labels[index].setPixmap(_raw_to_qpixmap(*raw))
+
+
 def show_scrollable_photo_dialog(
     parent: QWidget | None,
     title: str,
@@ -59,6 +138,7 @@ def show_scrollable_photo_dialog(
     inner_layout = QVBoxLayout(inner)
     inner_layout.setAlignment(Qt.AlignmentFlag.AlignTop)
 
+    loader = _LazyPixmapLoader(scroll, display_width, d)
     for item in images:
         if isinstance(item, tuple):
             label_text, pil = item
@@ -70,13 +150,13 @@ def show_scrollable_photo_dialog(
             img_to_show = pil
         else:
             img_to_show = item
-        pix = _pil_to_qpixmap(img_to_show, display_width)
         lbl_img = QLabel()
-        lbl_img.setPixmap(pix)
         lbl_img.setStyleSheet("background: #2b2b2b; padding: 4px;")
         lbl_img.setAlignment(Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignTop)
+        loader.add(lbl_img, img_to_show)
         inner_layout.addWidget(lbl_img)
 
     scroll.setWidget(inner)
     layout.addWidget(scroll)
+    QTimer.singleShot(0, loader.render_visible)
     d.exec()
@@ -0,0 +1,70 @@
+"""
+Read-only table model over a list of row lists (result tables of batch views).
+"""
+
+from __future__ import annotations
+
+from typing import Any
+
+from PySide6.QtCore import QAbstractTableModel, QModelIndex, Qt
+
+
+class RowsTableModel(QAbstractTableModel):
+    """Serves rows straight from the list it is given; no per-cell item objects.
+
+    Floats are shown with float_fmt. Individual cells can get a background via
+    set_cell_backgrounds (used to highlight the best result).
+    """
+
+    def __init__(self, headers: list[str], float_fmt: str = "{:.3f}", parent: Any = None) -> None:
+        super().__init__(parent)
+        self._headers = list(headers)
+        self._float_fmt = float_fmt
+        self._rows: list[list[Any]] = []
+        self._backgrounds: dict[tuple[int, int], Any] = {}
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._rows)
+
+    def columnCount(self, parent: QModelIndex = QModelIndex()) -> int:
+        if parent.isValid():
+            return 0
+        return len(self._headers)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        row, col = index.row(), index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            v = self._rows[row][col]
+            return self._float_fmt.format(v) if isinstance(v, float) else str(v)
+        if role == Qt.ItemDataRole.BackgroundRole:
+            return self._backgrounds.get((row, col))
+        return None
+
+    def headerData(
+        self, section: int, orientation: Qt.Orientation, role: int = Qt.ItemDataRole.DisplayRole
+    ) -> Any:
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return self._headers[section]
+        return section + 1
+
+    def set_rows(self, rows: list[list[Any]]) -> None:
+        """Replace all rows with one model reset. The list is kept, not copied."""
+        self.beginResetModel()
+        self._rows = rows
+        self._backgrounds = {}
+        self.endResetModel()
+
+    def set_cell_backgrounds(self, backgrounds: dict[tuple[int, int], Any]) -> None:
+        self._backgrounds = dict(backgrounds)
+        if self._rows:
+            self.dataChanged.emit(
+                self.index(0, 0),
+                self.index(len(self._rows) - 1, len(self._headers) - 1),
+                [Qt.ItemDataRole.BackgroundRole],
+            )
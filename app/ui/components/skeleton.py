@@ -4,7 +4,8 @@ Skeleton loader: placeholder with shimmer for loading states.
 
 from __future__ import annotations
 
-from PySide6.QtCore import QTimer
+from PySide6.QtCore import Property, QAbstractAnimation, QPropertyAnimation
+from PySide6.QtGui import QHideEvent, QShowEvent
 from PySide6.QtWidgets import QFrame, QWidget
 
 from app.ui.theme.tokens import Tokens
@@ -27,15 +28,44 @@ class SkeletonLoader(QFrame):
             """
         )
         self._shimmer_pos = 0.0
-        self._anim_timer = QTimer(self)
-        self._anim_timer.timeout.connect(self._tick_shimmer)
+        self._animating = False
+        # Qt drives the shimmer from its animation clock; paused while hidden.
+        self._anim = QPropertyAnimation(self, b"shimmerPos", self)
+        self._anim.setStartValue(0.0)
+        self._anim.setEndValue(1.0)
+        self._anim.setDuration(1000)
+        self._anim.setLoopCount(-1)
+
+    def _get_shimmer_pos(self) -> float:
+        return self._shimmer_pos
+
+    def _set_shimmer_pos(self, value: float) -> None:
+        self._shimmer_pos = value
+        self.update()
+
+    shimmerPos = Property(float, _get_shimmer_pos, _set_shimmer_pos)
 
     def start_animation(self) -> None:
-        self._anim_timer.start(50)
+        self._animating = True
+        if self.isVisible():
+            self._resume()
 
     def stop_animation(self) -> None:
-        self._anim_timer.stop()
+        self._animating = False
+        self._anim.stop()
 
-    def _tick_shimmer(self) -> None:
-        self._shimmer_pos = (self._shimmer_pos + 0.05) % 1.0
-        self.update()
+    def _resume(self) -> None:
+        if self._anim.state() == QAbstractAnimation.State.Paused:
+            self._anim.resume()
+        elif self._anim.state() == QAbstractAnimation.State.Stopped:
+            self._anim.start()
+
+    def showEvent(self, event: QShowEvent) -> None:  # noqa: N802
+        super().showEvent(event)
+        if self._animating:
+            self._resume()
+
+    def hideEvent(self, event: QHideEvent) -> None:  # noqa: N802
+        super().hideEvent(event)
+        if self._anim.state() == QAbstractAnimation.State.Running:
+            self._anim.pause()
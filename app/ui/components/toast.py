@@ -4,8 +4,8 @@ Toast notification: show message, auto-hide after delay. Non-modal overlay.
 
 from __future__ import annotations
 
-from PySide6.QtCore import QPropertyAnimation, Qt, QTimer
-from PySide6.QtWidgets import QGraphicsOpacityEffect, QLabel, QWidget
+from PySide6.QtCore import QPoint, QPropertyAnimation, Qt, QTimer
+from PySide6.QtWidgets import QLabel, QWidget
 
 from app.ui.theme.tokens import Tokens
 
@@ -28,7 +28,12 @@ def show_toast(
     }
     bg, fg = colors.get(style, colors["info"])
 
-    label = QLabel(message, parent)
+    # Frameless top-level window: fading windowOpacity is composited by the window
+    # system, whereas QGraphicsOpacityEffect re-renders the widget every frame.
+    label = QLabel(message, parent, Qt.WindowType.ToolTip | Qt.WindowType.FramelessWindowHint)
+    label.setAttribute(Qt.WidgetAttribute.WA_TranslucentBackground)
+    label.setAttribute(Qt.WidgetAttribute.WA_ShowWithoutActivating)
+    label.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose)
     label.setWordWrap(True)
     label.setAlignment(Qt.AlignmentFlag.AlignCenter)
     label.setStyleSheet(
@@ -40,30 +45,30 @@ def show_toast(
         font-weight: 500;
         """
     )
-    label.setGraphicsEffect(QGraphicsOpacityEffect(label))
-    label.graphicsEffect().setOpacity(0.0)
+    label.setWindowOpacity(0.0)
     label.adjustSize()
-    # Center in parent
+    # Center horizontally near the bottom of parent
     x = (parent.width() - label.width()) // 2
     y = parent.height() - label.height() - t.space_xl * 4
-    label.setGeometry(max(0, x), max(0, y), label.width() + t.space_lg, label.height() + t.space_sm)
+    origin = parent.mapToGlobal(QPoint(max(0, x), max(0, y)))
+    label.setGeometry(
+        origin.x(), origin.y(), label.width() + t.space_lg, label.height() + t.space_sm
+    )
     label.show()
     label.raise_()
 
-    effect = label.graphicsEffect()
-
-    anim_in = QPropertyAnimation(effect, b"opacity")
+    anim_in = QPropertyAnimation(label, b"windowOpacity", label)
     anim_in.setDuration(200)
     anim_in.setStartValue(0.0)
     anim_in.setEndValue(1.0)
     anim_in.start()
 
     def fade_out() -> None:
-        anim_out = QPropertyAnimation(effect, b"opacity")
+        anim_out = QPropertyAnimation(label, b"windowOpacity", label)
         anim_out.setDuration(250)
         anim_out.setStartValue(1.0)
         anim_out.setEndValue(0.0)
-        anim_out.finished.connect(label.deleteLater)
+        anim_out.finished.connect(label.close)
         anim_out.start()
 
-    QTimer.singleShot(duration_ms, fade_out)
+    QTimer.singleShot(duration_ms, label, fade_out)
@@ -8,33 +8,42 @@ Some headless CI environments have PySide6 installed but miss runtime GUI libs
 
 from __future__ import annotations
 
+import sys
 from importlib import import_module
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-__all__ = [
-    "create_application",
-    "Container",
-    "NotificationCenter",
-    "install_error_boundary",
-    "AppSettings",
-    "TrainingSignals",
-    "DetectionSignals",
-]
+if TYPE_CHECKING:
+    from app.ui.infrastructure.application import create_application
+    from app.ui.infrastructure.di import Container
+    from app.ui.infrastructure.error_boundary import install_error_boundary
+    from app.ui.infrastructure.notifications import NotificationCenter
+    from app.ui.infrastructure.settings import AppSettings
+    from app.ui.infrastructure.signals import DetectionSignals, TrainingSignals
+
+# Public name -> (module, attribute); resolved on first access (PEP 562).
+_LAZY_IMPORTS: dict[str, tuple[str, str]] = {
+    "create_application": ("app.ui.infrastructure.application", "create_application"),
+    "Container": ("app.ui.infrastructure.di", "Container"),
+    "NotificationCenter": ("app.ui.infrastructure.notifications", "NotificationCenter"),
+    "install_error_boundary": ("app.ui.infrastructure.error_boundary", "install_error_boundary"),
+    "AppSettings": ("app.ui.infrastructure.settings", "AppSettings"),
+    "TrainingSignals": ("app.ui.infrastructure.signals", "TrainingSignals"),
+    "DetectionSignals": ("app.ui.infrastructure.signals", "DetectionSignals"),
+}
+
+__all__ = list(_LAZY_IMPORTS)
 
 
 def __getattr__(name: str) -> Any:
-    if name == "create_application":
-        return import_module("app.ui.infrastructure.application").create_application
-    if name == "Container":
-        return import_module("app.ui.infrastructure.di").Container
-    if name == "NotificationCenter":
-        return import_module("app.ui.infrastructure.notifications").NotificationCenter
-    if name == "install_error_boundary":
-        return import_module("app.ui.infrastructure.error_boundary").install_error_boundary
-    if name == "AppSettings":
-        return import_module("app.ui.infrastructure.settings").AppSettings
-    if name == "TrainingSignals":
-        return import_module("app.ui.infrastructure.signals").TrainingSignals
-    if name == "DetectionSignals":
-        return import_module("app.ui.infrastructure.signals").DetectionSignals
-    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    try:
+        module_name, attr = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module_name), attr)
+    # Cache on the package so later lookups bypass __getattr__.
+    setattr(sys.modules[__name__], name, value)
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -0,0 +1,12 @@
+"""Detection signal bridge; imported lazily via app.ui.infrastructure.signals."""
+
+from __future__ import annotations
+
+from PySide6.QtCore import QObject, Signal
+
+
+class DetectionSignals(QObject):
+    """Signals for detection: FPS, stopped. Emit from worker thread."""
+
+    fps_updated = Signal(float)
+    detection_stopped = Signal()
@@ -0,0 +1,15 @@
+"""Training signal bridge; imported lazily via app.ui.infrastructure.signals."""
+
+from __future__ import annotations
+
+from PySide6.QtCore import QObject, Signal
+
+
+class TrainingSignals(QObject):
+    """Signals for training progress and console output. Emit from any thread; slots run on main thread."""
+
+    progress_updated = Signal(float, str)  # (0..1, status_message)
+    console_line = Signal(str)  # one line of log (no newline); legacy, prefer console_lines_batch
+    console_lines_batch = Signal(list)  # list[str] — batched for fewer UI updates
+    training_finished = Signal(object, object)  # (best_path or None, error_str or None)
+    training_stopped = Signal()
@@ -5,21 +5,29 @@ QApplication setup: High DPI, organization and app name for QSettings.
 from __future__ import annotations
 
 import sys
-from typing import NoReturn
+from typing import NoReturn, cast
 
 from PySide6.QtCore import Qt
 from PySide6.QtGui import QGuiApplication
 from PySide6.QtWidgets import QApplication
 
+# The rounding policy may only be set once, before the first QGuiApplication exists.
+_policy_set = False
+
 
 def create_application() -> QApplication:
     """Create and configure QApplication. Call before any Qt widgets.
     High DPI: Qt 6 scales automatically on 4K/mixed-DPI; PassThrough keeps fractional scaling.
+    An already running QApplication (tests, embedding) is reused instead of creating a second one.
     """
-    QGuiApplication.setHighDpiScaleFactorRoundingPolicy(
-        Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
-    )
-    app = QApplication(sys.argv)
+    global _policy_set
+    existing = QApplication.instance()
+    if existing is None and not _policy_set:
+        QGuiApplication.setHighDpiScaleFactorRoundingPolicy(
+            Qt.HighDpiScaleFactorRoundingPolicy.PassThrough
+        )
+        _policy_set = True
+    app = cast(QApplication, existing) if existing is not None else QApplication(sys.argv)
     app.setApplicationName("YOLO Desktop Studio")
     app.setOrganizationName("YOLOStudio")
     app.setApplicationVersion("1.0")
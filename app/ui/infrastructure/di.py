@@ -10,6 +10,8 @@ from app.application.container import Container as AppContainer
 
 
 class Container(AppContainer):
+    __slots__ = ("theme_manager", "notifications")
+
     def __init__(self) -> None:
         super().__init__()
         self.theme_manager = None
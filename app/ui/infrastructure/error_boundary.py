@@ -3,39 +3,53 @@ from __future__ import annotations
 import logging
 import sys
 import threading
-import traceback
+from functools import partial
 
+log = logging.getLogger(__name__)
 
-def install_error_boundary(notifications) -> None:
-    """Install global exception hooks.
+_CONSOLE_STREAMS = (sys.stdout, sys.stderr, sys.__stdout__, sys.__stderr__)
+
+
+def _root_logs_to_console() -> bool:
+    return any(
+        isinstance(h, logging.StreamHandler) and h.stream in _CONSOLE_STREAMS
+        for h in logging.getLogger().handlers
+    )
+
+
+_USER_MESSAGE = "Произошла непредвиденная ошибка. Проверьте логи и crash bundle в разделе 'Задачи'."
 
-    This prevents silent crashes in background threads and gives users a hint where
-    to find logs / crash bundle.
-    """
 
-    log = logging.getLogger(__name__)
-
-    def _handle(exc_type, exc, tb) -> None:  # type: ignore[no-untyped-def]
-        try:
-            msg = "".join(traceback.format_exception(exc_type, exc, tb))
-            log.error("Unhandled exception\n%s", msg)
-            if notifications is not None:
-                notifications.error(
-                    "Произошла непредвиденная ошибка. Проверьте логи и crash bundle в разделе 'Задачи'."
-                )
-        finally:
-            # Keep default behavior in console
+def _handle(notifications, console_logged: bool, exc_type, exc, tb) -> None:  # type: ignore[no-untyped-def]
+    try:
+        # exc_info defers traceback formatting to the handlers (skipped if ERROR is off).
+        log.error("Unhandled exception", exc_info=(exc_type, exc, tb))
+        if notifications is not None:
+            notifications.error(_USER_MESSAGE)
+    finally:
+        # Keep default behavior in console when logging does not cover it.
+        if not console_logged:
             try:
                 sys.__excepthook__(exc_type, exc, tb)
             except Exception:
-                return
+                pass
+
 
-    sys.excepthook = _handle
+def _handle_thread(notifications, console_logged: bool, args: threading.ExceptHookArgs) -> None:  # type: ignore[no-untyped-def]
+    _handle(notifications, console_logged, args.exc_type, args.exc_value, args.exc_traceback)
 
-    def _thread_hook(args: threading.ExceptHookArgs) -> None:
-        _handle(args.exc_type, args.exc_value, args.exc_traceback)
 
+def install_error_boundary(notifications) -> None:
+    """Install global exception hooks.
+
+    This prevents silent crashes in background threads and gives users a hint where
+    to find logs / crash bundle.
+    """
+    # If the root logger already echoes to the console, the default hook would print
+    # the same traceback a second time.
+    console_logged = _root_logs_to_console()
+    sys.excepthook = partial(_handle, notifications, console_logged)
     try:
-        threading.excepthook = _thread_hook  # type: ignore[assignment]
+        threading.excepthook = partial(_handle_thread, notifications, console_logged)  # type: ignore[assignment]
     except Exception:
         return
@@ -6,81 +6,82 @@ view code focused on composition and binding.
 
 from __future__ import annotations
 
-from importlib import import_module
+from functools import lru_cache
 from pathlib import Path
-from typing import TYPE_CHECKING, Any, cast
+from typing import TYPE_CHECKING
 
 if TYPE_CHECKING:
     from PySide6.QtWidgets import QWidget
 
 try:
-    _qt_widgets = import_module("PySide6.QtWidgets")
-    QFileDialog = getattr(_qt_widgets, "QFileDialog", None)
+    from PySide6.QtWidgets import QFileDialog
 except Exception:  # pragma: no cover
-    QFileDialog = None
+    QFileDialog = None  # type: ignore[assignment,misc]
 
 
-def get_open_json_path(
-    parent: QWidget | None = None, *, title: str = "Open", start_dir: Path | None = None
-) -> Path | None:
+_FILTERS: dict[str, str] = {
+    "json": "JSON (*.json);;All files (*.*)",
+    "yaml": "YAML (*.yaml *.yml);;All files (*.*)",
+    "pt": "PyTorch (*.pt);;All files (*.*)",
+    "model_or_yaml": "PyTorch (*.pt);;YAML (*.yaml *.yml);;All files (*.*)",
+    "zip": "ZIP (*.zip);;All files (*.*)",
+}
+
+
+@lru_cache(maxsize=1)
+def _default_start() -> str:
+    return str(Path.home())
+
+
+def _start(start_dir: Path | None) -> str:
+    return str(start_dir) if start_dir else _default_start()
+
+
+def _pick_open(parent: QWidget | None, title: str, start_dir: Path | None, key: str) -> Path | None:
     if QFileDialog is None:
         return None
-    start = str(start_dir or Path.home())
-    path, _ = cast(Any, QFileDialog).getOpenFileName(
-        parent, title, start, "JSON (*.json);;All files (*.*)"
-    )
+    path, _ = QFileDialog.getOpenFileName(parent, title, _start(start_dir), _FILTERS[key])
     return Path(path) if path else None
 
 
-def get_save_json_path(
-    parent: QWidget | None = None, *, title: str = "Save", start_dir: Path | None = None
-) -> Path | None:
+def _pick_save(parent: QWidget | None, title: str, start_dir: Path | None, key: str) -> Path | None:
     if QFileDialog is None:
         return None
-    start = str(start_dir or Path.home())
-    path, _ = cast(Any, QFileDialog).getSaveFileName(
-        parent, title, start, "JSON (*.json);;All files (*.*)"
-    )
+    path, _ = QFileDialog.getSaveFileName(parent, title, _start(start_dir), _FILTERS[key])
     return Path(path) if path else None
 
 
+def get_open_json_path(
+    parent: QWidget | None = None, *, title: str = "Open", start_dir: Path | None = None
+) -> Path | None:
+    return _pick_open(parent, title, start_dir, "json")
+
+
+def get_save_json_path(
+    parent: QWidget | None = None, *, title: str = "Save", start_dir: Path | None = None
+) -> Path | None:
+    return _pick_save(parent, title, start_dir, "json")
+
+
 def get_open_yaml_path(
     parent: QWidget | None = None, *, title: str = "Open", start_dir: Path | None = None
 ) -> Path | None:
     """Open a YAML file."""
-    if QFileDialog is None:
-        return None
-    start = str(start_dir or Path.home())
-    path, _ = cast(Any, QFileDialog).getOpenFileName(
-        parent, title, start, "YAML (*.yaml *.yml);;All files (*.*)"
-    )
-    return Path(path) if path else None
+    return _pick_open(parent, title, start_dir, "yaml")
 
 
 def get_open_pt_path(
     parent: QWidget | None = None, *, title: str = "Open", start_dir: Path | None = None
 ) -> Path | None:
     """Open a PyTorch weights file (.pt)."""
-    if QFileDialog is None:
-        return None
-    start = str(start_dir or Path.home())
-    path, _ = cast(Any, QFileDialog).getOpenFileName(
-        parent, title, start, "PyTorch (*.pt);;All files (*.*)"
-    )
-    return Path(path) if path else None
+    return _pick_open(parent, title, start_dir, "pt")
 
 
 def get_open_model_or_yaml_path(
     parent: QWidget | None = None, *, title: str = "Open", start_dir: Path | None = None
 ) -> Path | None:
     """Open a model config/weights file (pt or yaml)."""
-    if QFileDialog is None:
-        return None
-    start = str(start_dir or Path.home())
-    path, _ = cast(Any, QFileDialog).getOpenFileName(
-        parent, title, start, "PyTorch (*.pt);;YAML (*.yaml *.yml);;All files (*.*)"
-    )
-    return Path(path) if path else None
+    return _pick_open(parent, title, start_dir, "model_or_yaml")
 
 
 def get_existing_dir(
@@ -89,18 +90,11 @@ def get_existing_dir(
     """Select an existing directory."""
     if QFileDialog is None:
         return None
-    start = str(start_dir or Path.home())
-    path = cast(Any, QFileDialog).getExistingDirectory(parent, title, start)
+    path = QFileDialog.getExistingDirectory(parent, title, _start(start_dir))
     return Path(path) if path else None
 
 
 def get_save_zip_path(
     parent: QWidget | None = None, *, title: str = "Save", start_dir: Path | None = None
 ) -> Path | None:
-    if QFileDialog is None:
-        return None
-    start = str(start_dir or Path.home())
-    path, _ = cast(Any, QFileDialog).getSaveFileName(
-        parent, title, start, "ZIP (*.zip);;All files (*.*)"
-    )
-    return Path(path) if path else None
+    return _pick_save(parent, title, start_dir, "zip")
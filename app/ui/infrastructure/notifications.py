@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+import logging
+from collections.abc import Callable
 from dataclasses import dataclass
 from importlib import import_module
 from typing import Any, cast
@@ -7,8 +9,19 @@ from typing import Any, cast
 try:
     _qt_widgets = import_module("PySide6.QtWidgets")
     QMessageBox = getattr(_qt_widgets, "QMessageBox", None)
+    QTimer = getattr(import_module("PySide6.QtCore"), "QTimer", None)
 except Exception:  # pragma: no cover
     QMessageBox = None
+    QTimer = None
+
+log = logging.getLogger(__name__)
+
+# How long a status bar message stays visible.
+_STATUS_MS = 4500
+# Status messages within this window collapse into the latest one.
+STATUS_COALESCE_MS = 50
+# Errors arriving within this window are shown together in one dialog.
+ERROR_COALESCE_MS = 200
 
 
 @dataclass(frozen=True)
@@ -26,19 +39,69 @@ class NotificationCenter:
 
     def __init__(self, window) -> None:
         self._window = window
+        # Bound statusBar().showMessage, resolved once; None until a status bar exists.
+        self._show: Callable[[str, int], None] | None = None
+        # Latest status message waiting for the coalescing timer.
+        self._pending_text: str | None = None
+        self._pending_ms = 0
+        self._status_timer: Any = None
+        if QTimer is not None:
+            self._status_timer = QTimer()
+            self._status_timer.setSingleShot(True)
+            self._status_timer.setInterval(STATUS_COALESCE_MS)
+            self._status_timer.timeout.connect(self._flush_status)
+        # One reusable, modeless error box; rapid errors are coalesced by a timer.
+        self._error_box: Any = None
+        self._error_pending: list[str] = []
+        self._error_timer: Any = None
+        if QMessageBox is not None and QTimer is not None:
+            self._error_timer = QTimer()
+            self._error_timer.setSingleShot(True)
+            self._error_timer.setInterval(ERROR_COALESCE_MS)
+            self._error_timer.timeout.connect(self._flush_errors)
+
+    def _resolve_show(self) -> Callable[[str, int], None] | None:
+        sb = getattr(self._window, "statusBar", None)
+        if callable(sb):
+            sb = sb()
+        if sb is not None and hasattr(sb, "showMessage"):
+            self._show = sb.showMessage
+        else:
+            self._show = None
+        return self._show
+
+    def _status(self, text: str, *, ms: int = _STATUS_MS) -> None:
+        timer = self._status_timer
+        if timer is None:
+            self._display(text, ms)
+            return
+        self._pending_text = text
+        self._pending_ms = ms
+        if not timer.isActive():
+            timer.start()
+
+    def _flush_status(self) -> None:
+        text = self._pending_text
+        if text is None:
+            return
+        self._pending_text = None
+        self._display(text, self._pending_ms)
 
-    def _status(self, text: str, *, ms: int = 4500) -> None:
+    def _display(self, text: str, ms: int) -> None:
+        show = self._show
         try:
-            sb = getattr(self._window, "statusBar", None)
-            if callable(sb):
-                sb = sb()
-            if sb is not None and hasattr(sb, "showMessage"):
-                sb.showMessage(text, ms)
-                return
+            if show is not None:
+                try:
+                    show(text, ms)
+                    return
+                except Exception:
+                    # Status bar may have been replaced/destroyed; re-resolve once below.
+                    self._show = None
+            show = self._resolve_show()
+            if show is not None:
+                show(text, ms)
         except Exception:
-            import logging
-
-            logging.getLogger(__name__).debug("Notification display failed", exc_info=True)
+            log.debug("Notification display failed", exc_info=True)
         return
 
     @staticmethod
@@ -58,23 +121,37 @@ class NotificationCenter:
 
     def error(self, title_or_message: str, message: str | None = None) -> None:
         text = self._join_message(title_or_message, message)
-        self._status(text)
-        if QMessageBox is None:
+        # Errors skip status coalescing and supersede any queued message.
+        self._pending_text = None
+        self._display(text, _STATUS_MS)
+        timer = self._error_timer
+        if timer is None:
             return
+        self._error_pending.append(text)
+        # May be called from worker threads (error boundary): start the timer on its own thread.
+        cast(Any, QTimer).singleShot(0, timer, timer.start)
+
+    def _flush_errors(self) -> None:
+        if not self._error_pending:
+            return
+        text = "\n\n".join(self._error_pending)
+        self._error_pending.clear()
         try:
-            cast(Any, QMessageBox).critical(self._window, "Ошибка", text)
+            box = self._error_box
+            if box is None:
+                box = cast(Any, QMessageBox)(self._window)
+                box.setIcon(cast(Any, QMessageBox).Icon.Critical)
+                box.setWindowTitle("Ошибка")
+                box.setModal(False)
+                self._error_box = box
+            box.setText(text)
+            box.show()
+            box.raise_()
         except Exception:
-            return
-
-    # Backward-compatible API used in older views.
-    def notify_info(self, message: str) -> None:
-        self.info(message)
-
-    def notify_success(self, message: str) -> None:
-        self.success(message)
-
-    def notify_warning(self, message: str) -> None:
-        self.warning(message)
+            log.debug("Error dialog display failed", exc_info=True)
 
-    def notify_error(self, message: str) -> None:
-        self.error(message)
+    # Backward-compatible API used in older views: plain aliases, no extra call frame.
+    notify_info = info
+    notify_success = success
+    notify_warning = warning
+    notify_error = error
@@ -4,49 +4,96 @@ QSettings wrapper: main window geometry, sidebar state, dock layout, theme.
 
 from __future__ import annotations
 
-from typing import cast
+import sys
+from collections.abc import Iterator
+from contextlib import contextmanager
+from typing import Any, cast
 
 from PySide6.QtCore import QByteArray, QSettings, QSize
 
+# QSettings keys; interned so the cache dicts below always see the same object.
+_K_GEOM = sys.intern("mainWindow/geometry")
+_K_STATE = sys.intern("mainWindow/state")
+_K_SIZE = sys.intern("mainWindow/size")
+_K_SIDEBAR = sys.intern("sidebar/collapsed")
+_K_THEME = sys.intern("theme/name")
+
 
 class AppSettings:
     """Application and window persistence via QSettings (platform-specific path)."""
 
-    def __init__(self) -> None:
-        self._q = QSettings("YOLOStudio", "YOLO Desktop Studio")
+    def __init__(self, qsettings: QSettings | None = None) -> None:
+        self._q = (
+            qsettings if qsettings is not None else QSettings("YOLOStudio", "YOLO Desktop Studio")
+        )
+        # Writes deferred by batch(); flushed to the backend in one go on exit.
+        self._pending: dict[str, Any] = {}
+        self._in_batch = False
+        # Values already read or written through this instance (incl. pending ones).
+        self._cache: dict[str, Any] = {}
+
+    def _get(self, key: str, default: Any, type_: type) -> Any:
+        try:
+            return self._cache[key]
+        except KeyError:
+            value = self._cache[key] = self._q.value(key, default, type_)
+            return value
+
+    def _set(self, key: str, value: Any) -> None:
+        self._cache[key] = value
+        if self._in_batch:
+            self._pending[key] = value
+        else:
+            self._q.setValue(key, value)
+
+    @contextmanager
+    def batch(self) -> Iterator[AppSettings]:
+        """Defer setter writes until the block exits, then write them and sync() once."""
+        if self._in_batch:
+            yield self
+            return
+        self._in_batch = True
+        try:
+            yield self
+        finally:
+            self._in_batch = False
+            for key, value in self._pending.items():
+                self._q.setValue(key, value)
+            self._pending.clear()
+            self._q.sync()
 
     # --- Main window ---
     def get_main_window_geometry(self) -> QByteArray | None:
-        return cast(QByteArray | None, self._q.value("mainWindow/geometry", None, QByteArray))
+        return cast(QByteArray | None, self._get(_K_GEOM, None, QByteArray))
 
     def set_main_window_geometry(self, geometry: QByteArray) -> None:
-        self._q.setValue("mainWindow/geometry", geometry)
+        self._set(_K_GEOM, geometry)
 
     def get_main_window_state(self) -> QByteArray | None:
-        return cast(QByteArray | None, self._q.value("mainWindow/state", None, QByteArray))
+        return cast(QByteArray | None, self._get(_K_STATE, None, QByteArray))
 
     def set_main_window_state(self, state: QByteArray) -> None:
-        self._q.setValue("mainWindow/state", state)
+        self._set(_K_STATE, state)
 
     def get_main_window_size(self) -> QSize | None:
-        return cast(QSize | None, self._q.value("mainWindow/size", None, QSize))
+        return cast(QSize | None, self._get(_K_SIZE, None, QSize))
 
     def set_main_window_size(self, size: QSize) -> None:
-        self._q.setValue("mainWindow/size", size)
+        self._set(_K_SIZE, size)
 
     # --- Sidebar ---
     def get_sidebar_collapsed(self) -> bool:
-        return bool(self._q.value("sidebar/collapsed", False, bool))
+        return bool(self._get(_K_SIDEBAR, False, bool))
 
     def set_sidebar_collapsed(self, collapsed: bool) -> None:
-        self._q.setValue("sidebar/collapsed", collapsed)
+        self._set(_K_SIDEBAR, collapsed)
 
     # --- Theme ---
     def get_theme(self) -> str:
-        return str(self._q.value("theme/name", "dark", str))  # "dark" | "light"
+        return str(self._get(_K_THEME, "dark", str))  # "dark" | "light"
 
     def set_theme(self, name: str) -> None:
-        self._q.setValue("theme/name", name)
+        self._set(_K_THEME, name)
 
     def sync(self) -> None:
         self._q.sync()
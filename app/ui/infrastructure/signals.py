@@ -1,25 +1,38 @@
 """
 Thread-safe signal bridge: worker threads emit progress and console lines to the main thread.
 Use these QObject signals from callbacks/queue consumers so View can subscribe on main thread.
+
+Each QObject subclass lives in its own private module and is only created (and
+registered with Qt's meta-object system) on first access.
 """
 
 from __future__ import annotations
 
-from PySide6.QtCore import QObject, Signal
+import sys
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from app.ui.infrastructure._detection_signals import DetectionSignals
+    from app.ui.infrastructure._training_signals import TrainingSignals
 
+_LAZY_IMPORTS: dict[str, str] = {
+    "TrainingSignals": "app.ui.infrastructure._training_signals",
+    "DetectionSignals": "app.ui.infrastructure._detection_signals",
+}
 
-class TrainingSignals(QObject):
-    """Signals for training progress and console output. Emit from any thread; slots run on main thread."""
+__all__ = ["TrainingSignals", "DetectionSignals"]
 
-    progress_updated = Signal(float, str)  # (0..1, status_message)
-    console_line = Signal(str)  # one line of log (no newline); legacy, prefer console_lines_batch
-    console_lines_batch = Signal(list)  # list[str] — batched for fewer UI updates
-    training_finished = Signal(object, object)  # (best_path or None, error_str or None)
-    training_stopped = Signal()
 
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module_name), name)
+    setattr(sys.modules[__name__], name, value)
+    return value
 
-class DetectionSignals(QObject):
-    """Signals for detection: FPS, stopped. Emit from worker thread."""
 
-    fps_updated = Signal(float)
-    detection_stopped = Signal()
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -5,9 +5,12 @@ Main window: collapsible sidebar + stacked content, lazy tabs, keyboard navigati
 from __future__ import annotations
 
 import logging
-from typing import TYPE_CHECKING
+from collections.abc import Callable
+from functools import partial
+from importlib import import_module
+from typing import TYPE_CHECKING, Any, cast
 
-from PySide6.QtCore import QByteArray, QTimer
+from PySide6.QtCore import QByteArray, Qt, QTimer
 from PySide6.QtGui import QAction, QCloseEvent, QKeySequence
 from PySide6.QtWidgets import QHBoxLayout, QMainWindow, QStackedWidget, QStatusBar, QWidget
 
@@ -25,6 +28,34 @@ if TYPE_CHECKING:
     from app.ui.infrastructure.signals import TrainingSignals
 
 
+# Ctrl+1…Ctrl+9 for the first nine tabs, built once instead of parsed from text.
+_TAB_SHORTCUTS = tuple(
+    QKeySequence(Qt.KeyboardModifier.ControlModifier | key)
+    for key in (
+        Qt.Key.Key_1,
+        Qt.Key.Key_2,
+        Qt.Key.Key_3,
+        Qt.Key.Key_4,
+        Qt.Key.Key_5,
+        Qt.Key.Key_6,
+        Qt.Key.Key_7,
+        Qt.Key.Key_8,
+        Qt.Key.Key_9,
+    )
+)
+_PALETTE_SHORTCUT = QKeySequence(Qt.KeyboardModifier.ControlModifier | Qt.Key.Key_K)
+
+
+def _lazy_view(module: str, class_name: str, *args: Any, **kwargs: Any) -> Callable[[], QWidget]:
+    """Factory that imports the view module on first call, then builds the view."""
+
+    def _factory() -> QWidget:
+        view_cls = getattr(import_module(module), class_name)
+        return cast(QWidget, view_cls(*args, **kwargs))
+
+    return _factory
+
+
 class MainWindow(QMainWindow):
     """Main application window: sidebar + content stack, geometry and sidebar state persisted."""
 
@@ -54,43 +85,43 @@ class MainWindow(QMainWindow):
         self._sidebar.tab_changed.connect(self._on_tab_changed)
 
         self._stack = QStackedWidget()
-        factories = None
+        factories: dict[str, Callable[[], QWidget]] = {}
         if container is not None and signals is not None:
-            from app.ui.views.autoannotation.view import AutoAnnotationView
-            from app.ui.views.benchmark.view import BenchmarkView
-            from app.ui.views.classification.view import ClassificationView
-            from app.ui.views.datasets.view import DatasetsView
-            from app.ui.views.detection.view import DetectionView
-            from app.ui.views.docs.view import DocsView
-            from app.ui.views.experiments.view import ExperimentsView
-            from app.ui.views.integrations.view import IntegrationsView
-            from app.ui.views.jobs.view import JobsView
-            from app.ui.views.pose.view import PoseView
-            from app.ui.views.segmentation.view import SegmentationView
-            from app.ui.views.tracking.view import TrackingView
-            from app.ui.views.training.view import TrainingView
-            from app.ui.views.training_advisor.view import TrainingAdvisorView
-            from app.ui.views.validation.view import ValidationView
-
+            # View modules pull in heavy deps; import each one only when its tab is created.
+            views = "app.ui.views"
             factories = {
-                "training": lambda: TrainingView(container, signals),
-                "training_advisor": lambda: TrainingAdvisorView(container),
-                "detection": lambda: DetectionView(container),
-                "datasets": lambda: DatasetsView(container=container),
-                "validation": lambda: ValidationView(container),
-                "segmentation": lambda: SegmentationView(container),
-                "pose": lambda: PoseView(container),
-                "classification": lambda: ClassificationView(container),
-                "tracking": lambda: TrackingView(container),
-                "autoannotation": lambda: AutoAnnotationView(container),
-                "benchmark": lambda: BenchmarkView(container),
-                "experiments": lambda: ExperimentsView(container),
-                "integrations": lambda: IntegrationsView(container),
-                "jobs": lambda: JobsView(container),
-                "docs": lambda: DocsView(container),
+                "training": _lazy_view(
+                    f"{views}.training.view", "TrainingView", container, signals
+                ),
+                "training_advisor": _lazy_view(
+                    f"{views}.training_advisor.view", "TrainingAdvisorView", container
+                ),
+                "detection": _lazy_view(f"{views}.detection.view", "DetectionView", container),
+                "datasets": _lazy_view(
+                    f"{views}.datasets.view", "DatasetsView", container=container
+                ),
+                "validation": _lazy_view(f"{views}.validation.view", "ValidationView", container),
+                "segmentation": _lazy_view(
+                    f"{views}.segmentation.view", "SegmentationView", container
+                ),
+                "pose": _lazy_view(f"{views}.pose.view", "PoseView", container),
+                "classification": _lazy_view(
+                    f"{views}.classification.view", "ClassificationView", container
+                ),
+                "tracking": _lazy_view(f"{views}.tracking.view", "TrackingView", container),
+                "autoannotation": _lazy_view(
+                    f"{views}.autoannotation.view", "AutoAnnotationView", container
+                ),
+                "benchmark": _lazy_view(f"{views}.benchmark.view", "BenchmarkView", container),
+                "experiments": _lazy_view(
+                    f"{views}.experiments.view", "ExperimentsView", container
+                ),
+                "integrations": _lazy_view(
+                    f"{views}.integrations.view", "IntegrationsView", container
+                ),
+                "jobs": _lazy_view(f"{views}.jobs.view", "JobsView", container),
+                "docs": _lazy_view(f"{views}.docs.view", "DocsView", container),
             }
-        else:
-            factories = {}
         self._stack_controller = StackController(self._stack, factories=factories)
         self._stack_controller.switch_to(TAB_IDS[0])
         self._sidebar.set_current_tab(TAB_IDS[0])
@@ -112,13 +143,13 @@ class MainWindow(QMainWindow):
         QTimer.singleShot(80, self._preload_tabs)
 
     def _setup_shortcuts(self) -> None:
-        for i, tab_id in enumerate(TAB_IDS):
+        for tab_id, shortcut in zip(TAB_IDS, _TAB_SHORTCUTS):
             action = QAction(self)
-            action.setShortcut(QKeySequence(f"Ctrl+{i + 1}"))
-            action.triggered.connect(lambda checked=False, t=tab_id: self._on_tab_changed(t))
+            action.setShortcut(shortcut)
+            action.triggered.connect(partial(self._on_tab_changed, tab_id))
             self.addAction(action)
         palette_action = QAction(self)
-        palette_action.setShortcut(QKeySequence("Ctrl+K"))
+        palette_action.setShortcut(_PALETTE_SHORTCUT)
         palette_action.triggered.connect(self._open_command_palette)
         self.addAction(palette_action)
 
@@ -159,10 +190,10 @@ class MainWindow(QMainWindow):
             self.restoreState(state)
 
     def _save_geometry(self) -> None:
-        self._settings.set_main_window_geometry(self.saveGeometry())
-        self._settings.set_main_window_state(self.saveState())
-        self._settings.set_sidebar_collapsed(self._sidebar.is_collapsed())
-        self._settings.sync()
+        with self._settings.batch():
+            self._settings.set_main_window_geometry(self.saveGeometry())
+            self._settings.set_main_window_state(self.saveState())
+            self._settings.set_sidebar_collapsed(self._sidebar.is_collapsed())
 
     def _safe_shutdown_tab(self, tab, tab_name: str) -> None:
         if tab is None or not hasattr(tab, "shutdown"):
@@ -1,5 +1,5 @@
 """
-Collapsible sidebar: icon-based navigation, tooltips, smooth width animation.
+Collapsible sidebar: icon-based navigation, tooltips, fade-in on collapse/expand.
 """
 
 from __future__ import annotations
@@ -7,9 +7,11 @@ from __future__ import annotations
 from typing import TYPE_CHECKING
 
 from PySide6.QtCore import QEasingCurve, QPropertyAnimation, Qt, Signal
+from PySide6.QtGui import QIcon, QShowEvent
 from PySide6.QtWidgets import (
     QComboBox,
     QFrame,
+    QGraphicsOpacityEffect,
     QLabel,
     QScrollArea,
     QSizePolicy,
@@ -19,6 +21,8 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from app.ui.theme.manager import THEME_DARK, THEME_LIGHT
+
 # Sidebar width in expanded/collapsed state
 SIDEBAR_WIDTH_EXPANDED = 220
 SIDEBAR_WIDTH_COLLAPSED = 56
@@ -27,9 +31,106 @@ ANIMATION_DURATION_MS = 200
 if TYPE_CHECKING:
     from app.ui.infrastructure.di import Container
 
+# Standard icons do not depend on the theme palette, so one QIcon per pixmap is shared.
+_ICON_CACHE: dict[QStyle.StandardPixmap, QIcon] = {}
+
+
+def _std_icon(widget: QWidget, pm: QStyle.StandardPixmap) -> QIcon:
+    icon = _ICON_CACHE.get(pm)
+    if icon is None:
+        icon = _ICON_CACHE[pm] = widget.style().standardIcon(pm)
+    return icon
+
+
+# Nav buttons keep their text; the "collapsed" dynamic property switches them to
+# icon-only through the stylesheet, so collapsing is one property write per button.
+_SIDEBAR_STYLE = """
+    QToolButton[collapsed="true"] { qproperty-toolButtonStyle: ToolButtonIconOnly; }
+    QToolButton[collapsed="false"] { qproperty-toolButtonStyle: ToolButtonTextBesideIcon; }
+"""
+
+# (tab_id, label, tooltip, icon) for each navigation button, top to bottom.
+_NAV_ITEMS: tuple[tuple[str, str, str, QStyle.StandardPixmap], ...] = (
+    (
+        "datasets",
+        "Датасеты",
+        "Управление датасетами и подготовка к YOLO",
+        QStyle.StandardPixmap.SP_DirIcon,
+    ),
+    ("training", "Обучение", "Обучение моделей YOLO", QStyle.StandardPixmap.SP_MediaPlay),
+    (
+        "training_advisor",
+        "Советник",
+        "Советник по обучению: анализ и рекомендации перед запуском",
+        QStyle.StandardPixmap.SP_FileDialogDetailedView,
+    ),
+    (
+        "detection",
+        "Детекция",
+        "Детекция в реальном времени",
+        QStyle.StandardPixmap.SP_ComputerIcon,
+    ),
+    (
+        "validation",
+        "Валидация",
+        "Валидация и метрики модели",
+        QStyle.StandardPixmap.SP_DialogApplyButton,
+    ),
+    (
+        "segmentation",
+        "Сегментация",
+        "Сегментация в реальном времени",
+        QStyle.StandardPixmap.SP_DirOpenIcon,
+    ),
+    ("pose", "Поза", "Оценка позы", QStyle.StandardPixmap.SP_TitleBarNormalButton),
+    (
+        "classification",
+        "Классификация",
+        "Классификация изображений",
+        QStyle.StandardPixmap.SP_FileIcon,
+    ),
+    ("tracking", "Трекинг", "Отслеживание объектов", QStyle.StandardPixmap.SP_ArrowForward),
+    (
+        "autoannotation",
+        "Аннотация",
+        "Автоаннотирование датасета",
+        QStyle.StandardPixmap.SP_FileDialogNewFolder,
+    ),
+    (
+        "benchmark",
+        "Бенчмарк",
+        "Сравнение форматов модели",
+        QStyle.StandardPixmap.SP_BrowserReload,
+    ),
+    (
+        "experiments",
+        "Эксперименты",
+        "История обучений и сравнение",
+        QStyle.StandardPixmap.SP_FileDialogContentsView,
+    ),
+    (
+        "integrations",
+        "Интеграции",
+        "Интеграции и мониторинг",
+        QStyle.StandardPixmap.SP_DriveNetIcon,
+    ),
+    (
+        "jobs",
+        "Задачи",
+        "История фоновых задач, логи и повтор",
+        QStyle.StandardPixmap.SP_FileDialogDetailedView,
+    ),
+    (
+        "docs",
+        "Документация",
+        "Просмотр локальной документации проекта",
+        QStyle.StandardPixmap.SP_FileDialogInfoView,
+    ),
+)
+
 
 class SidebarButton(QToolButton):
-    """Single nav button: icon + optional text (hidden when collapsed)."""
+    """Single nav button: icon + text; icon-only while the "collapsed" property is set."""
 
     def __init__(
         self,
@@ -38,12 +139,13 @@ class SidebarButton(QToolButton):
         label: str,
         tooltip: str,
         icon_style: QStyle.StandardPixmap,
+        collapsed: bool = False,
     ) -> None:
         super().__init__(parent)
         self._tab_id = tab_id
-        self._label = label
+        self.setProperty("collapsed", collapsed)
         self.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
-        self.setIcon(self.style().standardIcon(icon_style))
+        self.setIcon(_std_icon(self, icon_style))
         self.setText(label)
         self.setToolTip(tooltip)
         self.setCheckable(True)
@@ -54,6 +156,12 @@ class SidebarButton(QToolButton):
     def tab_id(self) -> str:
         return self._tab_id
 
+    def set_collapsed(self, collapsed: bool) -> None:
+        self.setProperty("collapsed", collapsed)
+        style = self.style()
+        style.unpolish(self)
+        style.polish(self)
+
 
 class CollapsibleSidebar(QFrame):
     """Vertical sidebar with nav buttons and collapse toggle. Emits tab change and collapse state."""
@@ -70,9 +178,12 @@ class CollapsibleSidebar(QFrame):
         self._collapsed = initial_collapsed
         self._container = container
         self._buttons: list[SidebarButton] = []
+        self._current_tab: str | None = None
         self._animation: QPropertyAnimation | None = None
+        self._fade: QGraphicsOpacityEffect | None = None
 
         self.setObjectName("collapsibleSidebar")
+        self.setStyleSheet(_SIDEBAR_STYLE)
         self.setFrameShape(QFrame.Shape.StyledPanel)
         self.setMinimumWidth(SIDEBAR_WIDTH_COLLAPSED)
         self.setMaximumWidth(SIDEBAR_WIDTH_EXPANDED)
@@ -95,86 +206,9 @@ class CollapsibleSidebar(QFrame):
         scroll_layout.setContentsMargins(0, 0, 0, 0)
         scroll_layout.setSpacing(2)
 
-        nav_items = [
-            (
-                "datasets",
-                "Датасеты",
-                "Управление датасетами и подготовка к YOLO",
-                QStyle.StandardPixmap.SP_DirIcon,
-            ),
-            ("training", "Обучение", "Обучение моделей YOLO", QStyle.StandardPixmap.SP_MediaPlay),
-            (
-                "training_advisor",
-                "Советник",
-                "Советник по обучению: анализ и рекомендации перед запуском",
-                QStyle.StandardPixmap.SP_FileDialogDetailedView,
-            ),
-            (
-                "detection",
-                "Детекция",
-                "Детекция в реальном времени",
-                QStyle.StandardPixmap.SP_ComputerIcon,
-            ),
-            (
-                "validation",
-                "Валидация",
-                "Валидация и метрики модели",
-                QStyle.StandardPixmap.SP_DialogApplyButton,
-            ),
-            (
-                "segmentation",
-                "Сегментация",
-                "Сегментация в реальном времени",
-                QStyle.StandardPixmap.SP_DirOpenIcon,
-            ),
-            ("pose", "Поза", "Оценка позы", QStyle.StandardPixmap.SP_TitleBarNormalButton),
-            (
-                "classification",
-                "Классификация",
-                "Классификация изображений",
-                QStyle.StandardPixmap.SP_FileIcon,
-            ),
-            ("tracking", "Трекинг", "Отслеживание объектов", QStyle.StandardPixmap.SP_ArrowForward),
-            (
-                "autoannotation",
-                "Аннотация",
-                "Автоаннотирование датасета",
-                QStyle.StandardPixmap.SP_FileDialogNewFolder,
-            ),
-            (
-                "benchmark",
-                "Бенчмарк",
-                "Сравнение форматов модели",
-                QStyle.StandardPixmap.SP_BrowserReload,
-            ),
-            (
-                "experiments",
-                "Эксперименты",
-                "История обучений и сравнение",
-                QStyle.StandardPixmap.SP_FileDialogContentsView,
-            ),
-            (
-                "integrations",
-                "Интеграции",
-                "Интеграции и мониторинг",
-                QStyle.StandardPixmap.SP_DriveNetIcon,
-            ),
-            (
-                "jobs",
-                "Задачи",
-                "История фоновых задач, логи и повтор",
-                QStyle.StandardPixmap.SP_FileDialogDetailedView,
-            ),
-            (
-                "docs",
-                "Документация",
-                "Просмотр локальной документации проекта",
-                QStyle.StandardPixmap.SP_FileDialogInfoView,
-            ),
-        ]
-        for tab_id, label, tooltip, pixmap in nav_items:
-            btn = SidebarButton(self, tab_id, label, tooltip, pixmap)
-            btn.clicked.connect(lambda checked=False, t=tab_id: self._on_nav_clicked(t))
+        for tab_id, label, tooltip, pixmap in _NAV_ITEMS:
+            btn = SidebarButton(self, tab_id, label, tooltip, pixmap, initial_collapsed)
+            btn.clicked.connect(self._on_nav_button_clicked)
             self._buttons.append(btn)
             scroll_layout.addWidget(btn)
 
@@ -182,40 +216,31 @@ class CollapsibleSidebar(QFrame):
         scroll.setWidget(scroll_content)
         layout.addWidget(scroll)
 
-        # Theme switcher (Part 4.11: theme from DI container, no global get_theme_manager)
-        from app.ui.theme.manager import THEME_LIGHT
-
-        theme_mgr = self._container.theme_manager if self._container else None
-        self._theme_combo = QComboBox()
-        self._theme_combo.addItems(["Тёмная", "Светлая"])
-        self._theme_combo.setCurrentIndex(
-            1 if (theme_mgr and theme_mgr.get_theme() == THEME_LIGHT) else 0
-        )
-        self._theme_combo.currentIndexChanged.connect(self._on_theme_changed)
-        self._theme_label = QLabel("Тема:")
-        theme_row = QWidget()
-        theme_row_layout = QVBoxLayout(theme_row)
-        theme_row_layout.setContentsMargins(4, 4, 4, 4)
-        theme_row_layout.setSpacing(4)
-        theme_row_layout.addWidget(self._theme_label)
-        theme_row_layout.addWidget(self._theme_combo)
-        self._theme_widget = theme_row
+        # Theme switcher (Part 4.11: theme from DI container, no global get_theme_manager).
+        # Only an empty row is created here; the combo is built on first expanded show.
+        self._theme_combo: QComboBox | None = None
+        self._theme_widget = QWidget()
+        self._theme_row_layout = QVBoxLayout(self._theme_widget)
+        self._theme_row_layout.setContentsMargins(4, 4, 4, 4)
+        self._theme_row_layout.setSpacing(4)
         layout.addWidget(self._theme_widget)
+        theme_mgr = self._container.theme_manager if self._container else None
         if theme_mgr:
-            theme_mgr.theme_changed.connect(self._sync_theme_combo)
+            theme_mgr.theme_changed.connect(
+                self._sync_theme_combo, Qt.ConnectionType.UniqueConnection
+            )
 
         if initial_collapsed:
-            for btn in self._buttons:
-                btn.setText("")
             self._theme_widget.hide()
 
         self._toggle_btn = QToolButton(self)
         self._toggle_btn.setToolButtonStyle(Qt.ToolButtonStyle.ToolButtonTextBesideIcon)
         self._toggle_btn.setIcon(
-            self.style().standardIcon(
+            _std_icon(
+                self,
                 QStyle.StandardPixmap.SP_ArrowLeft
                 if not initial_collapsed
-                else QStyle.StandardPixmap.SP_ArrowRight
+                else QStyle.StandardPixmap.SP_ArrowRight,
             )
         )
         self._toggle_btn.setText("Свернуть" if not initial_collapsed else "")
@@ -226,14 +251,47 @@ class CollapsibleSidebar(QFrame):
         self._toggle_btn.clicked.connect(self._toggle_collapsed)
         layout.addWidget(self._toggle_btn)
 
+    def _ensure_theme_row_built(self) -> None:
+        if self._theme_combo is not None:
+            return
+        theme_mgr = self._container.theme_manager if self._container else None
+        combo = QComboBox()
+        combo.addItems(["Тёмная", "Светлая"])
+        combo.setCurrentIndex(1 if (theme_mgr and theme_mgr.get_theme() == THEME_LIGHT) else 0)
+        combo.currentIndexChanged.connect(self._on_theme_changed)
+        self._theme_row_layout.addWidget(QLabel("Тема:"))
+        self._theme_row_layout.addWidget(combo)
+        self._theme_combo = combo
+
+    def showEvent(self, event: QShowEvent) -> None:
+        if not self._collapsed:
+            self._ensure_theme_row_built()
+        super().showEvent(event)
+
     def _set_sidebar_width(self, w: int) -> None:
         self.setMinimumWidth(w)
         self.setMaximumWidth(w)
 
+    def _on_nav_button_clicked(self) -> None:
+        # One slot for all nav buttons; the clicked button carries its tab id.
+        btn = self.sender()
+        if isinstance(btn, SidebarButton):
+            if btn.tab_id == self._current_tab:
+                # Re-click on the active tab: a checkable button just unchecked itself.
+                btn.setChecked(True)
+                return
+            self._on_nav_clicked(btn.tab_id)
+
     def _on_nav_clicked(self, tab_id: str) -> None:
+        if tab_id == self._current_tab:
+            return
+        self._check_tab(tab_id)
+        self.tab_changed.emit(tab_id)
+
+    def _check_tab(self, tab_id: str) -> None:
+        self._current_tab = tab_id
         for btn in self._buttons:
             btn.setChecked(btn.tab_id == tab_id)
-        self.tab_changed.emit(tab_id)
 
     def _toggle_collapsed(self) -> None:
         self.set_collapsed(not self._collapsed)
@@ -245,64 +303,74 @@ class CollapsibleSidebar(QFrame):
         if self._collapsed == collapsed:
             return
         self._collapsed = collapsed
-        target = SIDEBAR_WIDTH_COLLAPSED if collapsed else SIDEBAR_WIDTH_EXPANDED
-        current = self.width()
-
-        if (
-            self._animation is not None
-            and self._animation.state() == QPropertyAnimation.State.Running
-        ):
-            self._animation.stop()
-
-        self._animation = QPropertyAnimation(self, b"minimumWidth")
-        self._animation.setDuration(ANIMATION_DURATION_MS)
-        self._animation.setEasingCurve(QEasingCurve.Type.OutCubic)
-        self._animation.setStartValue(current)
-        self._animation.setEndValue(target)
-        self._animation.finished.connect(self._on_animation_finished)
-        self._animation.start()
-
-        anim_max = QPropertyAnimation(self, b"maximumWidth")
-        anim_max.setDuration(ANIMATION_DURATION_MS)
-        anim_max.setEasingCurve(QEasingCurve.Type.OutCubic)
-        anim_max.setStartValue(current)
-        anim_max.setEndValue(target)
-        anim_max.start()
-
-        self._update_toggle_button()
+        # Width changes relayout the whole window, so the width is set exactly once;
+        # only the contents' opacity is animated, which costs repaints, not layouts.
+        self.setUpdatesEnabled(False)
+        try:
+            self._set_sidebar_width(
+                SIDEBAR_WIDTH_COLLAPSED if collapsed else SIDEBAR_WIDTH_EXPANDED
+            )
+            for btn in self._buttons:
+                btn.set_collapsed(collapsed)
+            if not collapsed:
+                self._ensure_theme_row_built()
+            self._theme_widget.setVisible(not collapsed)
+            self._update_toggle_button()
+        finally:
+            self.setUpdatesEnabled(True)
+
+        anim = self._animation
+        if not self.isVisible():
+            # Nothing on screen to fade (startup, hidden or minimized window).
+            if anim is not None:
+                anim.stop()
+            self._on_animation_finished()
+            return
+        if anim is None or self._fade is None:
+            self._fade = QGraphicsOpacityEffect(self)
+            self.setGraphicsEffect(self._fade)
+            anim = self._animation = QPropertyAnimation(self._fade, b"opacity", self)
+            anim.setDuration(ANIMATION_DURATION_MS)
+            anim.setEasingCurve(QEasingCurve.Type.OutCubic)
+            anim.setStartValue(0.3)
+            anim.setEndValue(1.0)
+            anim.finished.connect(self._on_animation_finished)
+        else:
+            anim.stop()
+        self._fade.setEnabled(True)
+        anim.start()
 
     def _on_animation_finished(self) -> None:
-        self._set_sidebar_width(
-            SIDEBAR_WIDTH_COLLAPSED if self._collapsed else SIDEBAR_WIDTH_EXPANDED
-        )
-        for btn in self._buttons:
-            btn.setText(btn._label if not self._collapsed else "")
-        self._theme_widget.setVisible(not self._collapsed)
+        # Fully opaque again: drop the offscreen effect pass until the next toggle.
+        if self._fade is not None:
+            self._fade.setEnabled(False)
 
     def _on_theme_changed(self, index: int) -> None:
-        from app.ui.theme.manager import THEME_DARK, THEME_LIGHT
-
         theme_mgr = self._container.theme_manager if self._container else None
         if theme_mgr:
             theme_mgr.set_theme(THEME_LIGHT if index == 1 else THEME_DARK)
 
     def _sync_theme_combo(self, name: str) -> None:
-        from app.ui.theme.manager import THEME_LIGHT
-
-        self._theme_combo.blockSignals(True)
-        self._theme_combo.setCurrentIndex(1 if name == THEME_LIGHT else 0)
-        self._theme_combo.blockSignals(False)
+        combo = self._theme_combo
+        if combo is None:
+            return  # built later with the current theme preselected
+        index = 1 if name == THEME_LIGHT else 0
+        if combo.currentIndex() == index:
+            return
+        combo.blockSignals(True)
+        combo.setCurrentIndex(index)
+        combo.blockSignals(False)
 
     def _update_toggle_button(self) -> None:
         if self._collapsed:
-            self._toggle_btn.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_ArrowRight))
+            self._toggle_btn.setIcon(_std_icon(self, QStyle.StandardPixmap.SP_ArrowRight))
             self._toggle_btn.setText("")
             self._toggle_btn.setToolTip("Развернуть панель")
         else:
-            self._toggle_btn.setIcon(self.style().standardIcon(QStyle.StandardPixmap.SP_ArrowLeft))
+            self._toggle_btn.setIcon(_std_icon(self, QStyle.StandardPixmap.SP_ArrowLeft))
             self._toggle_btn.setText("Свернуть")
             self._toggle_btn.setToolTip("Свернуть панель")
 
     def set_current_tab(self, tab_id: str) -> None:
-        for btn in self._buttons:
-            btn.setChecked(btn.tab_id == tab_id)
+        if tab_id != self._current_tab:
+            self._check_tab(tab_id)
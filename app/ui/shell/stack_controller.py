@@ -43,6 +43,7 @@ TAB_IDS = (
     "jobs",
     "docs",
 )
+_TAB_INDEX: dict[str, int] = {tab_id: i for i, tab_id in enumerate(TAB_IDS)}
 
 
 def _placeholder_widget(title: str, subtitle: str = "") -> QWidget:
@@ -126,16 +127,29 @@ class StackController:
         self._factories.setdefault("training", lambda: create_components_demo_widget())
         self._created: set[str] = set()
         self._pending_create: set[str] = set()
-
-        for tab_id in TAB_IDS:
+        # Placeholders occupy indices 0..n-1 in TAB_IDS order. Only the first one is
+        # built before the window's first paint; the rest follow on the next tick
+        # (or earlier, on demand, via _ensure_placeholders).
+        self._placeholder_count = 0
+        self._add_placeholders(1)
+        QTimer.singleShot(0, self._ensure_placeholders)
+
+    def _add_placeholders(self, upto: int) -> None:
+        for tab_id in TAB_IDS[self._placeholder_count : upto]:
             placeholder = _placeholder_widget("Загрузка…", tab_id)
             placeholder.setObjectName(f"placeholder_{tab_id}")
             self._stack.addWidget(placeholder)
+        self._placeholder_count = max(self._placeholder_count, upto)
+
+    def _ensure_placeholders(self) -> None:
+        if self._placeholder_count < len(TAB_IDS):
+            self._add_placeholders(len(TAB_IDS))
 
     def switch_to(self, tab_id: str) -> None:
-        if tab_id not in TAB_IDS:
+        index = _TAB_INDEX.get(tab_id)
+        if index is None:
             return
-        index = TAB_IDS.index(tab_id)
+        self._ensure_placeholders()
         if tab_id not in self._created:
             self._schedule_create(tab_id)
         self._stack.setCurrentIndex(index)
@@ -149,7 +163,8 @@ class StackController:
             self._pending_create.discard(tab_id)
             if tab_id in self._created:
                 return
-            index = TAB_IDS.index(tab_id)
+            self._ensure_placeholders()
+            index = _TAB_INDEX[tab_id]
             factory = self._factories.get(tab_id) or (lambda: _default_factory(tab_id))
             try:
                 widget = factory()
@@ -157,10 +172,17 @@ class StackController:
                 tb_text = traceback.format_exc()
                 log.exception("Failed to create tab '%s'", tab_id)
                 widget = ErrorWidget(tab_id=tab_id, exc=exc, tb_text=tb_text)
+            was_current = self._stack.currentIndex() == index
             old_widget = self._stack.widget(index)
             self._stack.removeWidget(old_widget)
-            old_widget.deleteLater()
+            # Unparented, the placeholder is owned by its Python wrapper and is freed
+            # as soon as this function returns, not at the end of the event loop pass.
+            old_widget.setParent(None)
+            del old_widget
             self._stack.insertWidget(index, widget)
+            if was_current:
+                # removeWidget() moved the current index to a neighbour; restore it.
+                self._stack.setCurrentIndex(index)
             self._created.add(tab_id)
 
         # Defer heavy tab construction to next event-loop tick so switching tabs
@@ -169,11 +191,13 @@ class StackController:
 
     def preload_tabs(self, tab_ids: list[str], *, stagger_ms: int = 25) -> None:
         for idx, tab_id in enumerate(tab_ids):
-            if tab_id not in TAB_IDS or tab_id in self._created or tab_id in self._pending_create:
+            if (
+                tab_id not in _TAB_INDEX
+                or tab_id in self._created
+                or tab_id in self._pending_create
+            ):
                 continue
             QTimer.singleShot(max(0, idx * stagger_ms), lambda t=tab_id: self._schedule_create(t))
 
     def tab_index(self, tab_id: str) -> int:
-        if tab_id not in TAB_IDS:
-            return 0
-        return TAB_IDS.index(tab_id)
+        return _TAB_INDEX.get(tab_id, 0)
@@ -1,13 +1,47 @@
-"""Theme tokens and ThemeManager for Qt UI."""
+"""Theme tokens and ThemeManager for Qt UI.
 
-from app.ui.theme.manager import THEME_DARK, THEME_LIGHT, ThemeManager
-from app.ui.theme.tokens import Tokens, TokenSet, apply_token_set
+Tokens are plain Python and exported eagerly. ThemeManager pulls in QtWidgets, so it
+(and the theme name constants next to it) is only imported on first access; code that
+just reads ``app.ui.theme.tokens`` does not execute ``manager`` as a side effect.
+"""
+
+from __future__ import annotations
+
+import sys
+from importlib import import_module
+from typing import TYPE_CHECKING, Any
+
+from app.ui.theme.tokens import Tokens, TokenSet, apply_token_set, cached_style
+
+if TYPE_CHECKING:
+    from app.ui.theme.manager import THEME_DARK, THEME_LIGHT, ThemeManager
+
+_LAZY_IMPORTS: dict[str, str] = {
+    "ThemeManager": "app.ui.theme.manager",
+    "THEME_DARK": "app.ui.theme.manager",
+    "THEME_LIGHT": "app.ui.theme.manager",
+}
 
 __all__ = [
     "Tokens",
     "TokenSet",
     "apply_token_set",
+    "cached_style",
     "ThemeManager",
     "THEME_DARK",
     "THEME_LIGHT",
 ]
+
+
+def __getattr__(name: str) -> Any:
+    try:
+        module_name = _LAZY_IMPORTS[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(import_module(module_name), name)
+    setattr(sys.modules[__name__], name, value)
+    return value
+
+
+def __dir__() -> list[str]:
+    return sorted(set(globals()) | set(__all__))
@@ -4,13 +4,15 @@ ThemeManager: dark/light token sets, runtime switch, QPalette and application st
 
 from __future__ import annotations
 
+from functools import lru_cache
+from string import Template
 from typing import TYPE_CHECKING
 
 from PySide6.QtCore import QObject, Signal
 from PySide6.QtGui import QColor, QPalette
 from PySide6.QtWidgets import QApplication
 
-from app.ui.theme.tokens import DARK, LIGHT, TokenSet, apply_token_set
+from app.ui.theme.tokens import DARK, LIGHT, TokenSet, active_token_set, apply_token_set
 
 if TYPE_CHECKING:
     from app.ui.infrastructure.settings import AppSettings
@@ -19,6 +21,34 @@ THEME_DARK = "dark"
 THEME_LIGHT = "light"
 
 
+def _palette_colors(t: TokenSet) -> dict[QPalette.ColorRole, QColor]:
+    return {
+        QPalette.ColorRole.Window: QColor(t.background_main),
+        QPalette.ColorRole.Base: QColor(t.surface),
+        QPalette.ColorRole.Button: QColor(t.surface_hover),
+        QPalette.ColorRole.WindowText: QColor(t.text_primary),
+        QPalette.ColorRole.ButtonText: QColor(t.text_primary),
+        QPalette.ColorRole.Text: QColor(t.text_primary),
+        QPalette.ColorRole.Highlight: QColor(t.primary),
+        QPalette.ColorRole.HighlightedText: QColor("#ffffff"),
+        QPalette.ColorRole.PlaceholderText: QColor(t.text_secondary),
+    }
+
+
+def _make_palette(colors: dict[QPalette.ColorRole, QColor]) -> QPalette:
+    pal = QPalette()
+    for role, color in colors.items():
+        pal.setColor(role, color)
+    return pal
+
+
+# Parsed once at import; each ThemeManager turns them into its cached QPalettes.
+_PALETTES: dict[str, dict[QPalette.ColorRole, QColor]] = {
+    THEME_DARK: _palette_colors(DARK),
+    THEME_LIGHT: _palette_colors(LIGHT),
+}
+
+
 class ThemeManager(QObject):
     """
     Manages current theme: tokens, QPalette, global stylesheet; emits theme_changed.
@@ -31,6 +61,10 @@ class ThemeManager(QObject):
         super().__init__()
         self._settings = settings
         self._current = THEME_DARK
+        # Both palettes are built once; a theme switch just hands one to the app.
+        self._palettes: dict[str, QPalette] = {
+            name: _make_palette(colors) for name, colors in _PALETTES.items()
+        }
 
     def get_theme(self) -> str:
         return self._current
@@ -51,146 +85,150 @@ class ThemeManager(QObject):
         self.theme_changed.emit(name)
 
     def tokens(self) -> TokenSet:
-        """Current token set (same object as theme.tokens.Tokens, already updated)."""
-        from app.ui.theme.tokens import Tokens
-
-        return Tokens
+        """Active token set (DARK or LIGHT); theme.tokens.Tokens holds the same values."""
+        return active_token_set()
 
     def _apply_palette(self, t: TokenSet) -> None:
         app = QApplication.instance()
         if not app:
             return
-        pal = QPalette()
-        pal.setColor(QPalette.ColorRole.Window, QColor(t.background_main))
-        pal.setColor(QPalette.ColorRole.Base, QColor(t.surface))
-        pal.setColor(QPalette.ColorRole.Button, QColor(t.surface_hover))
-        pal.setColor(QPalette.ColorRole.WindowText, QColor(t.text_primary))
-        pal.setColor(QPalette.ColorRole.ButtonText, QColor(t.text_primary))
-        pal.setColor(QPalette.ColorRole.Text, QColor(t.text_primary))
-        pal.setColor(QPalette.ColorRole.Highlight, QColor(t.primary))
-        pal.setColor(QPalette.ColorRole.HighlightedText, QColor("#ffffff"))
-        pal.setColor(QPalette.ColorRole.PlaceholderText, QColor(t.text_secondary))
+        pal = self._palettes.get(self._current)
+        if pal is None:
+            pal = _make_palette(_palette_colors(t))
         app.setPalette(pal)
 
     def _apply_stylesheet(self, t: TokenSet) -> None:
         app = QApplication.instance()
         if not app:
             return
-        sheet = _build_application_stylesheet(t)
-        app.setStyleSheet(sheet)
+        app.setStyleSheet(_stylesheet_for(t))
 
 
-def _build_application_stylesheet(t: TokenSet) -> str:
-    """Single global stylesheet so all screens update when theme changes."""
-    return f"""
-        QWidget, QMainWindow {{
-            background-color: {t.background_main};
-            color: {t.text_primary};
-        }}
-        QGroupBox {{
+def _stylesheet_for(t: TokenSet) -> str:
+    """Application stylesheet for t; built once per distinct set of token values."""
+    return _cached_stylesheet(tuple(getattr(t, key) for key in TokenSet.__slots__))
+
+
+@lru_cache(maxsize=4)
+def _cached_stylesheet(values: tuple[str | int, ...]) -> str:
+    return _build_application_stylesheet(TokenSet(**dict(zip(TokenSet.__slots__, values))))
+
+
+# Global stylesheet with ${token} placeholders; parsed once, substituted per theme.
+_SHEET_TEMPLATE = Template("""
+        QWidget, QMainWindow {
+            background-color: ${background_main};
+            color: ${text_primary};
+        }
+        QGroupBox {
             font-weight: bold;
-            color: {t.text_primary};
-        }}
-        QLineEdit, QComboBox {{
-            background-color: {t.surface};
-            color: {t.text_primary};
-            border: 1px solid {t.border};
-            border-radius: {t.radius_sm}px;
+            color: ${text_primary};
+        }
+        QLineEdit, QComboBox {
+            background-color: ${surface};
+            color: ${text_primary};
+            border: 1px solid ${border};
+            border-radius: ${radius_sm}px;
             padding: 4px 6px;
             min-height: 24px;
-        }}
-        QSpinBox {{
-            background-color: {t.surface};
-            color: {t.text_primary};
-            border: 1px solid {t.border};
-            border-radius: {t.radius_sm}px;
+        }
+        QSpinBox {
+            background-color: ${surface};
+            color: ${text_primary};
+            border: 1px solid ${border};
+            border-radius: ${radius_sm}px;
             padding: 4px 6px;
             min-height: 24px;
             min-width: 80px;
-        }}
-        QSpinBox::up-button, QSpinBox::down-button {{
+        }
+        QSpinBox::up-button, QSpinBox::down-button {
             subcontrol-origin: border;
             subcontrol-position: top right;
             width: 16px;
-            border-left: 1px solid {t.border};
-            background: {t.surface_hover};
-        }}
-        QSpinBox::down-button {{
+            border-left: 1px solid ${border};
+            background: ${surface_hover};
+        }
+        QSpinBox::down-button {
             subcontrol-position: bottom right;
-        }}
-        QSpinBox::up-button:hover, QSpinBox::down-button:hover {{
-            background: {t.border};
-        }}
-        QPushButton {{
-            background-color: {t.surface_hover};
-            color: {t.text_primary};
-            border: {t.border_width}px solid {t.border};
-            border-radius: {t.radius_md}px;
-            padding: {t.space_sm}px {t.space_lg}px;
+        }
+        QSpinBox::up-button:hover, QSpinBox::down-button:hover {
+            background: ${border};
+        }
+        QPushButton {
+            background-color: ${surface_hover};
+            color: ${text_primary};
+            border: ${border_width}px solid ${border};
+            border-radius: ${radius_md}px;
+            padding: ${space_sm}px ${space_lg}px;
             min-height: 36px;
-        }}
-        QPushButton:hover {{
-            background-color: {t.border};
-        }}
-        #primaryButton {{
-            background-color: {t.primary};
+        }
+        QPushButton:hover {
+            background-color: ${border};
+        }
+        #primaryButton {
+            background-color: ${primary};
             color: white;
             border: none;
-            border-radius: {t.radius_md}px;
-            padding: {t.space_sm}px {t.space_lg}px;
+            border-radius: ${radius_md}px;
+            padding: ${space_sm}px ${space_lg}px;
             font-weight: 600;
-        }}
-        #primaryButton:hover {{
-            background-color: {t.primary_hover};
-        }}
-        #primaryButton:disabled {{
-            background-color: {t.surface_hover};
-            color: {t.text_secondary};
-        }}
-        #secondaryButton {{
-            background-color: {t.surface_hover};
-            color: {t.text_primary};
-            border: {t.border_width}px solid {t.border};
-            border-radius: {t.radius_md}px;
-            padding: {t.space_sm}px {t.space_lg}px;
-        }}
-        #secondaryButton:hover {{
-            background-color: {t.border};
-        }}
-        #secondaryButton:disabled {{
-            color: {t.text_secondary};
-        }}
-        QScrollArea {{
+        }
+        #primaryButton:hover {
+            background-color: ${primary_hover};
+        }
+        #primaryButton:disabled {
+            background-color: ${surface_hover};
+            color: ${text_secondary};
+        }
+        #secondaryButton {
+            background-color: ${surface_hover};
+            color: ${text_primary};
+            border: ${border_width}px solid ${border};
+            border-radius: ${radius_md}px;
+            padding: ${space_sm}px ${space_lg}px;
+        }
+        #secondaryButton:hover {
+            background-color: ${border};
+        }
+        #secondaryButton:disabled {
+            color: ${text_secondary};
+        }
+        QScrollArea {
             background: transparent;
             border: none;
-        }}
-        QProgressBar {{
-            border: 1px solid {t.border};
-            border-radius: {t.radius_sm}px;
+        }
+        QProgressBar {
+            border: 1px solid ${border};
+            border-radius: ${radius_sm}px;
             text-align: center;
-        }}
-        QProgressBar::chunk {{
-            background: {t.primary};
+        }
+        QProgressBar::chunk {
+            background: ${primary};
             border-radius: 4px;
-        }}
-        QListView {{
+        }
+        QListView {
             font-family: Consolas;
             font-size: 12px;
-            background: {t.surface_hover};
-            border-radius: {t.radius_sm}px;
-            color: {t.text_primary};
-        }}
-        QPlainTextEdit {{
-            background: {t.surface_hover};
-            color: {t.text_primary};
-            border-radius: {t.radius_sm}px;
-        }}
-        QLabel {{
-            color: {t.text_primary};
-        }}
-        #card {{
-            background-color: {t.surface};
-            border: {t.border_width}px solid {t.border};
-            border-radius: {t.radius_lg}px;
-        }}
-    """
+            background: ${surface_hover};
+            border-radius: ${radius_sm}px;
+            color: ${text_primary};
+        }
+        QPlainTextEdit {
+            background: ${surface_hover};
+            color: ${text_primary};
+            border-radius: ${radius_sm}px;
+        }
+        QLabel {
+            color: ${text_primary};
+        }
+        #card {
+            background-color: ${surface};
+            border: ${border_width}px solid ${border};
+            border-radius: ${radius_lg}px;
+        }
+    """)
+
+
+def _build_application_stylesheet(t: TokenSet) -> str:
+    """Single global stylesheet so all screens update when theme changes."""
+    return _SHEET_TEMPLATE.substitute({key: getattr(t, key) for key in TokenSet.__slots__})
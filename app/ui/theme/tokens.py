@@ -4,6 +4,9 @@ Design tokens: colors, spacing, radius. TokenSet per theme; current set updated
 
 from __future__ import annotations
 
+from collections.abc import Callable
+from typing import Any
+
 
 class TokenSet:
     """Immutable-like set of design tokens. ThemeManager copies dark/light into current."""
@@ -85,6 +88,22 @@ class TokenSet:
             setattr(target, key, getattr(self, key))
 
 
+def _compile_copy_into() -> Callable[[TokenSet, TokenSet], None]:
+    """Build copy_into as straight-line attribute assignments (one per slot)."""
+    body = "".join(f"    target.{key} = self.{key}\n" for key in TokenSet.__slots__)
+    namespace: dict[str, Any] = {}
+    exec(f"def copy_into(self, target):\n{body}", namespace)
+    fn = namespace["copy_into"]
+    fn.__doc__ = TokenSet.copy_into.__doc__
+    fn.__qualname__ = TokenSet.copy_into.__qualname__
+    fn.__module__ = __name__
+    return fn  # type: ignore[no-any-return]
+
+
+# The loop above documents the behaviour; the unrolled version runs on theme switches.
+TokenSet.copy_into = _compile_copy_into()  # type: ignore[method-assign]
+
+
 # Predefined palettes
 DARK = TokenSet(
     background_main="#1a1b26",
@@ -135,10 +154,35 @@ LIGHT = TokenSet(
 )
 
 # Current tokens: mutable, updated by ThemeManager. Components use Tokens.primary etc.
+# Many modules bind it via `from ... import Tokens`, so it is updated in place rather
+# than rebound; _active tracks which palette it currently mirrors.
 Tokens: TokenSet = TokenSet()
 DARK.copy_into(Tokens)
+_active: TokenSet = DARK
+
+
+# Resolved per-component stylesheets for the current Tokens; cleared on theme switch.
+_STYLE_CACHE: dict[str, str] = {}
+
+
+def cached_style(key: str, build: Callable[[TokenSet], str]) -> str:
+    """Return build(Tokens), memoized under key until the next apply_token_set()."""
+    sheet = _STYLE_CACHE.get(key)
+    if sheet is None:
+        sheet = _STYLE_CACHE[key] = build(Tokens)
+    return sheet
+
+
+def active_token_set() -> TokenSet:
+    """The palette Tokens currently mirrors (DARK, LIGHT or the last applied set)."""
+    return _active
 
 
 def apply_token_set(source: TokenSet) -> None:
     """Set current Tokens from source. Called by ThemeManager."""
+    global _active
+    if source is _active:
+        return
     source.copy_into(Tokens)
+    _active = source
+    _STYLE_CACHE.clear()
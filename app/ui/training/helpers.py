@@ -1,43 +1,63 @@
 """Вспомогательные функции вкладки «Обучение» (SOLID: чистые функции, тестируемы)."""
 
+import os
+import stat
 from pathlib import Path
-from time import monotonic
 
-# Кэш результатов scan_trained_weights на 3 с, чтобы не сканировать диск при каждом открытии меню
-_CACHE_SCAN: tuple[float, Path, list[tuple[str, Path]]] | None = None
-_CACHE_TTL_S = 3.0
+# Кэш scan_trained_weights: (project_root, mtime runs/train, результат, run-папки без best.pt).
+# Пока mtime каталога не меняется, список run-папок тот же, и проверять нужно только
+# незавершённые запуски (best.pt появляется в конце обучения).
+_CACHE_SCAN: tuple[Path, int, tuple[tuple[str, Path], ...], tuple[Path, ...]] | None = None
 
 
-def scan_trained_weights(project_root: Path) -> list[tuple[str, Path]]:
-    """Находит runs/train/*/weights/best.pt и возвращает [(подпись_для_UI, путь)].
+def _weights_entry(project_root: Path, best: Path) -> tuple[str, Path]:
+    try:
+        rel = best.relative_to(project_root)
+    except ValueError:
+        rel = best
+    return (f"Наша: {rel}", best)
 
-    Результат кэшируется на несколько секунд, чтобы снизить число обращений к ФС
-    при частом открытии выпадающего списка моделей.
+
+def scan_trained_weights(project_root: Path) -> tuple[tuple[str, Path], ...]:
+    """Находит runs/train/*/weights/best.pt и возвращает ((подпись_для_UI, путь), ...).
+
+    Результат кэшируется по mtime каталога runs/train: пока в нём не появились и не
+    исчезли run-папки, диск не сканируется заново — проверяются только запуски,
+    у которых best.pt ещё не было.
 
     Args:
         project_root: Корень проекта (каталог с runs/).
 
     Returns:
-        Список пар (отображаемая подпись, абсолютный путь к best.pt).
+        Кортеж пар (отображаемая подпись, путь к best.pt внутри project_root).
     """
     global _CACHE_SCAN
-    now = monotonic()
+    train_dir = project_root / "runs" / "train"
+    try:
+        st = train_dir.stat()
+    except OSError:
+        st = None
+    mtime = st.st_mtime_ns if st is not None and stat.S_ISDIR(st.st_mode) else 0
     if _CACHE_SCAN is not None:
-        cached_at, cached_root, result = _CACHE_SCAN
-        if cached_root == project_root and (now - cached_at) < _CACHE_TTL_S:
-            return result
+        cached_root, cached_mtime, result, pending = _CACHE_SCAN
+        if cached_root == project_root and cached_mtime == mtime:
+            if not any((run_dir / "weights" / "best.pt").is_file() for run_dir in pending):
+                return result
     out: list[tuple[str, Path]] = []
-    train_dir = project_root / "runs" / "train"
-    if train_dir.is_dir():
-        for run_dir in train_dir.iterdir():
-            if not run_dir.is_dir():
-                continue
-            best = run_dir / "weights" / "best.pt"
-            if best.exists():
-                try:
-                    rel = best.relative_to(project_root)
-                except ValueError:
-                    rel = best
-                out.append((f"Наша: {rel}", best.resolve()))
-    _CACHE_SCAN = (now, project_root, out)
-    return out
+    incomplete: list[Path] = []
+    if mtime:
+        # One directory read; DirEntry.is_dir() uses the cached d_type, so each run
+        # costs a single stat of its best.pt. Paths are resolved lazily on selection.
+        with os.scandir(train_dir) as entries:
+            for entry in entries:
+                if not entry.is_dir():
+                    continue
+                run_dir = train_dir / entry.name
+                best = run_dir / "weights" / "best.pt"
+                if best.is_file():
+                    out.append(_weights_entry(project_root, best))
+                else:
+                    incomplete.append(run_dir)
+    result = tuple(out)
+    _CACHE_SCAN = (project_root, mtime, result, tuple(incomplete))
+    return result
@@ -1,11 +1,18 @@
 from __future__ import annotations
 
 import json
+import multiprocessing
 import os
-from collections import Counter
+import shutil
+import tempfile
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from itertools import repeat
 from pathlib import Path
-import xml.etree.ElementTree as ET
+from xml.sax.saxutils import escape
 
+import numpy as np
+from PySide6.QtCore import QThread, QTimer, Signal
 from PySide6.QtWidgets import (
     QCheckBox,
     QComboBox,
@@ -19,14 +26,290 @@ from PySide6.QtWidgets import (
     QMessageBox,
     QProgressBar,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QSpinBox,
+    QTableView,
     QTextEdit,
     QVBoxLayout,
     QWidget,
 )
 
-from app.ui.components.model_utils import make_best_model_checkbox
+try:
+    import orjson  # type: ignore
+except ImportError:
+    orjson = None  # type: ignore
+
+from app.ui.components.model_utils import ModelCache, make_best_model_checkbox, prefetch_images
+from app.ui.components.rows_model import RowsTableModel
+
+_WRITE_BUFFER = 1 << 20
+# Progress bar and log are repainted at most this often while a run is active.
+UI_REFRESH_MS = 100
+_VOC_ANNOTATION = "<annotation><filename>{}</filename>{}</annotation>"
+_VOC_OBJECT = (
+    "<object><name>{}</name><bndbox><xmin>{}</xmin><ymin>{}</ymin>"
+    "<xmax>{}</xmax><ymax>{}</ymax></bndbox></object>"
+)
+_json_dumps = partial(json.dumps, ensure_ascii=False, separators=(",", ":"))
+
+
+def _dumps(obj) -> bytes:
+    """Compact UTF-8 JSON; uses orjson when it is installed."""
+    if orjson is not None:
+        return orjson.dumps(obj)
+    return _json_dumps(obj).encode("utf-8")
+
+
+_IMAGE_EXTS = frozenset(("jpg", "jpeg", "png", "bmp"))
+
+
+def _list_images(folder: Path) -> list[Path]:
+    # scandir's DirEntry carries the file type, so filtering needs no extra stat calls.
+    with os.scandir(folder) as it:
+        return [
+            Path(e.path)
+            for e in it
+            if e.name.rpartition(".")[2].lower() in _IMAGE_EXTS and e.is_file()
+        ]
+
+
+_NO_BOXES = (np.empty((0, 4), dtype=np.float32), [], [])
+
+# Model loaded once per pool process by _init_predict_process.
+_process_model = None
+
+
+def _init_predict_process(weights: str, threads: int) -> None:
+    global _process_model
+    import torch
+    from ultralytics import YOLO
+
+    # Each process gets its share of the cores instead of every process
+    # spawning a full-width intra-op pool and oversubscribing the CPU.
+    torch.set_num_threads(threads)
+    _process_model = YOLO(weights)
+
+
+def _predict_batch(model, sources: list, cfg: dict) -> list[tuple]:
+    """Predict one batch of paths or decoded BGR arrays.
+
+    Returns (orig_shape, kept, names) per image, in order. kept is structure-of-arrays: (xyxy (N, 4) float array, class ids, confidences).
+    """
+    # One predict call per batch lets the model batch preprocessing and
+    # inference; stream=True yields results without holding the whole batch.
+    results = model.predict(
+        sources,
+        conf=cfg["conf"],
+        iou=cfg["iou"],
+        batch=cfg["batch"],
+        verbose=False,
+        stream=True,
+    )
+    out = []
+    for r in results:
+        kept = _NO_BOXES
+        boxes = r.boxes
+        if boxes is not None and len(boxes):
+            # predict(conf=...) already drops low-confidence boxes; the extra
+            # filter is a mask on the device tensor, not a Python loop.
+            if cfg["only"]:
+                boxes = boxes[boxes.conf >= cfg["conf"]]
+            # data is (x1, y1, x2, y2, [track_id,] conf, cls): one device sync.
+            data = boxes.data.cpu().numpy()
+            kept = (data[:, :4], data[:, -1].astype(np.int64).tolist(), data[:, -2].tolist())
+        out.append((r.orig_shape, kept, r.names))
+    return out
+
+
+def _predict_batch_in_process(paths: list[str], cfg: dict) -> list[tuple]:
+    return _predict_batch(_process_model, paths, cfg)
+
+
+class _CocoWriter:
+    """Streams a COCO JSON file instead of building the whole dict in memory.
+
+    Images are written to the target as they arrive; annotations go to a temporary
+    spool that is appended on close(), since COCO keeps them in a separate array.
+    """
+
+    def __init__(self, path: Path) -> None:
+        self._path = path
+        self._f = open(path, "wb", buffering=_WRITE_BUFFER)
+        self._spool = tempfile.TemporaryFile("w+b", buffering=_WRITE_BUFFER)
+        self._images = 0
+        self._annotations = 0
+        self._categories: list[dict] | None = None
+        self._f.write(b'{"images":[')
+
+    def add(self, file_name: str, kept, names) -> None:
+        self._images += 1
+        image_id = self._images
+        if image_id > 1:
+            self._f.write(b",")
+        self._f.write(_dumps({"id": image_id, "file_name": file_name}))
+        spool = self._spool
+        xyxy, cls_ids, confs = kept
+        # COCO boxes are x, y, w, h: one array op for all boxes of the image.
+        bboxes = np.hstack((xyxy[:, :2], xyxy[:, 2:] - xyxy[:, :2])).tolist()
+        for bbox, c, conf in zip(bboxes, cls_ids, confs):
+            self._annotations += 1
+            if self._annotations > 1:
+                spool.write(b",")
+            spool.write(
+                _dumps(
+                    {
+                        "id": self._annotations,
+                        "image_id": image_id,
+                        "category_id": c,
+                        "bbox": bbox,
+                        "score": conf,
+                    }
+                )
+            )
+        if self._categories is None:
+            self._categories = [{"id": int(i), "name": n} for i, n in names.items()]
+
+    def close(self) -> None:
+        f = self._f
+        f.write(b'],"annotations":[')
+        self._spool.seek(0)
+        shutil.copyfileobj(self._spool, f, _WRITE_BUFFER)
+        f.write(b'],"categories":')
+        f.write(_dumps(self._categories or []))
+        f.write(b"}")
+        f.close()
+        self._spool.close()
+
+    def abort(self) -> None:
+        self._f.close()
+        self._spool.close()
+        self._path.unlink(missing_ok=True)
+
+
+class AnnotateWorker(QThread):
+    """Runs predict + annotation writing off the GUI thread.
+
+    With cfg["procs"] > 1 the batches are predicted by a process pool; results are
+    consumed in submission order, so output files and numbering do not change.
+    Progress and log lines are reported once per predict batch, not per image.
+    """
+
+    progress = Signal(int, str)
+    done = Signal(list, dict)
+    failed = Signal(str)
+
+    def __init__(self, cfg: dict, models: ModelCache):
+        super().__init__()
+        self._cfg = cfg
+        self._models = models
+        # Escaped class names for the VOC writer, filled from the first result.
+        self._voc_names: list[str] = []
+
+    def run(self) -> None:
+        pool = None
+        coco = None
+        try:
+            cfg = self._cfg
+            inp = Path(cfg["inp"])
+            out = Path(cfg["out"])
+            out.mkdir(parents=True, exist_ok=True)
+            imgs = _list_images(inp)
+            batch = cfg["batch"]
+            chunks = [imgs[s : s + batch] for s in range(0, len(imgs), batch)]
+            paths = ([str(p) for p in chunk] for chunk in chunks)
+            procs = min(cfg["procs"], len(chunks))
+            if procs > 1:
+                threads = max(1, (os.cpu_count() or 1) // procs)
+                # spawn: forking a process that runs Qt and torch threads is unsafe.
+                pool = ProcessPoolExecutor(
+                    procs,
+                    mp_context=multiprocessing.get_context("spawn"),
+                    initializer=_init_predict_process,
+                    initargs=(cfg["weights"], threads),
+                )
+                predictions = pool.map(_predict_batch_in_process, paths, repeat(cfg))
+            else:
+                model = self._models.get(cfg["weights"])
+                # The next batches are read and decoded while the current one is predicted.
+                predictions = (_predict_batch(model, b, cfg) for b in prefetch_images(paths))
+            if cfg["fmt"] == "COCO JSON":
+                coco = _CocoWriter(out / "annotations.json")
+            # Per-class box totals indexed by class id; sized on the first result.
+            totals = None
+            rows = []
+            i = 0
+            for chunk, preds in zip(chunks, predictions):
+                if self.isInterruptionRequested():
+                    return
+                lines = []
+                for img, (shape, kept, names) in zip(chunk, preds):
+                    i += 1
+                    cls_ids = kept[1]
+                    if totals is None:
+                        # The model's classes are fixed for the run: index them once.
+                        names_arr = np.array([names[c] for c in range(len(names))], dtype=object)
+                        self._voc_names = [escape(n) for n in names_arr.tolist()]
+                        totals = np.zeros(len(names_arr), dtype=np.int64)
+                    counts = np.bincount(cls_ids, minlength=len(totals))
+                    totals += counts
+                    self._save_format(out, img, shape, kept, names, coco)
+                    present = sorted(names_arr[np.flatnonzero(counts)].tolist())
+                    rows.append([img.name, len(cls_ids), ",".join(present)])
+                    lines.append(f"{img.name}: {len(cls_ids)} objects")
+                self.progress.emit(int(i / max(1, len(imgs)) * 100), "\n".join(lines))
+            if coco is not None:
+                coco.close()
+                coco = None
+            total = 0
+            per_class = {}
+            if totals is not None:
+                total = int(totals.sum())
+                nz = np.flatnonzero(totals)
+                per_class = dict(zip(names_arr[nz].tolist(), totals[nz].tolist()))
+            stats = {
+                "total_images": len(imgs),
+                "total_annotations": total,
+                "per_class": per_class,
+            }
+            self.done.emit(rows, stats)
+        except Exception as e:
+            self.failed.emit(str(e))
+        finally:
+            if coco is not None:
+                # Interrupted or failed: do not leave a truncated annotations.json behind.
+                coco.abort()
+            if pool is not None:
+                pool.shutdown(wait=True, cancel_futures=True)
+
+    def _save_format(self, out, img, shape, kept, names, coco):
+        fmt = self._cfg["fmt"]
+        if fmt == "YOLO TXT":
+            # shape is the (h, w) the model already decoded; no need to re-read the image.
+            h, w = shape[:2]
+            xyxy, cls_ids, _ = kept
+            xyxy = xyxy.astype(np.float64)
+            # xyxy -> normalised cx, cy, w, h for all boxes at once.
+            cxcywh = np.empty_like(xyxy)
+            cxcywh[:, 0] = (xyxy[:, 0] + xyxy[:, 2]) / (2 * w)
+            cxcywh[:, 1] = (xyxy[:, 1] + xyxy[:, 3]) / (2 * h)
+            cxcywh[:, 2] = (xyxy[:, 2] - xyxy[:, 0]) / w
+            cxcywh[:, 3] = (xyxy[:, 3] - xyxy[:, 1]) / h
+            lines = [
+                f"{c} {x:.6f} {y:.6f} {bx:.6f} {by:.6f}"
+                for c, (x, y, bx, by) in zip(cls_ids, cxcywh.tolist())
+            ]
+            (out / f"{img.stem}.txt").write_text("\n".join(lines), encoding="utf-8")
+        elif fmt == "Pascal VOC XML":
+            # Same bytes ElementTree produced, without building a tree per image.
+            xyxy, cls_ids, _ = kept
+            # astype truncates toward zero like the int() casts it replaces.
+            objects = "".join(
+                _VOC_OBJECT.format(self._voc_names[c], *box)
+                for box, c in zip(xyxy.astype(np.int64).tolist(), cls_ids)
+            )
+            xml = _VOC_ANNOTATION.format(escape(img.name), objects)
+            (out / f"{img.stem}.xml").write_bytes(xml.encode("utf-8"))
+        else:
+            coco.add(img.name, kept, names)
 
 
 class AutoAnnotationView(QWidget):
@@ -35,6 +318,13 @@ class AutoAnnotationView(QWidget):
         self._container = container
         self._rows = []
         self._stats = {}
+        self._worker: AnnotateWorker | None = None
+        self._model_cache = ModelCache()
+        self._pending_pct: int | None = None
+        self._pending_log: list[str] = []
+        self._ui_timer = QTimer(self)
+        self._ui_timer.setInterval(UI_REFRESH_MS)
+        self._ui_timer.timeout.connect(self._refresh_ui)
         self._build()
 
     def _build(self):
@@ -83,12 +373,22 @@ class AutoAnnotationView(QWidget):
         self._iou = QDoubleSpinBox()
         self._iou.setRange(0, 1)
         self._iou.setValue(0.45)
+        self._batch = QSpinBox()
+        self._batch.setRange(1, 64)
+        self._batch.setValue(8)
+        self._batch.setToolTip("Сколько изображений передавать в модель за один вызов")
+        self._procs = QSpinBox()
+        self._procs.setRange(1, os.cpu_count() or 1)
+        self._procs.setValue(1)
+        self._procs.setToolTip("Число процессов инференса (каждый загружает свою копию модели)")
         self._only = QCheckBox("Сохранять только уверенные")
         self._fmt = QComboBox()
         self._fmt.addItems(["YOLO TXT", "COCO JSON", "Pascal VOC XML"])
         self._fmt.setToolTip("Формат выходных аннотаций")
         f.addRow("Conf:", self._conf)
         f.addRow("IOU:", self._iou)
+        f.addRow("Batch:", self._batch)
+        f.addRow("Процессы:", self._procs)
         f.addRow(self._only)
         f.addRow("Формат:", self._fmt)
         root.addWidget(g)
@@ -98,8 +398,9 @@ class AutoAnnotationView(QWidget):
         root.addWidget(self._run)
         self._prog = QProgressBar()
         root.addWidget(self._prog)
-        self._table = QTableWidget(0, 3)
-        self._table.setHorizontalHeaderLabels(["filename", "objects_found", "classes"])
+        self._model = RowsTableModel(["filename", "objects_found", "classes"], parent=self)
+        self._table = QTableView()
+        self._table.setModel(self._model)
         root.addWidget(self._table, 1)
         self._open = QPushButton("Открыть папку результатов")
         self._open.clicked.connect(self._open_dir)
@@ -127,92 +428,70 @@ class AutoAnnotationView(QWidget):
             self._w.setText(p)
 
     def _run_job(self):
-        try:
-            from ultralytics import YOLO
+        if self._worker is not None and self._worker.isRunning():
+            return
+        cfg = {
+            "inp": self._inp.text(),
+            "out": self._out.text(),
+            "weights": self._w.text(),
+            "conf": self._conf.value(),
+            "iou": self._iou.value(),
+            "batch": self._batch.value(),
+            "procs": self._procs.value(),
+            "only": self._only.isChecked(),
+            "fmt": self._fmt.currentText(),
+        }
+        self._rows = []
+        self._prog.setValue(0)
+        self._run.setEnabled(False)
+        self._worker = AnnotateWorker(cfg, self._model_cache)
+        self._worker.progress.connect(self._on_progress)
+        self._worker.done.connect(self._on_done)
+        self._worker.failed.connect(self._on_failed)
+        self._worker.finished.connect(self._on_stopped)
+        self._ui_timer.start()
+        self._worker.start()
 
-            inp = Path(self._inp.text())
-            out = Path(self._out.text())
-            out.mkdir(parents=True, exist_ok=True)
-            model = YOLO(self._w.text())
-            imgs = [p for p in inp.iterdir() if p.suffix.lower() in {".jpg", ".jpeg", ".png", ".bmp"}]
-            coco = {"images": [], "annotations": [], "categories": []}
-            ann_id = 1
-            cls_counts = Counter()
-            self._rows = []
-            for i, img in enumerate(imgs, 1):
-                r = model.predict(str(img), conf=self._conf.value(), iou=self._iou.value(), verbose=False)[0]
-                names = r.names
-                boxes = r.boxes.xyxy.cpu().numpy() if r.boxes is not None else []
-                cls = r.boxes.cls.int().cpu().tolist() if r.boxes is not None else []
-                confs = r.boxes.conf.cpu().numpy().tolist() if r.boxes is not None else []
-                kept = []
-                for bi, b in enumerate(boxes):
-                    if self._only.isChecked() and confs[bi] < self._conf.value():
-                        continue
-                    kept.append((b, cls[bi], confs[bi]))
-                    cls_counts[names[cls[bi]]] += 1
-                self._save_format(out, img, kept, names, coco, ann_id)
-                ann_id += len(kept)
-                self._rows.append([img.name, len(kept), ",".join(sorted({names[c] for _, c, _ in kept}))])
-                self._prog.setValue(int(i / max(1, len(imgs)) * 100))
-                self._log.append(f"{img.name}: {len(kept)} objects")
-            if self._fmt.currentText() == "COCO JSON":
-                with open(out / "annotations.json", "w", encoding="utf-8") as f:
-                    json.dump(coco, f, ensure_ascii=False, indent=2)
-            self._render()
-            self._stats = {
-                "total_images": len(imgs),
-                "total_annotations": sum(cls_counts.values()),
-                "per_class": dict(cls_counts),
-            }
-            self._st.setText(f"Статистика: {self._stats}")
-        except Exception as e:
-            QMessageBox.critical(self, "Ошибка", str(e))
+    def _on_progress(self, pct: int, lines: str) -> None:
+        # Only record here; _refresh_ui paints on the timer.
+        self._pending_pct = pct
+        self._pending_log.append(lines)
 
-    def _save_format(self, out, img, kept, names, coco, ann_id):
-        fmt = self._fmt.currentText()
-        if fmt == "YOLO TXT":
-            lines = []
-            for (x1, y1, x2, y2), c, _ in kept:
-                import cv2
-
-                im = cv2.imread(str(img))
-                h, w = im.shape[:2]
-                cx, cy = (x1 + x2) / 2 / w, (y1 + y2) / 2 / h
-                bw, bh = (x2 - x1) / w, (y2 - y1) / h
-                lines.append(f"{c} {cx:.6f} {cy:.6f} {bw:.6f} {bh:.6f}")
-            (out / f"{img.stem}.txt").write_text("\n".join(lines), encoding="utf-8")
-        elif fmt == "Pascal VOC XML":
-            root = ET.Element("annotation")
-            ET.SubElement(root, "filename").text = img.name
-            for (x1, y1, x2, y2), c, _ in kept:
-                obj = ET.SubElement(root, "object")
-                ET.SubElement(obj, "name").text = names[c]
-                bb = ET.SubElement(obj, "bndbox")
-                for k, v in [("xmin", x1), ("ymin", y1), ("xmax", x2), ("ymax", y2)]:
-                    ET.SubElement(bb, k).text = str(int(v))
-            ET.ElementTree(root).write(out / f"{img.stem}.xml", encoding="utf-8")
-        else:
-            coco["images"].append({"id": len(coco["images"]) + 1, "file_name": img.name})
-            for (x1, y1, x2, y2), c, conf in kept:
-                coco["annotations"].append(
-                    {
-                        "id": ann_id,
-                        "image_id": len(coco["images"]),
-                        "category_id": int(c),
-                        "bbox": [float(x1), float(y1), float(x2 - x1), float(y2 - y1)],
-                        "score": float(conf),
-                    }
-                )
-            if not coco["categories"]:
-                coco["categories"] = [{"id": int(i), "name": n} for i, n in names.items()]
+    def _refresh_ui(self) -> None:
+        if self._pending_pct is not None:
+            self._prog.setValue(self._pending_pct)
+            self._pending_pct = None
+        if self._pending_log:
+            self._log.append("\n".join(self._pending_log))
+            self._pending_log.clear()
+
+    def _on_done(self, rows: list, stats: dict) -> None:
+        self._rows = rows
+        self._render()
+        self._stats = stats
+        self._st.setText(f"Статистика: {self._stats}")
+
+    def _on_failed(self, error: str) -> None:
+        QMessageBox.critical(self, "Ошибка", error)
+
+    def _on_stopped(self) -> None:
+        self._ui_timer.stop()
+        self._refresh_ui()
+        self._run.setEnabled(True)
 
     def _render(self):
-        self._table.setRowCount(len(self._rows))
-        for i, r in enumerate(self._rows):
-            for j, v in enumerate(r):
-                self._table.setItem(i, j, QTableWidgetItem(str(v)))
+        self._model.set_rows(self._rows)
 
     def _open_dir(self):
         if Path(self._out.text()).exists():
             os.startfile(self._out.text())
+
+    def shutdown(self) -> None:
+        worker = self._worker
+        if worker is not None and worker.isRunning():
+            worker.requestInterruption()
+            worker.wait()
+
+    def closeEvent(self, event) -> None:  # noqa: N802
+        self.shutdown()
+        super().closeEvent(event)
@@ -1,10 +1,13 @@
 from __future__ import annotations
 
 import csv
+import math
+import shutil
 import time
 from pathlib import Path
 
 import numpy as np
+from PySide6.QtCore import QThread, Signal
 from PySide6.QtGui import QColor
 from PySide6.QtWidgets import (
     QCheckBox,
@@ -18,21 +21,176 @@ from PySide6.QtWidgets import (
     QMessageBox,
     QPushButton,
     QSpinBox,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QTextEdit,
     QVBoxLayout,
     QWidget,
 )
 
+from app.ui.components.model_utils import ModelCache, make_best_model_checkbox
+from app.ui.components.rows_model import RowsTableModel
 
-from app.ui.components.model_utils import make_best_model_checkbox
+# Untimed predictions per format before measuring (cudnn autotune, lazy init).
+_WARMUP_ITERS = 5
+_TIMED_ITERS = 100
+
+
+# Where Ultralytics writes each export format, relative to the .pt file.
+_EXPORT_SUFFIXES = {
+    "onnx": ".onnx",
+    "engine": ".engine",
+    "torchscript": ".torchscript",
+    "openvino": "_openvino_model",
+}
+
+
+def _precision(half: bool, int8: bool) -> str:
+    return "int8" if int8 else "fp16" if half else "fp32"
+
+
+def _export_path(weights: Path, fmt: str, precision: str) -> Path:
+    """Precision-tagged location of an export, e.g. yolo11n_fp16.onnx.
+
+    Ultralytics names every precision the same; exports are renamed here so that an
+    fp16 file is never reused for an fp32 run.
+    """
+    return weights.with_name(f"{weights.stem}_{precision}{_EXPORT_SUFFIXES[fmt]}")
+
+
+def _existing_export(weights: Path, fmt: str, precision: str) -> Path | None:
+    """The export of weights in fmt if it already exists and is newer than weights."""
+    if fmt not in _EXPORT_SUFFIXES:
+        return None
+    path = _export_path(weights, fmt, precision)
+    try:
+        if path.stat().st_mtime_ns >= weights.stat().st_mtime_ns:
+            return path
+    except OSError:
+        pass
+    return None
+
+
+def _bench_input(size: int, device: str):
+    """One random image, already letterboxed and normalised: a (1, 3, size, size) tensor.
+
+    Feeding a preprocessed tensor keeps per-call CPU preprocessing (letterbox, HWC->CHW,
+    uint8->float) out of the measurement, which otherwise differs between formats.
+    """
+    import torch
+
+    x = np.random.randint(0, 255, (size, size, 3), dtype=np.uint8)
+    return torch.from_numpy(x).to(device).permute(2, 0, 1).unsqueeze(0).float().div(255)
+
+
+def _noop(*_args, **_kwargs) -> None:
+    return None
+
+
+def _time_predict(runner, x, imgsz: int, device: str) -> float:
+    """Mean seconds per predict over _TIMED_ITERS calls.
+
+    On CUDA the interval is taken with CUDA events plus a final synchronize, so queued
+    kernels are included. On CPU the loop's own call overhead (measured with a no-op
+    of the same signature) is subtracted from the wall-clock time.
+    """
+    if device.startswith("cuda"):
+        import torch
+
+        start = torch.cuda.Event(enable_timing=True)
+        end = torch.cuda.Event(enable_timing=True)
+        start.record()
+        for _ in range(_TIMED_ITERS):
+            runner.predict(x, imgsz=imgsz, device=device, verbose=False)
+        end.record()
+        torch.cuda.synchronize()
+        return start.elapsed_time(end) / 1000 / _TIMED_ITERS
+
+    t0 = time.perf_counter()
+    for _ in range(_TIMED_ITERS):
+        _noop(x, imgsz=imgsz, device=device, verbose=False)
+    baseline = time.perf_counter() - t0
+    t0 = time.perf_counter()
+    for _ in range(_TIMED_ITERS):
+        runner.predict(x, imgsz=imgsz, device=device, verbose=False)
+    return max(0.0, time.perf_counter() - t0 - baseline) / _TIMED_ITERS
+
+
+class BenchWorker(QThread):
+    """Exports and times each format off the GUI thread."""
+
+    log = Signal(str)
+    done = Signal(list)
+    failed = Signal(str)
+
+    def __init__(self, cfg: dict, models: ModelCache):
+        super().__init__()
+        self._cfg = cfg
+        self._models = models
+
+    def run(self) -> None:
+        try:
+            weights = self._cfg["weights"]
+            device = self._cfg["device"]
+            # Tensor inputs must match the model stride. Round up, as Ultralytics does for
+            # exports, and use the same size for the export, the input and every predict.
+            size = max(32, math.ceil(self._cfg["imgsz"] / 32) * 32)
+            precision = _precision(self._cfg["half"], self._cfg["int8"])
+            model = self._models.get(str(weights))
+            x = _bench_input(size, device)
+            rows = []
+            for fmt in self._cfg["formats"]:
+                if self.isInterruptionRequested():
+                    return
+                self.log.emit(f"Testing {fmt} on {device}")
+                path = weights
+                status = "ok"
+                runner = model
+                if fmt != "pt":
+                    status = f"ok ({precision})"
+                    try:
+                        path = _existing_export(weights, fmt, precision)
+                        if path is not None:
+                            self.log.emit(f"Reusing {path.name}")
+                        else:
+                            path = self._export(model, weights, fmt, precision, size)
+                        runner = self._models.get(str(path))
+                    except Exception as e:
+                        rows.append([fmt, 0.0, 0.0, 0.0, f"export fail: {e}"])
+                        continue
+
+                try:
+                    for _ in range(_WARMUP_ITERS):
+                        runner.predict(x, imgsz=size, device=device, verbose=False)
+                    dt = _time_predict(runner, x, size, device)
+                except Exception as e:
+                    rows.append([fmt, 0.0, 0.0, 0.0, f"run fail: {e}"])
+                    continue
+                fps = 1 / max(1e-6, dt)
+                size_mb = path.stat().st_size / 1024 / 1024 if path.exists() else 0.0
+                rows.append([fmt, fps, dt * 1000, size_mb, status])
+            self.done.emit(rows)
+        except Exception as e:
+            self.failed.emit(str(e))
+
+    def _export(self, model, weights: Path, fmt: str, precision: str, size: int) -> Path:
+        cfg = self._cfg
+        kwargs = {"half": cfg["half"], "int8": cfg["int8"]}
+        if fmt == "onnx":
+            # Static shapes let the runtime fold and fuse more of the graph.
+            kwargs.update(dynamic=False, simplify=True)
+        out = Path(model.export(format=fmt, imgsz=size, device=cfg["device"], **kwargs))
+        target = _export_path(weights, fmt, precision)
+        if target.is_dir():
+            shutil.rmtree(target)
+        return out.replace(target)
 
 
 class BenchmarkView(QWidget):
     def __init__(self, _container) -> None:
         super().__init__()
         self._rows = []
+        self._worker: BenchWorker | None = None
+        self._model_cache = ModelCache()
         self._build()
 
     def _build(self) -> None:
@@ -79,16 +237,31 @@ class BenchmarkView(QWidget):
         self._ts.setToolTip("Экспорт и тест TorchScript")
         for c in [self._pt, self._onnx, self._ov, self._trt, self._ts]:
             f.addRow(c)
+
+        self._half = QCheckBox("FP16")
+        self._half.setToolTip("Экспорт в половинной точности (по умолчанию для CUDA)")
+        self._int8 = QCheckBox("INT8")
+        self._int8.setToolTip("INT8-квантизация при экспорте (калибровка на наборе данных)")
+        self._device.currentTextChanged.connect(self._sync_half)
+        self._sync_half(self._device.currentText())
+        pr = QHBoxLayout()
+        pr.addWidget(self._half)
+        pr.addWidget(self._int8)
+        pr.addStretch(1)
+        pw = QWidget()
+        pw.setLayout(pr)
+        f.addRow("Точность:", pw)
         root.addWidget(g)
 
         self._run = QPushButton("Запустить бенчмарк")
         self._run.clicked.connect(self._run_bench)
         root.addWidget(self._run)
 
-        self._table = QTableWidget(0, 5)
-        self._table.setHorizontalHeaderLabels(
-            ["Format", "FPS", "Latency (ms)", "File Size (MB)", "Status"]
+        self._model = RowsTableModel(
+            ["Format", "FPS", "Latency (ms)", "File Size (MB)", "Status"], parent=self
         )
+        self._table = QTableView()
+        self._table.setModel(self._model)
         root.addWidget(self._table, 1)
 
         self._exp = QPushButton("Экспорт таблицы CSV")
@@ -105,66 +278,60 @@ class BenchmarkView(QWidget):
             self._w.setText(p)
 
     def _run_bench(self) -> None:
-        try:
-            from ultralytics import YOLO
-
-            weights = Path(self._w.text().strip())
-            if not weights.exists():
-                QMessageBox.warning(self, "Ошибка", "Укажите существующий файл весов")
-                return
-
-            model = YOLO(str(weights))
-            device = self._device.currentText()
-            formats = ["pt"]
-            if self._onnx.isChecked():
-                formats.append("onnx")
-            if self._ov.isChecked():
-                formats.append("openvino")
-            if self._trt.isChecked():
-                formats.append("engine")
-            if self._ts.isChecked():
-                formats.append("torchscript")
-
-            self._rows = []
-            self._log.clear()
-            for fmt in formats:
-                self._log.append(f"Testing {fmt} on {device}")
-                path = weights
-                status = "ok"
-                if fmt != "pt":
-                    try:
-                        out = model.export(format=fmt, imgsz=self._imgsz.value(), device=device)
-                        path = Path(out)
-                    except Exception as e:
-                        self._rows.append([fmt, 0.0, 0.0, 0.0, f"export fail: {e}"])
-                        continue
+        if self._worker is not None and self._worker.isRunning():
+            return
+        weights = Path(self._w.text().strip())
+        if not weights.exists():
+            QMessageBox.warning(self, "Ошибка", "Укажите существующий файл весов")
+            return
+        formats = ["pt"]
+        if self._onnx.isChecked():
+            formats.append("onnx")
+        if self._ov.isChecked():
+            formats.append("openvino")
+        if self._trt.isChecked():
+            formats.append("engine")
+        if self._ts.isChecked():
+            formats.append("torchscript")
+        cfg = {
+            "weights": weights,
+            "device": self._device.currentText(),
+            "imgsz": self._imgsz.value(),
+            "formats": formats,
+            "half": self._half.isChecked(),
+            "int8": self._int8.isChecked(),
+        }
+        self._rows = []
+        self._log.clear()
+        self._run.setEnabled(False)
+        self._worker = BenchWorker(cfg, self._model_cache)
+        self._worker.log.connect(self._log.append)
+        self._worker.done.connect(self._on_done)
+        self._worker.failed.connect(self._on_failed)
+        self._worker.finished.connect(self._on_stopped)
+        self._worker.start()
 
-                x = np.random.randint(
-                    0,
-                    255,
-                    (self._imgsz.value(), self._imgsz.value(), 3),
-                    dtype=np.uint8,
-                )
-                t0 = time.perf_counter()
-                for _ in range(100):
-                    model.predict(x, imgsz=self._imgsz.value(), device=device, verbose=False)
-                dt = (time.perf_counter() - t0) / 100
-                fps = 1 / max(1e-6, dt)
-                size_mb = path.stat().st_size / 1024 / 1024 if path.exists() else 0.0
-                self._rows.append([fmt, fps, dt * 1000, size_mb, status])
-            self._render()
-        except Exception as e:
-            QMessageBox.critical(self, "Ошибка", str(e))
+    def _sync_half(self, device: str) -> None:
+        self._half.setChecked(device.startswith("cuda"))
+
+    def _on_done(self, rows: list) -> None:
+        self._rows = rows
+        self._render()
+
+    def _on_failed(self, error: str) -> None:
+        QMessageBox.critical(self, "Ошибка", error)
+
+    def _on_stopped(self) -> None:
+        self._run.setEnabled(True)
 
     def _render(self) -> None:
-        self._table.setRowCount(len(self._rows))
+        self._model.set_rows(self._rows)
         best = max([r[1] for r in self._rows], default=0.0)
-        for i, r in enumerate(self._rows):
-            for j, v in enumerate(r):
-                it = QTableWidgetItem(f"{v:.3f}" if isinstance(v, float) else str(v))
-                if j == 1 and float(r[1]) == best and best > 0:
-                    it.setBackground(QColor("#14532d"))
-                self._table.setItem(i, j, it)
+        if best > 0:
+            color = QColor("#14532d")
+            self._model.set_cell_backgrounds(
+                {(i, 1): color for i, r in enumerate(self._rows) if float(r[1]) == best}
+            )
 
     def _exp_csv(self) -> None:
         p, _ = QFileDialog.getSaveFileName(self, "csv", "benchmark.csv", "CSV (*.csv)")
@@ -174,3 +341,13 @@ class BenchmarkView(QWidget):
             w = csv.writer(f)
             w.writerow(["Format", "FPS", "Latency (ms)", "File Size (MB)", "Status"])
             w.writerows(self._rows)
+
+    def shutdown(self) -> None:
+        worker = self._worker
+        if worker is not None and worker.isRunning():
+            worker.requestInterruption()
+            worker.wait()
+
+    def closeEvent(self, event) -> None:  # noqa: N802
+        self.shutdown()
+        super().closeEvent(event)
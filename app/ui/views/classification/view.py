@@ -1,10 +1,14 @@
 from __future__ import annotations
 
 import csv
+import os
+import shutil
+import tempfile
 import time
 from pathlib import Path
 
-from PySide6.QtCore import Qt
+import numpy as np
+from PySide6.QtCore import QRegularExpression, QSortFilterProxyModel, Qt, QThread, QTimer, Signal
 from PySide6.QtGui import QPixmap
 from PySide6.QtWidgets import (
     QComboBox,
@@ -17,14 +21,93 @@ from PySide6.QtWidgets import (
     QMessageBox,
     QProgressBar,
     QPushButton,
-    QTableWidget,
-    QTableWidgetItem,
+    QTableView,
     QTabWidget,
     QVBoxLayout,
     QWidget,
 )
 
-from app.ui.components.model_utils import make_best_model_checkbox
+from app.ui.components.model_utils import (
+    ModelCache,
+    make_best_model_checkbox,
+    names_array,
+    prefetch_images,
+)
+from app.ui.components.rows_model import RowsTableModel
+
+# Folder classification predicts (and reports progress) this many images at a time.
+_PREDICT_BATCH = 32
+_IMAGE_EXTS = frozenset(("jpg", "jpeg", "png", "bmp"))
+# The progress bar is repainted at most this often while a run is active.
+UI_REFRESH_MS = 100
+_CSV_HEADER = ["filename", "top1", "confidence", "top2", "top3"]
+_WRITE_BUFFER = 1 << 20
+
+
+class ClassifyWorker(QThread):
+    """Classifies every image of a folder off the GUI thread."""
+
+    progress = Signal(int)
+    # rows and the path of a temporary CSV with the same rows, written during the run.
+    done = Signal(list, str)
+    failed = Signal(str)
+
+    def __init__(self, weights: str, folder: str, models: ModelCache):
+        super().__init__()
+        self._weights = weights
+        self._folder = folder
+        self._models = models
+
+    def run(self) -> None:
+        csv_file = None
+        try:
+            model = self._models.get(self._weights)
+            # scandir's DirEntry carries the file type, so filtering needs no extra stat calls.
+            with os.scandir(self._folder) as it:
+                files = [
+                    Path(e.path)
+                    for e in it
+                    if e.name.rpartition(".")[2].lower() in _IMAGE_EXTS and e.is_file()
+                ]
+            names = names_array(model)
+            rows = []
+            chunks = [files[s : s + _PREDICT_BATCH] for s in range(0, len(files), _PREDICT_BATCH)]
+            # The next batches are read and decoded while the current one is classified.
+            decoded = prefetch_images([str(f) for f in chunk] for chunk in chunks)
+            # Rows go to a temp CSV batch by batch, so exporting is a file copy.
+            csv_file = tempfile.NamedTemporaryFile(
+                "w",
+                newline="",
+                encoding="utf-8",
+                suffix=".csv",
+                delete=False,
+                buffering=_WRITE_BUFFER,
+            )
+            wr = csv.writer(csv_file)
+            wr.writerow(_CSV_HEADER)
+            done = 0
+            for chunk, images in zip(chunks, decoded):
+                if self.isInterruptionRequested():
+                    return
+                results = model.predict(images, task="classify", verbose=False, stream=True)
+                start = len(rows)
+                for f, r in zip(chunk, results):
+                    top = names[np.asarray(r.probs.top5[:3])]
+                    conf = float(r.probs.top1conf)
+                    rows.append([f.name, top[0], conf, top[1], top[2]])
+                wr.writerows(rows[start:])
+                done += len(chunk)
+                self.progress.emit(int(done / max(1, len(files)) * 100))
+            csv_file.close()
+            self.done.emit(rows, csv_file.name)
+            csv_file = None
+        except Exception as e:
+            self.failed.emit(str(e))
+        finally:
+            if csv_file is not None:
+                # Interrupted or failed: the partial CSV is never handed to the view.
+                csv_file.close()
+                os.unlink(csv_file.name)
 
 
 class ClassificationView(QWidget):
@@ -32,6 +115,14 @@ class ClassificationView(QWidget):
         super().__init__()
         self._container = container
         self._rows = []
+        self._worker: ClassifyWorker | None = None
+        self._model_cache = ModelCache()
+        # Temp CSV of the last completed folder run (see ClassifyWorker).
+        self._csv_path: str | None = None
+        self._pending_pct: int | None = None
+        self._ui_timer = QTimer(self)
+        self._ui_timer.setInterval(UI_REFRESH_MS)
+        self._ui_timer.timeout.connect(self._refresh_progress)
         self._build()
 
     def _build(self):
@@ -122,8 +213,13 @@ class ClassificationView(QWidget):
         self._filter = QComboBox()
         self._filter.currentIndexChanged.connect(self._apply_filter)
         bl.addWidget(self._filter)
-        self._table = QTableWidget(0, 5)
-        self._table.setHorizontalHeaderLabels(["filename", "top1", "conf", "top2", "top3"])
+        self._model = RowsTableModel(["filename", "top1", "conf", "top2", "top3"], "{:.4f}", self)
+        # The class filter runs in the proxy; the model keeps all rows.
+        self._proxy = QSortFilterProxyModel(self)
+        self._proxy.setSourceModel(self._model)
+        self._proxy.setFilterKeyColumn(1)
+        self._table = QTableView()
+        self._table.setModel(self._proxy)
         bl.addWidget(self._table, 1)
         self._exp = QPushButton("Экспорт CSV")
         self._exp.clicked.connect(self._export_csv)
@@ -143,21 +239,18 @@ class ClassificationView(QWidget):
 
     def _classify_one(self):
         try:
-            from ultralytics import YOLO
-
+            model = self._model_cache.get(self._weights.text())
             t0 = time.perf_counter()
-            res = YOLO(self._weights.text()).predict(self._img.text(), task="classify", verbose=False)
+            res = model.predict(self._img.text(), task="classify", verbose=False)
             dt = (time.perf_counter() - t0) * 1000
             self._lat.setText(f"Время инференса: {dt:.2f} мс")
             probs = res[0].probs
-            top = probs.top5
-            conf = probs.top5conf
-            for i in range(5):
-                idx = int(top[i])
-                p = float(conf[i]) * 100
-                name = res[0].names.get(idx, str(idx))
-                self._top5[i].setValue(int(p))
-                self._top5[i].setFormat(f"{name}: {p:.2f}%")
+            # One device->host copy for all five confidences instead of one per bar.
+            confs = (probs.top5conf.cpu().numpy() * 100).tolist()
+            top_names = names_array(model)[np.asarray(probs.top5)].tolist()
+            for bar, name, p in zip(self._top5, top_names, confs):
+                bar.setValue(int(p))
+                bar.setFormat(f"{name}: {p:.2f}%")
         except Exception as e:
             QMessageBox.critical(self, "Ошибка", str(e))
 
@@ -171,49 +264,87 @@ class ClassificationView(QWidget):
         self._bweights.setText(self._weights.text())
 
     def _run_folder(self):
-        try:
-            from ultralytics import YOLO
-
-            model = YOLO(self._bweights.text())
-            files = [
-                p
-                for p in Path(self._folder.text()).iterdir()
-                if p.suffix.lower() in {".jpg", ".jpeg", ".png", ".bmp"}
-            ]
-            self._rows = []
-            self._prog.setValue(0)
-            for i, f in enumerate(files, 1):
-                r = model.predict(str(f), task="classify", verbose=False)[0]
-                top = [r.names[int(x)] for x in r.probs.top5[:3]]
-                conf = float(r.probs.top1conf)
-                self._rows.append([f.name, top[0], conf, top[1], top[2]])
-                self._prog.setValue(int(i / max(1, len(files)) * 100))
-            classes = sorted({r[1] for r in self._rows})
-            self._filter.clear()
-            self._filter.addItem("Все")
-            self._filter.addItems(classes)
-            self._render_rows(self._rows)
-        except Exception as e:
-            QMessageBox.critical(self, "Ошибка", str(e))
+        if self._worker is not None and self._worker.isRunning():
+            return
+        # Drop the previous run's results, so the table and export never show stale rows.
+        self._rows = []
+        self._drop_csv()
+        self._model.set_rows(self._rows)
+        self._filter.clear()
+        self._prog.setValue(0)
+        self._run_batch.setEnabled(False)
+        # The worker predicts on the cached model; single-image classify would share it.
+        self._btn.setEnabled(False)
+        self._worker = ClassifyWorker(self._bweights.text(), self._folder.text(), self._model_cache)
+        self._worker.progress.connect(self._on_progress)
+        self._worker.done.connect(self._on_done)
+        self._worker.failed.connect(self._on_failed)
+        self._worker.finished.connect(self._on_stopped)
+        self._ui_timer.start()
+        self._worker.start()
+
+    def _on_progress(self, pct: int) -> None:
+        self._pending_pct = pct
+
+    def _refresh_progress(self) -> None:
+        if self._pending_pct is not None:
+            self._prog.setValue(self._pending_pct)
+            self._pending_pct = None
 
-    def _render_rows(self, rows):
-        self._table.setRowCount(len(rows))
-        for i, r in enumerate(rows):
-            for j, v in enumerate(r):
-                self._table.setItem(i, j, QTableWidgetItem(f"{v:.4f}" if isinstance(v, float) else str(v)))
+    def _on_done(self, rows: list, csv_path: str) -> None:
+        self._rows = rows
+        self._drop_csv()
+        self._csv_path = csv_path
+        classes = sorted({r[1] for r in self._rows})
+        self._filter.clear()
+        self._filter.addItem("Все")
+        self._filter.addItems(classes)
+        self._model.set_rows(self._rows)
+
+    def _on_failed(self, error: str) -> None:
+        QMessageBox.critical(self, "Ошибка", error)
+
+    def _on_stopped(self) -> None:
+        self._ui_timer.stop()
+        self._refresh_progress()
+        self._run_batch.setEnabled(True)
+        self._btn.setEnabled(True)
 
     def _apply_filter(self):
         c = self._filter.currentText()
-        if c == "Все":
-            self._render_rows(self._rows)
+        if c == "Все" or not c:
+            self._proxy.setFilterRegularExpression("")
         else:
-            self._render_rows([r for r in self._rows if r[1] == c])
+            pattern = f"^{QRegularExpression.escape(c)}$"
+            self._proxy.setFilterRegularExpression(QRegularExpression(pattern))
 
     def _export_csv(self):
         p, _ = QFileDialog.getSaveFileName(self, "csv", "classification.csv", "CSV (*.csv)")
         if not p:
             return
-        with open(p, "w", newline="", encoding="utf-8") as f:
+        if self._csv_path is not None:
+            shutil.copyfile(self._csv_path, p)
+            return
+        with open(p, "w", newline="", encoding="utf-8", buffering=_WRITE_BUFFER) as f:
             wr = csv.writer(f)
-            wr.writerow(["filename", "top1", "confidence", "top2", "top3"])
+            wr.writerow(_CSV_HEADER)
             wr.writerows(self._rows)
+
+    def _drop_csv(self) -> None:
+        if self._csv_path is not None:
+            try:
+                os.unlink(self._csv_path)
+            except OSError:
+                pass
+            self._csv_path = None
+
+    def shutdown(self) -> None:
+        worker = self._worker
+        if worker is not None and worker.isRunning():
+            worker.requestInterruption()
+            worker.wait()
+        self._drop_csv()
+
+    def closeEvent(self, event) -> None:  # noqa: N802
+        self.shutdown()
+        super().closeEvent(event)
@@ -6,6 +6,7 @@
 from __future__ import annotations
 
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Any
 
@@ -55,7 +56,7 @@ from app.core.observability.run_manifest import register_run
 from app.ui.components.buttons import PrimaryButton, SecondaryButton
 from app.ui.components.inputs import NoWheelSlider
 from app.ui.components.photo_preview import show_scrollable_photo_dialog
-from app.ui.theme.tokens import Tokens
+from app.ui.theme.tokens import Tokens, TokenSet, cached_style
 from app.ui.views.datasets.worker import DatasetWorker
 
 PREVIEW_PHOTOS_COUNT = 6
@@ -72,21 +73,61 @@ EFFECT_LABELS: dict[str, str] = {
 LABEL_WIDTH = 160
 
 
-def _edit_style(t: type) -> str:
+def _bgr_to_pil(img: np.ndarray) -> Image.Image:
+    """Copy an OpenCV BGR image into an RGB PIL image; PIL swaps the channels while
+    unpacking the buffer, so there is no separate cvtColor pass and img may be reused."""
+    h, w = img.shape[:2]
+    return Image.frombuffer("RGB", (w, h), np.ascontiguousarray(img), "raw", "BGR", 0, 1)
+
+
+def _imread(path: Path) -> np.ndarray | None:
+    """cv2.imread via np.fromfile + imdecode: one read into a flat byte array, and
+    non-ASCII paths work on Windows too."""
+    try:
+        data = np.fromfile(path, dtype=np.uint8)
+    except OSError:
+        return None
+    return cv2.imdecode(data, cv2.IMREAD_COLOR) if data.size else None
+
+
+def _render_preview(
+    root: Path, img_path: Path, classes: list[str], only_classes: set[int] | None
+) -> Image.Image | None:
+    """Decode one sample, draw its labels and return it as an RGB PIL image."""
+    img = _imread(img_path)
+    if img is None:
+        return None
+    lbl_path = get_labels_path_for_image(root, img_path)
+    if lbl_path and lbl_path.exists():
+        img = draw_boxes(img, lbl_path, classes, only_classes=only_classes, copy=False)
+    return _bgr_to_pil(img)
+
+
+def _render_previews(
+    root: Path, paths: list[Path], classes: list[str], only_classes: set[int] | None = None
+) -> list[Image.Image]:
+    """_render_preview for every path, in order. OpenCV releases the GIL, so threads
+    decode and draw the samples in parallel."""
+    with ThreadPoolExecutor(max_workers=min(8, len(paths))) as ex:
+        rendered = ex.map(lambda ip: _render_preview(root, ip, classes, only_classes), paths)
+        return [im for im in rendered if im is not None]
+
+
+def _edit_style(t: TokenSet) -> str:
     return (
         f"QLineEdit {{ background: {t.surface}; color: {t.text_primary}; border: 1px solid {t.border}; "
         f"border-radius: {t.radius_sm}px; padding: 6px; }}"
     )
 
 
-def _card_style(t: type) -> str:
+def _card_style(t: TokenSet) -> str:
     return (
         f"QFrame {{ background: {t.surface}; border: 1px solid {t.border}; "
         f"border-radius: {t.radius_md}px; padding: {t.space_md}px; }}"
     )
 
 
-def _progress_style(t: type) -> str:
+def _progress_style(t: TokenSet) -> str:
     return (
         f"QProgressBar {{ border: 1px solid {t.border}; border-radius: {t.radius_sm}px; "
         f"text-align: center; }} QProgressBar::chunk {{ background: {t.primary}; border-radius: 4px; }}"
@@ -106,7 +147,6 @@ class DatasetsView(QWidget):
         self._worker = DatasetWorker()
         self._thread = QThread(self)
         self._worker.moveToThread(self._thread)
-        self._thread.started.connect(self._worker.run)
         self._worker.progress.connect(self._on_worker_progress)
         self._worker.finished.connect(self._on_worker_finished)
         self._current_row_id: str | None = None
@@ -165,7 +205,7 @@ class DatasetsView(QWidget):
 
         # ---- Верх: исходная папка и куда сохранять ----
         top_frame = QFrame()
-        top_frame.setStyleSheet(_card_style(t))
+        top_frame.setStyleSheet(cached_style("datasets.card", _card_style))
         top_layout = QVBoxLayout(top_frame)
         top_layout.setSpacing(t.space_md)
 
@@ -181,7 +221,7 @@ class DatasetsView(QWidget):
             "Путь к исходному датасету. Поддерживаются разные структуры папок (images, img, labels, annotations и т.д.)."
         )
         self._src_edit.setText(str(PROJECT_ROOT / "dataset"))
-        self._src_edit.setStyleSheet(_edit_style(t))
+        self._src_edit.setStyleSheet(cached_style("datasets.edit", _edit_style))
         row_src.addWidget(lbl_src)
         row_src.addWidget(self._src_edit, 1)
         btn_browse_src = SecondaryButton("Обзор…")
@@ -202,7 +242,7 @@ class DatasetsView(QWidget):
             "Путь, куда будут сохраняться сконвертированные или новые датасеты."
         )
         self._out_edit.setText(str(PROJECT_ROOT / "dataset_yolo"))
-        self._out_edit.setStyleSheet(_edit_style(t))
+        self._out_edit.setStyleSheet(cached_style("datasets.edit", _edit_style))
         row_out.addWidget(lbl_out)
         row_out.addWidget(self._out_edit, 1)
         btn_browse_out = SecondaryButton("Обзор…")
@@ -311,7 +351,7 @@ class DatasetsView(QWidget):
 
         # ---- Блок: классы для превью и экспорта (виден у превью и у экспорта) ----
         classes_card = QFrame()
-        classes_card.setStyleSheet(_card_style(t))
+        classes_card.setStyleSheet(cached_style("datasets.card", _card_style))
         classes_card_ly = QVBoxLayout(classes_card)
         classes_card_ly.setSpacing(t.space_sm)
         classes_card_ly.addWidget(QLabel("Классы (отметьте для превью и экспорта):"))
@@ -346,7 +386,7 @@ class DatasetsView(QWidget):
         rename_row.addWidget(QLabel("Новое имя:"))
         self._rename_new_edit = QLineEdit()
         self._rename_new_edit.setPlaceholderText("имя")
-        self._rename_new_edit.setStyleSheet(_edit_style(t))
+        self._rename_new_edit.setStyleSheet(cached_style("datasets.edit", _edit_style))
         self._rename_new_edit.setFixedWidth(120)
         rename_row.addWidget(self._rename_new_edit)
         rename_row.addStretch()
@@ -387,7 +427,7 @@ class DatasetsView(QWidget):
         merge_row.addWidget(QLabel("Имя объединённого:"))
         self._merge_name_edit = QLineEdit()
         self._merge_name_edit.setPlaceholderText("например: object")
-        self._merge_name_edit.setStyleSheet(_edit_style(t))
+        self._merge_name_edit.setStyleSheet(cached_style("datasets.edit", _edit_style))
         self._merge_name_edit.setFixedWidth(120)
         merge_row.addWidget(self._merge_name_edit)
         merge_w = QWidget()
@@ -414,7 +454,7 @@ class DatasetsView(QWidget):
     ) -> QFrame:
         t = Tokens
         card = QFrame()
-        card.setStyleSheet(_card_style(t))
+        card.setStyleSheet(cached_style("datasets.card", _card_style))
         card_layout = QVBoxLayout(card)
         card_layout.setSpacing(t.space_sm)
 
@@ -443,7 +483,7 @@ class DatasetsView(QWidget):
         if on_apply and row_id not in ("preview", "preview_classes", "load_classes"):
             progress_bar = QProgressBar()
             progress_bar.setRange(0, 0)  # indeterminate
-            progress_bar.setStyleSheet(_progress_style(t))
+            progress_bar.setStyleSheet(cached_style("datasets.progress", _progress_style))
             progress_bar.setVisible(False)
             card_layout.addWidget(progress_bar)
             status_label = QLabel()
@@ -459,7 +499,7 @@ class DatasetsView(QWidget):
         return card
 
     def _run_apply(self, row_id: str) -> None:
-        if self._thread.isRunning():
+        if self._current_row_id is not None:
             QMessageBox.warning(self, "Занято", "Дождитесь завершения текущей операции.")
             return
         if row_id == "prepare_yolo":
@@ -532,7 +572,6 @@ class DatasetsView(QWidget):
         row_id = self._current_row_id
         self._publish_job_done(success=success, message=message)
         self._current_row_id = None
-        self._thread.quit()
         if row_id:
             self._set_row_busy(row_id, False)
             self._show_row_done(row_id, success, message)
@@ -544,8 +583,19 @@ class DatasetsView(QWidget):
         self._current_row_id = row_id
         self._publish_job_start(row_id)
         self._set_row_busy(row_id, True)
-        self._worker.set_task(task_id, params)
-        self._thread.start()
+        # One long-lived thread; tasks are queued to it rather than restarting it per click.
+        if not self._thread.isRunning():
+            self._thread.start()
+        self._worker.task_requested.emit(task_id, params)
+
+    def shutdown(self) -> None:
+        if self._thread.isRunning():
+            self._thread.quit()
+            self._thread.wait()
+
+    def closeEvent(self, event) -> None:  # noqa: N802
+        self.shutdown()
+        super().closeEvent(event)
 
     def _browse_src(self) -> None:
         path = QFileDialog.getExistingDirectory(self, "Исходная папка", self._src_edit.text())
@@ -558,7 +608,7 @@ class DatasetsView(QWidget):
             self._out_edit.setText(path)
 
     def _on_create_data_yaml(self) -> None:
-        if self._thread.isRunning():
+        if self._current_row_id is not None:
             QMessageBox.warning(self, "Занято", "Дождитесь завершения текущей операции.")
             return
         src = self._src_edit.text().strip()
@@ -580,33 +630,25 @@ class DatasetsView(QWidget):
         if not paths:
             QMessageBox.warning(self, "Эффекты", "В датасете не найдено изображений.")
             return
-        img = cv2.imread(str(paths[0]))
+        img = _imread(paths[0])
         if img is None:
             QMessageBox.warning(self, "Эффекты", "Не удалось загрузить изображение.")
             return
         t = max(0.0, min(1.0, strength / 100.0))
-        items: list[tuple[str, Image.Image]] = [
-            ("Оригинал", Image.fromarray(cv2.cvtColor(img, cv2.COLOR_BGR2RGB)))
-        ]
+        items: list[tuple[str, Image.Image]] = [("Оригинал", _bgr_to_pil(img))]
+        # _bgr_to_pil copies while swapping channels, so one blend buffer serves every effect.
+        scratch = np.empty_like(img) if t < 1.0 else None
         for key in effect_keys:
             if key not in AUGMENT_OPTIONS:
                 continue
             transformed = AUGMENT_OPTIONS[key](img)
             if transformed is not None:
                 if t < 1.0:
-                    blended = (
-                        (img.astype(np.float32) * (1 - t) + transformed.astype(np.float32) * t)
-                        .clip(0, 255)
-                        .astype(np.uint8)
-                    )
+                    # One fused, saturating kernel instead of float32 temporaries + clip.
+                    blended = cv2.addWeighted(img, 1.0 - t, transformed, t, 0.0, dst=scratch)
                 else:
                     blended = transformed
-                items.append(
-                    (
-                        EFFECT_LABELS.get(key, key),
-                        Image.fromarray(cv2.cvtColor(blended, cv2.COLOR_BGR2RGB)),
-                    )
-                )
+                items.append((EFFECT_LABELS.get(key, key), _bgr_to_pil(blended)))
         if len(items) <= 1:
             QMessageBox.warning(self, "Эффекты", "Отметьте хотя бы один эффект.")
             return
@@ -622,16 +664,7 @@ class DatasetsView(QWidget):
         if not paths:
             QMessageBox.warning(self, "Превью", "В датасете не найдено изображений.")
             return
-        images_pil: list[Image.Image] = []
-        for img_path in paths:
-            img = cv2.imread(str(img_path))
-            if img is None:
-                continue
-            lbl_path = get_labels_path_for_image(p, img_path)
-            if lbl_path and lbl_path.exists():
-                img = draw_boxes(img, lbl_path, classes, only_classes=None)
-            img_rgb = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
-            images_pil.append(Image.fromarray(img_rgb))
+        images_pil = _render_previews(p, paths, classes)
         if not images_pil:
             QMessageBox.warning(self, "Превью", "Не удалось загрузить изображения.")
             return
@@ -646,25 +679,34 @@ class DatasetsView(QWidget):
             return
         self._start_worker("augment", "augment", {"src": src, "out": out, "opts": opts})
 
+    @staticmethod
+    def _swap_widget(old: QWidget, new: QWidget) -> None:
+        """Put new in old's place in the layout, in one step, and dispose of old."""
+        old.parentWidget().layout().replaceWidget(old, new)
+        old.deleteLater()
+
     def _load_classes(self) -> None:
-        while self._class_checks_layout.count():
-            item = self._class_checks_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        self._class_check_vars.clear()
         p = Path(self._src_edit.text().strip())
-        if not p.is_dir():
-            self._class_names = []
-            self._rename_combo.clear()
-            self._rename_combo.addItem("")
-            return
-        self._class_names = load_classes_from_dataset(p)
+        self._class_names = load_classes_from_dataset(p) if p.is_dir() else []
+        # The new grid is filled while detached and swapped in whole, so the card is
+        # laid out once instead of after every removed and added checkbox.
+        widget = QWidget()
+        layout = QGridLayout(widget)
+        layout.setContentsMargins(0, 0, 0, 0)
+        self._class_check_vars = []
         cols = 4
         for i, name in enumerate(self._class_names):
             cb = QCheckBox(name)
             cb.setChecked(True)
             self._class_check_vars.append(cb)
-            self._class_checks_layout.addWidget(cb, i // cols, i % cols)
+            layout.addWidget(cb, i // cols, i % cols)
+        self._swap_widget(self._class_checks_widget, widget)
+        self._class_checks_widget = widget
+        self._class_checks_layout = layout
+        if not p.is_dir():
+            self._rename_combo.clear()
+            self._rename_combo.addItem("")
+            return
         self._rename_combo.clear()
         self._rename_combo.addItems(self._class_names if self._class_names else [""])
         if self._class_names:
@@ -688,15 +730,7 @@ class DatasetsView(QWidget):
         if not paths:
             QMessageBox.warning(self, "Превью", "В датасете не найдено изображений.")
             return
-        images_pil = []
-        for img_path in paths:
-            img = cv2.imread(str(img_path))
-            if img is None:
-                continue
-            lbl_path = get_labels_path_for_image(p, img_path)
-            if lbl_path and lbl_path.exists():
-                img = draw_boxes(img, lbl_path, classes, only_classes=selected)
-            images_pil.append(Image.fromarray(cv2.cvtColor(img, cv2.COLOR_BGR2RGB)))
+        images_pil = _render_previews(p, paths, classes, selected)
         if not images_pil:
             QMessageBox.warning(self, "Превью", "Не удалось загрузить изображения.")
             return
@@ -776,16 +810,16 @@ class DatasetsView(QWidget):
 
     def _load_merge_classes(self) -> None:
         """Вызывать при смене пути или отдельной кнопкой — классы для объединения."""
-        while self._merge_checks_layout.count():
-            item = self._merge_checks_layout.takeAt(0)
-            if item.widget():
-                item.widget().deleteLater()
-        self._merge_check_vars.clear()
         p = Path(self._src_edit.text().strip())
-        if not p.is_dir():
-            return
-        for name in load_classes_from_dataset(p):
+        widget = QWidget()
+        layout = QHBoxLayout(widget)
+        layout.setContentsMargins(0, 0, 0, 0)
+        self._merge_check_vars = []
+        for name in load_classes_from_dataset(p) if p.is_dir() else []:
             cb = QCheckBox(name)
             cb.setChecked(False)
             self._merge_check_vars.append(cb)
-            self._merge_checks_layout.addWidget(cb)
+            layout.addWidget(cb)
+        self._swap_widget(self._merge_checks_widget, widget)
+        self._merge_checks_widget = widget
+        self._merge_checks_layout = layout
@@ -5,10 +5,12 @@
 
 from __future__ import annotations
 
+import json
+import os
 from pathlib import Path
 from typing import Any
 
-from PySide6.QtCore import QObject, Signal
+from PySide6.QtCore import QObject, Qt, Signal
 
 from app.application.facades.datasets import (
     convert_voc_to_yolo,
@@ -21,24 +23,73 @@ from app.application.facades.datasets import (
     rename_class_in_dataset,
 )
 
+# Задачи, которые при тех же параметрах и нетронутых папках дают тот же результат.
+_SKIP_UNCHANGED_TASKS = frozenset({"prepare_yolo", "augment"})
+
+
+def _tree_sig(root: str) -> int:
+    """Отпечаток дерева файлов: XOR хешей (путь, mtime_ns, размер). 0 — папки нет."""
+    if not root:
+        return 0
+    sig = 0
+    stack = [root]
+    while stack:
+        try:
+            it = os.scandir(stack.pop())
+        except OSError:
+            continue
+        with it:
+            for e in it:
+                if e.is_dir(follow_symlinks=False):
+                    stack.append(e.path)
+                    continue
+                try:
+                    st = e.stat()
+                except OSError:
+                    continue
+                sig ^= hash((e.path, st.st_mtime_ns, st.st_size))
+    return sig
+
 
 class DatasetWorker(QObject):
-    """Выполняет одну задачу в потоке. Перед start задать task_id и params."""
+    """Выполняет задачи в своём потоке: task_requested.emit(task_id, params) ставит задачу
+    в очередь потока, результат приходит через finished. Поток живёт всё время вкладки."""
 
     progress = Signal(float)  # 0..1
     finished = Signal(bool, str)  # success, message
+    task_requested = Signal(str, object)  # task_id, params (dict передаётся как есть)
 
     def __init__(self) -> None:
         super().__init__()
         self._task_id: str = ""
         self._params: dict[str, Any] = {}
+        # task_id -> отпечаток (параметры + папки) после последнего успешного запуска.
+        self._last_sig: dict[str, int] = {}
+        self.task_requested.connect(self._dispatch, Qt.ConnectionType.QueuedConnection)
 
     def set_task(self, task_id: str, params: dict[str, Any]) -> None:
         self._task_id = task_id
         self._params = params
 
+    def _dispatch(self, task_id: str, params: dict[str, Any]) -> None:
+        self.set_task(task_id, params)
+        self.run()
+
+    def _inputs_sig(self) -> int:
+        params = json.dumps(self._params, sort_keys=True, default=str)
+        src = str(self._params.get("src", "")).strip()
+        out = str(self._params.get("out", "")).strip()
+        return hash((self._task_id, params, _tree_sig(src), _tree_sig(out)))
+
     def run(self) -> None:
         self.progress.emit(0.0)
+        check_sig = self._task_id in _SKIP_UNCHANGED_TASKS
+        if check_sig and self._last_sig.get(self._task_id) == self._inputs_sig():
+            self.progress.emit(1.0)
+            self.finished.emit(
+                True, "Папки и параметры не менялись с прошлого запуска — пропущено."
+            )
+            return
         try:
             if self._task_id == "prepare_yolo":
                 self._run_prepare_yolo()
@@ -55,8 +106,12 @@ class DatasetWorker(QObject):
             else:
                 self.finished.emit(False, f"Неизвестная задача: {self._task_id}")
                 return
+            message = self._params.pop("result_message", "Готово.")
+            if check_sig:
+                # Снимается после запуска: задача сама меняет out (и src при конвертации VOC).
+                self._last_sig[self._task_id] = self._inputs_sig()
             self.progress.emit(1.0)
-            self.finished.emit(True, self._params.get("result_message", "Готово."))
+            self.finished.emit(True, message)
         except Exception as e:
             self.finished.emit(False, str(e))
 
@@ -472,8 +472,9 @@ class JobsView(QWidget):
             return
         folder = get_run_folder(rec.job_id)
         if folder is None:
-            if getattr(self._container, "notifications", None):
-                self._container.notifications.warning("Для этой задачи не найден run folder")
+            notifications = self._container.notifications
+            if notifications is not None:
+                notifications.warning("Для этой задачи не найден run folder")
             return
         QDesktopServices.openUrl(QUrl.fromLocalFile(str(folder)))
 
@@ -486,15 +487,17 @@ class JobsView(QWidget):
         out = get_save_zip_path(self, title="Сохранить crash bundle")
         if out is None:
             return
+        notifications = self._container.notifications
         try:
             create_crash_bundle(out)
-            if getattr(self._container, "notifications", None):
-                self._container.notifications.success(f"Crash bundle сохранён: {out}")
+            if notifications is not None:
+                notifications.success(f"Crash bundle сохранён: {out}")
         except Exception as e:
-            if getattr(self._container, "notifications", None):
-                self._container.notifications.error(f"Не удалось создать crash bundle: {e}")
+            if notifications is not None:
+                notifications.error(f"Не удалось создать crash bundle: {e}")
 
     def _on_policy(self) -> None:
-        dlg = JobsPolicyDialog(self, integrations=getattr(self._container, "integrations", None))
-        if dlg.exec() and getattr(self._container, "notifications", None):
-            self._container.notifications.success("Политика задач сохранена")
+        dlg = JobsPolicyDialog(self, integrations=self._container.integrations)
+        notifications = self._container.notifications
+        if dlg.exec() and notifications is not None:
+            notifications.success("Политика задач сохранена")
@@ -82,7 +82,7 @@ class TrainingView(QWidget):
         self._epoch_start_time: float | None = None
         self._last_epoch: int | None = None
         self._total_epochs: int | None = None
-        self._trained_choices: list[tuple[str, Path]] = []
+        self._trained_choices: tuple[tuple[str, Path], ...] = ()
         self._dataset_rows: list[tuple[QLabel, QLineEdit, QPushButton]] = []
         self._metrics_timer = None
         self._last_metric_signature: tuple[object, object, object, object] | None = None
@@ -338,7 +338,7 @@ class TrainingView(QWidget):
             return (YOLO_MODEL_CHOICES[0].model_id, None)
         for label, path in self._trained_choices:
             if choice == label:
-                return ("", path)
+                return ("", path.resolve())
         for m in YOLO_MODEL_CHOICES:
             if m.label == choice:
                 return (m.model_id, None)
@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+QtCore = pytest.importorskip(
+    "PySide6.QtCore", reason="PySide6 QtCore is required", exc_type=ImportError
+)
+
+from app.ui.infrastructure.settings import AppSettings
+
+
+def _settings(path: Path) -> tuple[AppSettings, QtCore.QSettings]:
+    q = QtCore.QSettings(str(path), QtCore.QSettings.Format.IniFormat)
+    return AppSettings(q), q
+
+
+def test_batch_defers_writes_until_exit(tmp_path: Path) -> None:
+    settings, q = _settings(tmp_path / "app.ini")
+
+    with settings.batch():
+        settings.set_theme("light")
+        settings.set_sidebar_collapsed(True)
+        assert q.value("theme/name") is None
+        assert settings.get_theme() == "light"
+
+    assert q.value("theme/name") == "light"
+    reread, _ = _settings(tmp_path / "app.ini")
+    assert reread.get_theme() == "light"
+    assert reread.get_sidebar_collapsed() is True
+
+
+def test_setters_write_through_outside_batch(tmp_path: Path) -> None:
+    settings, q = _settings(tmp_path / "app.ini")
+    settings.set_theme("light")
+    assert q.value("theme/name") == "light"
+
+
+def test_getters_cache_reads_and_follow_setters(tmp_path: Path) -> None:
+    settings, q = _settings(tmp_path / "app.ini")
+    assert settings.get_theme() == "dark"
+
+    q.setValue("theme/name", "light")  # external change is not re-read
+    assert settings.get_theme() == "dark"
+
+    settings.set_theme("light")
+    assert settings.get_theme() == "light"
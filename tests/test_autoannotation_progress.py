@@ -0,0 +1,28 @@
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip(
+    "PySide6.QtWidgets", reason="PySide6 QtWidgets is required", exc_type=ImportError
+)
+
+
+def test_progress_and_log_are_painted_once_per_refresh() -> None:
+    from PySide6.QtWidgets import QApplication
+
+    from app.ui.views.autoannotation.view import AutoAnnotationView
+
+    _app = QApplication.instance() or QApplication([])
+    view = AutoAnnotationView(None)
+
+    view._on_progress(10, "a.jpg: 1 objects")
+    view._on_progress(20, "b.jpg: 0 objects\nc.jpg: 2 objects")
+    assert view._prog.value() == -1
+    assert view._log.toPlainText() == ""
+
+    view._refresh_ui()
+    assert view._prog.value() == 20
+    assert view._log.toPlainText() == "a.jpg: 1 objects\nb.jpg: 0 objects\nc.jpg: 2 objects"
+
+    view._refresh_ui()
+    assert view._log.toPlainText().count("a.jpg") == 1
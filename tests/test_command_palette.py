@@ -0,0 +1,39 @@
+from __future__ import annotations
+
+import pytest
+
+
+def _app():
+    QtWidgets = pytest.importorskip(
+        "PySide6.QtWidgets", reason="PySide6 QtWidgets is required", exc_type=ImportError
+    )
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+def test_palette_filters_by_keywords() -> None:
+    _app()
+    from app.ui.components.command_palette import CommandPalette
+
+    palette = CommandPalette()
+    palette._edit.setText("bench")
+
+    assert [c.id for c in palette._filtered] == ["tab_benchmark"]
+    assert palette._list.count() == 1
+    assert palette._list.currentRow() == 0
+
+
+def test_palette_caps_visible_results(monkeypatch) -> None:
+    _app()
+    from app.ui.components import command_palette
+    from app.ui.components.command_palette import CommandPalette
+
+    monkeypatch.setattr(command_palette, "MAX_VISIBLE_RESULTS", 3)
+    palette = CommandPalette()
+    palette._edit.setText("перейти")
+
+    assert palette._list.count() == 3
+    assert not palette._more_label.isHidden()
+
+    palette._edit.setText("тема")
+    assert palette._list.count() == 2
+    assert palette._more_label.isHidden()
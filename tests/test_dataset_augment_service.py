@@ -0,0 +1,33 @@
+"""Тесты поэлементных эффектов аугментации (таблицы подстановки против прямого расчёта)."""
+
+import numpy as np
+import pytest
+
+cv2 = pytest.importorskip("cv2", reason="OpenCV not installed", exc_type=ImportError)
+
+from app.services.dataset_augment_service import AUGMENT_OPTIONS  # noqa: E402
+
+
+@pytest.fixture
+def img() -> np.ndarray:
+    return np.random.default_rng(0).integers(0, 256, (24, 32, 3), dtype=np.uint8)
+
+
+def test_overexpose_and_darken_saturate(img: np.ndarray) -> None:
+    wide = img.astype(np.int32)
+    assert np.array_equal(AUGMENT_OPTIONS["overexpose"](img), np.clip(wide + 60, 0, 255))
+    assert np.array_equal(AUGMENT_OPTIONS["darken"](img), np.clip(wide - 50, 0, 255))
+
+
+def test_color_shift_wraps_hue(img: np.ndarray) -> None:
+    hsv = cv2.cvtColor(img, cv2.COLOR_BGR2HSV)
+    hsv[:, :, 0] = (hsv[:, :, 0].astype(np.int32) + 25) % 180
+    expected = cv2.cvtColor(hsv, cv2.COLOR_HSV2BGR)
+    assert np.array_equal(AUGMENT_OPTIONS["color_shift"](img), expected)
+
+
+def test_effects_keep_shape_and_dtype(img: np.ndarray) -> None:
+    for fn in AUGMENT_OPTIONS.values():
+        out = fn(img)
+        assert out.shape == img.shape
+        assert out.dtype == np.uint8
@@ -0,0 +1,58 @@
+"""Тесты кэша классов и списка картинок датасета (dataset_visualize)."""
+
+import os
+from pathlib import Path
+
+from app.services.dataset_visualize import get_sample_image_paths, load_classes_from_dataset
+
+
+def _bump_mtime(path: Path) -> None:
+    st = os.stat(path)
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+def test_classes_reloaded_after_data_yaml_changes(tmp_path: Path) -> None:
+    data_yaml = tmp_path / "data.yaml"
+    data_yaml.write_text("names: [cat, dog]\n", encoding="utf-8")
+    first = load_classes_from_dataset(tmp_path)
+    assert first == ["cat", "dog"]
+    first.append("mutated")
+    assert load_classes_from_dataset(tmp_path) == ["cat", "dog"]
+
+    data_yaml.write_text("names: {0: car}\n", encoding="utf-8")
+    _bump_mtime(data_yaml)
+    assert load_classes_from_dataset(tmp_path) == ["car"]
+
+
+def test_classes_missing_data_yaml(tmp_path: Path) -> None:
+    assert load_classes_from_dataset(tmp_path) == []
+
+
+def test_sample_paths_see_new_images(tmp_path: Path) -> None:
+    images = tmp_path / "train" / "images"
+    labels = tmp_path / "train" / "labels"
+    images.mkdir(parents=True)
+    labels.mkdir(parents=True)
+    (images / "a.jpg").write_bytes(b"")
+    (images / "notes.txt").write_text("", encoding="utf-8")
+    (labels / "a.txt").write_text("", encoding="utf-8")
+    assert get_sample_image_paths(tmp_path, 6) == [images / "a.jpg"]
+
+    (images / "b.png").write_bytes(b"")
+    _bump_mtime(images)
+    assert sorted(get_sample_image_paths(tmp_path, 6)) == [images / "a.jpg", images / "b.png"]
+    assert len(get_sample_image_paths(tmp_path, 1)) == 1
+
+
+def test_sample_paths_match_extensions_case_insensitively(tmp_path: Path) -> None:
+    images = tmp_path / "train" / "images"
+    labels = tmp_path / "train" / "labels"
+    images.mkdir(parents=True)
+    labels.mkdir(parents=True)
+    (images / "IMG_0001.JPG").write_bytes(b"")
+    (images / "scan.PNG").write_bytes(b"")
+    (labels / "IMG_0001.txt").write_text("", encoding="utf-8")
+    assert sorted(get_sample_image_paths(tmp_path, 6)) == [
+        images / "IMG_0001.JPG",
+        images / "scan.PNG",
+    ]
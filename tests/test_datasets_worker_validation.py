@@ -46,3 +46,67 @@ def test_augment_rejects_empty_output_path(tmp_path: Path) -> None:
 
     with pytest.raises(ValueError, match="Укажите папку для нового датасета"):
         worker._run_augment()
+
+
+def test_queued_tasks_reuse_one_thread(tmp_path: Path) -> None:
+    from PySide6.QtCore import QCoreApplication, QThread
+
+    mod = _load_worker_module()
+    app = QCoreApplication.instance() or QCoreApplication([])
+    worker = mod.DatasetWorker()
+    thread = QThread()
+    worker.moveToThread(thread)
+    results: list[tuple[bool, str]] = []
+    worker.finished.connect(lambda ok, msg: results.append((ok, msg)))
+    thread.start()
+    try:
+        missing = str(tmp_path / "missing")
+        worker.task_requested.emit("augment", {"src": missing, "out": "", "opts": {}})
+        worker.task_requested.emit("no_such_task", {})
+        for _ in range(200):
+            if len(results) == 2:
+                break
+            app.processEvents()
+            QThread.msleep(10)
+        assert thread.isRunning()
+    finally:
+        thread.quit()
+        thread.wait()
+    assert results == [
+        (False, "Укажите исходный датасет."),
+        (False, "Неизвестная задача: no_such_task"),
+    ]
+
+
+def test_augment_skipped_when_inputs_unchanged(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    mod = _load_worker_module()
+    src = tmp_path / "src"
+    out = tmp_path / "out"
+    src.mkdir()
+    (src / "a.jpg").write_bytes(b"1")
+    calls: list[Path] = []
+
+    def fake_augment(s: Path, o: Path, _opts: dict) -> None:
+        calls.append(s)
+        o.mkdir(exist_ok=True)
+        (o / "a.jpg").write_bytes(b"2")
+
+    monkeypatch.setattr(mod, "create_augmented_dataset", fake_augment)
+    worker = mod.DatasetWorker()
+    results: list[tuple[bool, str]] = []
+    worker.finished.connect(lambda ok, msg: results.append((ok, msg)))
+
+    def run() -> None:
+        worker.set_task("augment", {"src": str(src), "out": str(out), "opts": {"blur": True}})
+        worker.run()
+
+    run()
+    run()
+    assert len(calls) == 1
+    assert results[1][0] is True and "пропущено" in results[1][1]
+
+    (src / "b.jpg").write_bytes(b"3")
+    run()
+    assert len(calls) == 2
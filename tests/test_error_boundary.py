@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import logging
+import sys
+import threading
+
+import pytest
+
+from app.ui.infrastructure import error_boundary
+
+
+class _Notifications:
+    def __init__(self) -> None:
+        self.errors: list[str] = []
+
+    def error(self, message: str) -> None:
+        self.errors.append(message)
+
+
+@pytest.fixture
+def restore_hooks():
+    saved = sys.excepthook, threading.excepthook
+    yield
+    sys.excepthook, threading.excepthook = saved
+
+
+def _raise() -> tuple:
+    try:
+        raise ValueError("boom")
+    except ValueError:
+        return sys.exc_info()
+
+
+def test_handler_logs_with_exc_info_and_notifies(restore_hooks, caplog, monkeypatch) -> None:
+    default_calls: list[object] = []
+    monkeypatch.setattr(sys, "__excepthook__", lambda *a: default_calls.append(a))
+    monkeypatch.setattr(error_boundary, "_root_logs_to_console", lambda: True)
+    notifications = _Notifications()
+    error_boundary.install_error_boundary(notifications)
+
+    with caplog.at_level(logging.ERROR, logger=error_boundary.__name__):
+        sys.excepthook(*_raise())
+
+    assert caplog.records[-1].exc_info is not None
+    assert len(notifications.errors) == 1
+    assert default_calls == []  # console handler already printed it
+
+
+def test_default_hook_used_without_console_handler(restore_hooks, monkeypatch) -> None:
+    default_calls: list[object] = []
+    monkeypatch.setattr(sys, "__excepthook__", lambda *a: default_calls.append(a))
+    monkeypatch.setattr(error_boundary, "_root_logs_to_console", lambda: False)
+    error_boundary.install_error_boundary(None)
+
+    sys.excepthook(*_raise())
+
+    assert len(default_calls) == 1
+
+
+def test_thread_hook_routes_to_handler(restore_hooks, monkeypatch) -> None:
+    monkeypatch.setattr(error_boundary, "_root_logs_to_console", lambda: True)
+    notifications = _Notifications()
+    error_boundary.install_error_boundary(notifications)
+
+    worker = threading.Thread(target=lambda: 1 / 0)
+    worker.start()
+    worker.join()
+
+    assert len(notifications.errors) == 1
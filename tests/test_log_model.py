@@ -0,0 +1,100 @@
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("PySide6.QtCore", reason="PySide6 QtCore is required", exc_type=ImportError)
+
+from app.ui.components import log_model
+from app.ui.components.log_model import LOG_LEVEL_INFO, LogListModel
+
+
+def test_append_batch_overflow_removes_then_inserts_without_reset(monkeypatch) -> None:
+    monkeypatch.setattr(log_model, "MAX_LOG_LINES", 5)
+    model = LogListModel()
+    model.append_batch([(f"a{i}", None) for i in range(4)])
+
+    events: list[tuple[str, int, int]] = []
+    model.rowsRemoved.connect(lambda _p, first, last: events.append(("removed", first, last)))
+    model.rowsInserted.connect(lambda _p, first, last: events.append(("inserted", first, last)))
+    model.modelReset.connect(lambda: events.append(("reset", -1, -1)))
+
+    model.append_batch([(f"b{i}", None) for i in range(3)])
+
+    assert events == [("removed", 0, 1), ("inserted", 2, 4)]
+    assert model.rowCount() == 5
+    texts = [model.data(model.index(r, 0)) for r in range(model.rowCount())]
+    assert texts == ["a2", "a3", "b0", "b1", "b2"]
+
+
+def test_append_batch_larger_than_buffer_keeps_newest() -> None:
+    model = LogListModel()
+    maxlen = model._entries.maxlen
+    assert maxlen is not None
+    model.append_batch([("old", None)])
+    model.append_batch([(str(i), LOG_LEVEL_INFO) for i in range(maxlen + 3)])
+
+    assert model.rowCount() == maxlen
+    assert model.data(model.index(0, 0)) == "3"
+    assert model.data(model.index(maxlen - 1, 0)) == str(maxlen + 2)
+
+
+@pytest.mark.parametrize(
+    "line,expected",
+    [
+        ("Epoch 1/10 done", log_model.LOG_LEVEL_INFO),
+        ("UserWarning: deprecated", log_model.LOG_LEVEL_WARNING),
+        ("WARN: low disk", log_model.LOG_LEVEL_WARNING),
+        ("Traceback (most recent call last):", log_model.LOG_LEVEL_ERROR),
+        ("warning then RuntimeError", log_model.LOG_LEVEL_ERROR),
+    ],
+)
+def test_infer_level(line: str, expected: str) -> None:
+    assert log_model._infer_level(line) == expected
+
+
+def test_level_at_tracks_entries_after_overflow(monkeypatch) -> None:
+    monkeypatch.setattr(log_model, "MAX_LOG_LINES", 3)
+    model = LogListModel()
+    model.append_line("ok")
+    model.append_batch([("WARN disk", None), ("fatal error", None)])
+    model.append_line("ok again")
+
+    assert [model.level_at(r) for r in range(model.rowCount())] == [
+        log_model.LOG_LEVEL_WARNING,
+        log_model.LOG_LEVEL_ERROR,
+        log_model.LOG_LEVEL_INFO,
+    ]
+    assert model.level_at(99) == log_model.LOG_LEVEL_INFO
+    model.clear()
+    assert model.level_at(0) == log_model.LOG_LEVEL_INFO
+
+
+def test_filter_proxy_matches_level_codes() -> None:
+    from app.ui.components.log_view import FILTER_ALL, LogFilterProxy
+
+    model = LogListModel()
+    model.append_batch([("a", None), ("b warning", None), ("c error", None), ("d", None)])
+    proxy = LogFilterProxy()
+    proxy.setSourceModel(model)
+
+    proxy.set_filter_level(log_model.LOG_LEVEL_INFO)
+    assert [proxy.data(proxy.index(r, 0)) for r in range(proxy.rowCount())] == ["a", "d"]
+    proxy.set_filter_level(log_model.LOG_LEVEL_ERROR)
+    assert proxy.rowCount() == 1
+    proxy.set_filter_level(FILTER_ALL)
+    assert proxy.rowCount() == 4
+
+
+def test_log_view_uses_source_model_when_filter_is_all() -> None:
+    QtWidgets = pytest.importorskip("PySide6.QtWidgets", exc_type=ImportError)
+    from app.ui.components.log_view import FILTER_ALL, FILTER_ERROR, LogView
+
+    _app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    view = LogView()
+    assert view._list.model() is view._model
+
+    view._filter_combo.setCurrentText(FILTER_ERROR)
+    assert view._list.model() is view._proxy
+
+    view._filter_combo.setCurrentText(FILTER_ALL)
+    assert view._list.model() is view._model
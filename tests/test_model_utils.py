@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import os
+import sys
+import threading
+import types
+
+import pytest
+
+pytest.importorskip(
+    "PySide6.QtWidgets", reason="PySide6 QtWidgets is required", exc_type=ImportError
+)
+
+from app.ui.components.model_utils import ModelCache, names_array
+
+
+def test_model_cache_reuses_model_until_weights_change(tmp_path, monkeypatch) -> None:
+    loads: list[str] = []
+    fake = types.ModuleType("ultralytics")
+    fake.YOLO = lambda path: loads.append(path) or object()  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "ultralytics", fake)
+    weights = tmp_path / "w.pt"
+    weights.write_bytes(b"1")
+    cache = ModelCache()
+
+    first = cache.get(str(weights))
+    assert cache.get(str(weights)) is first
+    assert loads == [str(weights)]
+
+    st = weights.stat()
+    os.utime(weights, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000))
+    assert cache.get(str(weights)) is not first
+    assert len(loads) == 2
+    assert len(cache._models) == 1
+
+
+def test_model_cache_load_does_not_block_other_paths(tmp_path, monkeypatch) -> None:
+    slow, fast = tmp_path / "slow.pt", tmp_path / "fast.pt"
+    slow.write_bytes(b"1")
+    fast.write_bytes(b"2")
+    started, release = threading.Event(), threading.Event()
+
+    def load(path: str) -> object:
+        if path == str(slow):
+            started.set()
+            assert release.wait(5)
+        return object()
+
+    fake = types.ModuleType("ultralytics")
+    fake.YOLO = load  # type: ignore[attr-defined]
+    monkeypatch.setitem(sys.modules, "ultralytics", fake)
+    cache = ModelCache()
+    loader = threading.Thread(target=cache.get, args=(str(slow),))
+    loader.start()
+    try:
+        assert started.wait(5)
+        assert cache.get(str(fast)) is not None
+    finally:
+        release.set()
+        loader.join(5)
+    assert len(cache._models) == 2
+
+
+def test_names_array_gathers_names_and_is_built_once_per_model() -> None:
+    class _Model:
+        reads = 0
+
+        @property
+        def names(self):
+            _Model.reads += 1
+            return {0: "cat", 1: "dog", 2: "bird"}
+
+    model = _Model()
+    assert names_array(model)[[2, 0]].tolist() == ["bird", "cat"]
+    assert names_array(model) is names_array(model)
+    assert _Model.reads == 1
+
+
+def test_prefetch_images_decodes_batches_in_order(tmp_path) -> None:
+    cv2 = pytest.importorskip("cv2")
+    import numpy as np
+
+    from app.ui.components.model_utils import prefetch_images
+
+    paths = []
+    for i in range(5):
+        p = tmp_path / f"{i}.png"
+        cv2.imwrite(str(p), np.full((4, 6, 3), i, dtype=np.uint8))
+        paths.append(str(p))
+    broken = tmp_path / "broken.jpg"
+    broken.write_bytes(b"not an image")
+
+    batches = list(prefetch_images([paths[:2], paths[2:4], [paths[4], str(broken)]], depth=2))
+
+    assert [len(b) for b in batches] == [2, 2, 2]
+    assert [int(img[0, 0, 0]) for img in batches[0] + batches[1]] == [0, 1, 2, 3]
+    assert batches[2][0].shape == (4, 6, 3)
+    assert batches[2][1] == str(broken)
@@ -0,0 +1,98 @@
+from __future__ import annotations
+
+import pytest
+
+from app.ui.infrastructure.notifications import NotificationCenter
+
+
+class _StatusBar:
+    def __init__(self) -> None:
+        self.messages: list[tuple[str, int]] = []
+
+    def showMessage(self, text: str, ms: int) -> None:  # noqa: N802
+        self.messages.append((text, ms))
+
+
+class _Window:
+    def __init__(self) -> None:
+        self.bar = _StatusBar()
+        self.lookups = 0
+
+    def statusBar(self) -> _StatusBar:  # noqa: N802
+        self.lookups += 1
+        return self.bar
+
+
+def test_status_bar_is_resolved_once() -> None:
+    window = _Window()
+    center = NotificationCenter(window)
+
+    for text in ("a", "b", "c"):
+        center.info(text)
+        center._flush_status()
+
+    assert window.lookups == 1
+    assert [text for text, _ in window.bar.messages] == ["a", "b", "c"]
+
+
+def test_status_messages_coalesce_to_latest() -> None:
+    window = _Window()
+    center = NotificationCenter(window)
+
+    center.info("a")
+    center.warning("Title", "b")
+    center.success("c")
+    center._flush_status()
+    center._flush_status()
+
+    assert [text for text, _ in window.bar.messages] == ["c"]
+
+
+def test_error_status_is_shown_immediately() -> None:
+    window = _Window()
+    center = NotificationCenter(window)
+
+    center.info("queued")
+    center.error("boom")
+    center._flush_status()
+
+    assert [text for text, _ in window.bar.messages] == ["boom"]
+
+
+def test_status_without_status_bar_is_noop() -> None:
+    center = NotificationCenter(object())
+    center.info("ignored")
+
+
+def test_errors_are_coalesced_into_one_modeless_box() -> None:
+    QtWidgets = pytest.importorskip(
+        "PySide6.QtWidgets", reason="PySide6 QtWidgets is required", exc_type=ImportError
+    )
+    from PySide6.QtCore import QEventLoop, QTimer
+
+    from app.ui.infrastructure import notifications
+
+    _app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    window = QtWidgets.QMainWindow()
+    center = NotificationCenter(window)
+
+    center.error("first")
+    center.error("Title", "second")
+    loop = QEventLoop()
+    QTimer.singleShot(notifications.ERROR_COALESCE_MS + 100, loop.quit)
+    loop.exec()
+
+    box = center._error_box
+    assert box is not None
+    assert box.text() == "first\n\nTitle: second"
+    assert not box.isModal()
+    box.close()
+
+
+def test_notify_aliases_match_level_methods() -> None:
+    window = _Window()
+    center = NotificationCenter(window)
+    center.notify_info("legacy")
+    center._flush_status()
+    assert window.bar.messages[-1][0] == "legacy"
+    assert NotificationCenter.notify_warning is NotificationCenter.warning
@@ -0,0 +1,35 @@
+from __future__ import annotations
+
+import pytest
+
+pytest.importorskip("PySide6.QtCore", reason="PySide6 QtCore is required", exc_type=ImportError)
+
+from PySide6.QtCore import Qt
+
+from app.ui.components.rows_model import RowsTableModel
+
+
+def test_rows_are_served_from_the_list_with_float_format() -> None:
+    model = RowsTableModel(["name", "conf"], "{:.2f}")
+    rows = [["a.jpg", 0.123], ["b.jpg", 3]]
+    model.set_rows(rows)
+
+    assert model.rowCount() == 2
+    assert model.columnCount() == 2
+    assert model.data(model.index(0, 1)) == "0.12"
+    assert model.data(model.index(1, 1)) == "3"
+    assert model.headerData(1, Qt.Orientation.Horizontal) == "conf"
+
+
+def test_set_rows_resets_once_and_clears_backgrounds() -> None:
+    model = RowsTableModel(["fmt", "fps"])
+    model.set_rows([["pt", 10.0]])
+    model.set_cell_backgrounds({(0, 1): "green"})
+    assert model.data(model.index(0, 1), Qt.ItemDataRole.BackgroundRole) == "green"
+
+    resets: list[int] = []
+    model.modelReset.connect(lambda: resets.append(1))
+    model.set_rows([["onnx", 5.0], ["pt", 9.0]])
+
+    assert resets == [1]
+    assert model.data(model.index(0, 1), Qt.ItemDataRole.BackgroundRole) is None
@@ -78,3 +78,23 @@ def test_error_widget_has_actions() -> None:
     buttons = [b.text() for b in stack.currentWidget().findChildren(QPushButton)]
     assert "Copy traceback" in buttons
     assert "Open logs folder" in buttons
+
+
+def test_stack_controller_defers_placeholders_until_needed() -> None:
+    QApplication, QLabel, QStackedWidget = _import_qtwidgets_or_skip()
+
+    from app.ui.shell.stack_controller import TAB_IDS, StackController
+
+    app = QApplication.instance() or QApplication([])
+    stack = QStackedWidget()
+
+    controller = StackController(stack)
+    assert stack.count() == 1
+
+    controller.switch_to("jobs")
+    assert stack.count() == len(TAB_IDS)
+    assert stack.currentIndex() == TAB_IDS.index("jobs")
+
+    app.processEvents()
+    assert stack.count() == len(TAB_IDS)
+    assert stack.currentIndex() == TAB_IDS.index("jobs")
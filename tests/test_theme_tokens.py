@@ -0,0 +1,51 @@
+from __future__ import annotations
+
+from app.ui.theme import tokens
+from app.ui.theme.tokens import DARK, LIGHT, apply_token_set, cached_style
+
+
+def test_cached_style_is_rebuilt_after_theme_switch() -> None:
+    calls: list[str] = []
+
+    def _build(t: tokens.TokenSet) -> str:
+        calls.append(t.surface)
+        return f"QWidget {{ background: {t.surface}; }}"
+
+    try:
+        apply_token_set(DARK)
+        first = cached_style("test.widget", _build)
+        assert cached_style("test.widget", _build) is first
+        assert calls == [DARK.surface]
+
+        apply_token_set(LIGHT)
+        assert LIGHT.surface in cached_style("test.widget", _build)
+        assert calls == [DARK.surface, LIGHT.surface]
+    finally:
+        apply_token_set(DARK)
+
+
+def test_application_stylesheet_is_memoized_per_token_values() -> None:
+    from app.ui.theme.manager import _stylesheet_for
+
+    dark = _stylesheet_for(DARK)
+    assert _stylesheet_for(DARK) is dark
+    assert _stylesheet_for(LIGHT) is not dark
+    assert LIGHT.background_main in _stylesheet_for(LIGHT)
+
+
+def test_copy_into_copies_every_slot() -> None:
+    target = tokens.TokenSet(surface="#000000", radius_lg=0)
+    LIGHT.copy_into(target)
+    for key in tokens.TokenSet.__slots__:
+        assert getattr(target, key) == getattr(LIGHT, key)
+
+
+def test_reapplying_active_token_set_keeps_cache() -> None:
+    try:
+        apply_token_set(LIGHT)
+        sheet = cached_style("test.reapply", lambda t: t.surface)
+        apply_token_set(LIGHT)
+        assert tokens.active_token_set() is LIGHT
+        assert cached_style("test.reapply", lambda t: "rebuilt") is sheet
+    finally:
+        apply_token_set(DARK)
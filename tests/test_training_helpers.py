@@ -10,12 +10,12 @@ class TestScanTrainedWeights:
 
     def test_empty_dir_returns_empty_list(self, tmp_path: Path) -> None:
         result = scan_trained_weights(tmp_path)
-        assert result == []
+        assert result == ()
 
     def test_no_runs_dir_returns_empty(self, tmp_path: Path) -> None:
         (tmp_path / "other").mkdir()
         result = scan_trained_weights(tmp_path)
-        assert result == []
+        assert result == ()
 
     def test_finds_best_pt(self, tmp_path: Path) -> None:
         (tmp_path / "runs" / "train" / "exp1" / "weights").mkdir(parents=True)
@@ -40,4 +40,13 @@ class TestScanTrainedWeights:
     def test_ignores_dir_without_best_pt(self, tmp_path: Path) -> None:
         (tmp_path / "runs" / "train" / "no_weights").mkdir(parents=True)
         result = scan_trained_weights(tmp_path)
-        assert result == []
+        assert result == ()
+
+    def test_picks_up_best_pt_written_into_existing_run(self, tmp_path: Path) -> None:
+        weights = tmp_path / "runs" / "train" / "exp1" / "weights"
+        weights.mkdir(parents=True)
+        assert scan_trained_weights(tmp_path) == ()
+        (weights / "best.pt").write_bytes(b"x")
+        result = scan_trained_weights(tmp_path)
+        assert len(result) == 1
+        assert result[0][1].name == "best.pt"